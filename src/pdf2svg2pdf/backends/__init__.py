@@ -2,15 +2,24 @@
 # this_file: src/pdf2svg2pdf/backends/__init__.py
 """Backend implementations for pdf2svg2pdf."""
 
-from .base import Backend, BackendRegistry
+from .base import Backend, BackendRegistry, PageWriter
 from .cairo import CairoBackend
 from .fitz import FitzBackend
+from .inkscape import InkscapeBackend
+from .mutool import MutoolBackend
 from .poppler import PopplerBackend
+from .qpdf import QpdfBackend
+from .rsvg import RsvgBackend
 
 __all__ = [
     "Backend",
     "BackendRegistry",
+    "PageWriter",
     "PopplerBackend",
     "FitzBackend",
     "CairoBackend",
+    "MutoolBackend",
+    "RsvgBackend",
+    "QpdfBackend",
+    "InkscapeBackend",
 ]
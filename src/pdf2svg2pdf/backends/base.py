@@ -4,9 +4,12 @@
 
 from __future__ import annotations
 
-import shutil
+import asyncio
+import contextlib
+import json
 import subprocess
 from abc import ABC, abstractmethod
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -14,14 +17,54 @@ from loguru import logger
 
 from ..core.exceptions import BackendError, DependencyError
 from ..types import BackendCapability, BackendName, PathLike
+from ..utils.commands import run_command
+from ..utils.tools import tools
+from ..utils.workers import WorkerPool
 
 if TYPE_CHECKING:
     from ..config import Configuration
 
+# Seconds between checks for the next page of a running split
+_SPLIT_POLL_SECONDS = 0.02
+
+
+class PageWriter(ABC):
+    """Output PDF that finished pages are appended to one at a time."""
+
+    @abstractmethod
+    def append(self, page: Path | bytes, key: str | None = None) -> None:
+        """Append a page after the pages already written.
+
+        Args:
+            page: One-page PDF file or content
+            key: Identifies identical pages; a key seen before reuses the
+                page already written instead of embedding another copy
+        """
+        ...
+
+    @abstractmethod
+    def flush(self) -> None:
+        """Write the pages appended so far to the output path."""
+        ...
+
+    @abstractmethod
+    def finish(self) -> None:
+        """Write the complete output and release it."""
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        """Release the output without finishing it."""
+        ...
+
 
 class Backend(ABC):
     """Abstract base class for all backends."""
 
+    # Whether worker threads may run the backend's library calls at once;
+    # False runs them one at a time when worker processes are off
+    threadsafe_workers = True
+
     def __init__(self, config: Configuration | None = None) -> None:
         """Initialize backend with configuration.
 
@@ -30,6 +73,8 @@ class Backend(ABC):
         """
         self.config = config
         self._available: bool | None = None
+        self._version: str | None = None
+        self._workers: WorkerPool | None = None
 
     @property
     @abstractmethod
@@ -49,6 +94,53 @@ class Backend(ABC):
         """List of required system commands."""
         ...
 
+    @property
+    def parameters(self) -> dict[str, Any]:
+        """Backend-specific parameters from the configuration."""
+        if self.config:
+            for backend_config in self.config.backends:
+                if backend_config.name == self.name and backend_config.parameters:
+                    return backend_config.parameters
+        return {}
+
+    @property
+    def timeout_seconds(self) -> float:
+        """Default time limit for one backend operation."""
+        return self.config.processing.timeout_seconds if self.config else 300
+
+    @property
+    def worker_count(self) -> int:
+        """Number of long-lived processes, from ``workers`` or parallel_pages."""
+        return int(
+            self.parameters.get("workers")
+            or (self.config.processing.parallel_pages if self.config else 4)
+        )
+
+    @property
+    def version(self) -> str:
+        """Version of the underlying tool, as recorded by tool discovery."""
+        if self._version is None:
+            main = self.required_commands[0] if self.required_commands else None
+            self._version = (tools.version(main) if main else None) or "unknown"
+        return self._version
+
+    @property
+    def identity(self) -> str:
+        """Backend name, tool version and parameters, used to key cached results."""
+        identity = f"{self.name}:{self.version}"
+        if self.parameters:
+            identity += ":" + json.dumps(self.parameters, sort_keys=True, default=str)
+        return identity
+
+    @property
+    def prefers_source_document(self) -> bool:
+        """Whether pdf_to_svg should read pages from the unsplit input.
+
+        Backends that keep documents open render faster from the source PDF
+        than from per-page files written by the split step.
+        """
+        return False
+
     def is_available(self) -> bool:
         """Check if backend is available on the system.
 
@@ -56,13 +148,11 @@ class Backend(ABC):
             True if all required commands are available
         """
         if self._available is None:
-            self._available = all(
-                shutil.which(cmd) is not None for cmd in self.required_commands
-            )
-            if not self._available:
-                missing = [
-                    cmd for cmd in self.required_commands if shutil.which(cmd) is None
-                ]
+            missing = [
+                cmd for cmd in self.required_commands if not tools.available(cmd)
+            ]
+            self._available = not missing
+            if missing:
                 logger.warning(
                     f"Backend {self.name} is not available. "
                     f"Missing commands: {', '.join(missing)}"
@@ -78,36 +168,101 @@ class Backend(ABC):
         if not self.is_available():
             return False, f"Backend {self.name} is not available"
 
-        # Try to run a simple command to verify the backend works
-        try:
-            for cmd in self.required_commands:
-                result = subprocess.run(
-                    [cmd, "--version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=5,
-                )
-                if result.returncode != 0:
-                    return False, f"Command {cmd} failed: {result.stderr}"
+        # Tool discovery already ran every required command once
+        for cmd in self.required_commands:
+            info = tools.get(cmd)
+            if not info.healthy:
+                return False, f"Command {cmd} failed to report its version"
+
+        return True, f"Backend {self.name} is healthy"
+
+    def _worker_pool(
+        self,
+        initializer: Callable[[], None] | None = None,
+    ) -> WorkerPool:
+        """Get the backend's workers, created on first use.
+
+        Workers are threads unless ``processing.engine`` is ``processes``.
+
+        Args:
+            initializer: Warm-up function run once in every worker
+
+        Returns:
+            Worker pool sized by ``worker_count``
+        """
+        if self._workers is None:
+            self._workers = WorkerPool(
+                self.worker_count,
+                initializer,
+                name=self.name,
+                processes=(
+                    self.config is not None
+                    and self.config.processing.engine == "processes"
+                ),
+                threadsafe=self.threadsafe_workers,
+            )
+        return self._workers
+
+    async def _run_in_worker(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        operation: str,
+        initializer: Callable[[], None] | None = None,
+    ) -> Any:
+        """Run a library call in a worker with command semantics.
 
-            return True, f"Backend {self.name} is healthy"
+        Timeouts and failures are reported like those of ``_run_command``.
+
+        Args:
+            func: Module-level function to call
+            *args: Picklable arguments
+            operation: Description of the call for error messages
+            initializer: Warm-up function for newly started workers
+
+        Returns:
+            Function result
+
+        Raises:
+            BackendError: If the call fails or exceeds the backend timeout
+        """
+        timeout = self.timeout_seconds
+        try:
+            return await self._worker_pool(initializer).run(
+                func, *args, timeout=timeout
+            )
+        except TimeoutError as e:
+            raise BackendError(
+                f"Command timed out after {timeout} seconds",
+                backend_name=self.name,
+                operation=operation,
+            ) from e
         except Exception as e:
-            return False, f"Health check failed: {e}"
+            raise BackendError(
+                f"Failed to run command: {e}",
+                backend_name=self.name,
+                operation=operation,
+            ) from e
 
-    def _run_command(
+    async def _run_command(
         self,
         command: list[str],
         timeout: float | None = None,
         check: bool = True,
-        **kwargs: Any,
+        input: str | bytes | None = None,
+        progress: Callable[[bytes], None] | None = None,
     ) -> subprocess.CompletedProcess[str]:
         """Run a command with error handling.
 
+        The command runs on the event loop; on timeout or cancellation its
+        whole process group is killed.
+
         Args:
             command: Command and arguments
             timeout: Optional timeout in seconds
             check: Whether to check return code
-            **kwargs: Additional arguments for subprocess.run
+            input: Data written to the command's stdin
+            progress: Called with each chunk of the command's stderr
 
         Returns:
             Completed process
@@ -115,35 +270,13 @@ class Backend(ABC):
         Raises:
             BackendError: If command fails
         """
+        timeout = timeout or self.timeout_seconds
+        logger.debug(f"Running command: {' '.join(command)}")
         try:
-            logger.debug(f"Running command: {' '.join(command)}")
-            result = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                timeout=timeout or self.config.processing.timeout_seconds
-                if self.config
-                else 300,
-                check=False,
-                **kwargs,
-            )
-
-            if check and result.returncode != 0:
-                raise BackendError(
-                    f"Command failed with exit code {result.returncode}",
-                    backend_name=self.name,
-                    operation=" ".join(command),
-                    details={
-                        "stdout": result.stdout,
-                        "stderr": result.stderr,
-                        "returncode": result.returncode,
-                    },
-                )
-
-            return result
-        except subprocess.TimeoutExpired as e:
+            result = await run_command(command, timeout, input=input, progress=progress)
+        except TimeoutError as e:
             raise BackendError(
-                f"Command timed out after {e.timeout} seconds",
+                f"Command timed out after {timeout} seconds",
                 backend_name=self.name,
                 operation=" ".join(command),
             ) from e
@@ -154,6 +287,20 @@ class Backend(ABC):
                 operation=" ".join(command),
             ) from e
 
+        if check and result.returncode != 0:
+            raise BackendError(
+                f"Command failed with exit code {result.returncode}",
+                backend_name=self.name,
+                operation=" ".join(command),
+                details={
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                    "returncode": result.returncode,
+                },
+            )
+
+        return result
+
     @abstractmethod
     async def split_pdf(
         self,
@@ -173,6 +320,73 @@ class Backend(ABC):
         """
         ...
 
+    async def split_pages(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> AsyncGenerator[Path, None]:
+        """Split PDF into individual pages, yielding each once it is written.
+
+        The default waits for ``split_pdf`` to finish. Backends that write
+        pages one after another override this so conversion can start on the
+        first page while the rest are still being split.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Yields:
+            Paths to individual page PDFs in page order
+        """
+        for page_path in await self.split_pdf(input_path, output_dir, prefix):
+            yield page_path
+
+    async def _follow_split(
+        self,
+        split: Awaitable[Any],
+        page_paths: list[Path],
+    ) -> AsyncGenerator[Path, None]:
+        """Yield the pages of a running split as the tool finishes them.
+
+        The tool writes pages in order, so a page is complete once the next
+        one appears or the split exits. Closing the iterator early stops the
+        tool.
+
+        Args:
+            split: Split writing ``page_paths`` in order
+            page_paths: Page files the split will write
+
+        Yields:
+            Each page path once its file is complete
+
+        Raises:
+            BackendError: If the split exits without writing a page
+        """
+        task = asyncio.ensure_future(split)
+        try:
+            for index, page_path in enumerate(page_paths):
+                following = page_paths[index + 1 : index + 2]
+                while not task.done() and not (following and following[0].exists()):
+                    await asyncio.sleep(_SPLIT_POLL_SECONDS)
+                if task.done():
+                    # Raises if the split failed
+                    task.result()
+                if not page_path.exists():
+                    raise BackendError(
+                        f"Split did not write page {index}",
+                        backend_name=self.name,
+                        operation="split_pages",
+                        details={"path": str(page_path)},
+                    )
+                yield page_path
+        finally:
+            # Stops an unfinished split; a failure already raised above
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
     @abstractmethod
     async def merge_pdfs(
         self,
@@ -195,12 +409,14 @@ class Backend(ABC):
         self,
         input_path: PathLike,
         output_path: PathLike,
+        page_index: int = 0,
     ) -> Path:
-        """Convert PDF to SVG.
+        """Convert one page of a PDF to SVG.
 
         Args:
             input_path: Path to input PDF
             output_path: Path for output SVG
+            page_index: Zero-based page to convert
 
         Returns:
             Path to output SVG
@@ -224,6 +440,53 @@ class Backend(ABC):
         """
         ...
 
+    async def svgs_to_pdf(
+        self,
+        input_paths: list[PathLike],
+        output_path: PathLike,
+    ) -> Path:
+        """Render SVGs into one PDF with a page per SVG.
+
+        Only backends with the SVG_TO_PDF_MERGE capability implement this.
+
+        Args:
+            input_paths: SVG paths in page order
+            output_path: Path for the output PDF
+
+        Returns:
+            Path to output PDF
+        """
+        raise NotImplementedError(
+            f"{self.name} backend does not support rendering SVGs into one PDF"
+        )
+
+    def open_merge(self, output_path: PathLike) -> PageWriter:
+        """Start an output PDF that pages are appended to as they finish.
+
+        Only backends with the INCREMENTAL_MERGE capability implement this.
+
+        Args:
+            output_path: Path for the output PDF
+
+        Returns:
+            Writer for the output
+        """
+        raise NotImplementedError(
+            f"{self.name} backend does not support merging pages incrementally"
+        )
+
+    async def release(self, directory: PathLike) -> None:
+        """Stop work the backend started for outputs under a directory.
+
+        Converters call this when a conversion ends, before its temporary
+        directory is removed, so nothing it started outlives it.
+
+        Args:
+            directory: The conversion's temporary directory
+        """
+        # Most backends start nothing that outlives the call that started it
+        return
+
 
 class BackendRegistry:
     """Registry for backend implementations."""
@@ -231,7 +494,8 @@ class BackendRegistry:
     def __init__(self) -> None:
         """Initialize empty registry."""
         self._backends: dict[BackendName, type[Backend]] = {}
-        self._instances: dict[BackendName, Backend] = {}
+        # Keyed by name and the settings the instance was configured with
+        self._instances: dict[tuple[BackendName, str], Backend] = {}
 
     def register(self, backend_class: type[Backend]) -> None:
         """Register a backend class.
@@ -239,11 +503,45 @@ class BackendRegistry:
         Args:
             backend_class: Backend class to register
         """
+        # Converters register the built-in backends on every construction
+        if backend_class in self._backends.values():
+            return
+
         instance = backend_class()
         name = instance.name
         self._backends[name] = backend_class
         logger.debug(f"Registered backend: {name}")
 
+    @staticmethod
+    def _settings(name: BackendName, config: Configuration | None) -> str:
+        """Summarize the configuration settings a backend instance reads.
+
+        Args:
+            name: Backend name
+            config: Optional configuration
+
+        Returns:
+            Key that differs whenever the backend's parameters, timeout,
+            worker count or worker kind would
+        """
+        if config is None:
+            return ""
+        parameters = next(
+            (b.parameters for b in config.backends if b.name == name and b.parameters),
+            {},
+        )
+        processing = config.processing
+        return json.dumps(
+            [
+                parameters,
+                processing.timeout_seconds,
+                processing.parallel_pages,
+                processing.engine,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
     def get(
         self,
         name: BackendName,
@@ -251,12 +549,15 @@ class BackendRegistry:
     ) -> Backend:
         """Get a backend instance.
 
+        Instances are shared between configurations that give the backend
+        the same settings, so worker processes and sessions are reused.
+
         Args:
             name: Backend name
             config: Optional configuration
 
         Returns:
-            Backend instance
+            Backend instance configured by ``config``
 
         Raises:
             BackendError: If backend not found
@@ -268,11 +569,11 @@ class BackendRegistry:
                 details={"available": list(self._backends.keys())},
             )
 
-        # Create instance if needed
-        if name not in self._instances:
-            self._instances[name] = self._backends[name](config)
+        key = (name, self._settings(name, config))
+        if key not in self._instances:
+            self._instances[key] = self._backends[name](config)
 
-        return self._instances[name]
+        return self._instances[key]
 
     def get_available(
         self,
@@ -286,11 +587,14 @@ class BackendRegistry:
             config: Optional configuration
 
         Returns:
-            List of available backend instances
+            List of available backend instances, leaving out those the
+            configuration disables
         """
         backends = []
 
         for name in self._backends:
+            if not self.enabled(name, config):
+                continue
             try:
                 backend = self.get(name, config)
                 if backend.is_available() and (
@@ -329,17 +633,48 @@ class BackendRegistry:
             )
 
         # Sort by priority if config provided
-        if config and config.backends:
-            priority_map = {
-                bc.name: bc.priority for bc in config.backends if bc.enabled
-            }
-            available.sort(
-                key=lambda b: priority_map.get(b.name, 0),
-                reverse=True,
-            )
+        available.sort(key=lambda b: self.priority(b, config), reverse=True)
 
         return available[0]
 
+    @staticmethod
+    def enabled(name: BackendName, config: Configuration | None = None) -> bool:
+        """Check that no backend entry disables a backend.
+
+        Args:
+            name: Backend name
+            config: Optional configuration
+
+        Returns:
+            False if the backend has an entry with ``enabled`` off
+        """
+        if config:
+            for backend_config in config.backends:
+                if backend_config.name == name and not backend_config.enabled:
+                    return False
+        return True
+
+    @staticmethod
+    def priority(backend: Backend, config: Configuration | None = None) -> int:
+        """Get a backend's configured priority.
+
+        Args:
+            backend: Backend instance
+            config: Optional configuration
+
+        Returns:
+            Priority from the enabled backend entry, 0 if it has none, or
+            the default priority if the configuration lists no backends
+        """
+        from ..config import DEFAULT_BACKEND_PRIORITIES
+
+        if config and config.backends:
+            for backend_config in config.backends:
+                if backend_config.name == backend.name and backend_config.enabled:
+                    return backend_config.priority
+            return 0
+        return DEFAULT_BACKEND_PRIORITIES.get(backend.name, 0)
+
 
 # Global registry instance
 registry = BackendRegistry()
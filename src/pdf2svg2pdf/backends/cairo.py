@@ -8,13 +8,53 @@ from pathlib import Path
 
 from loguru import logger
 
+from ..core.exceptions import BackendError
 from ..types import BackendCapability, BackendName, PathLike
-from ..utils.async_utils import run_async
 from .base import Backend
 
+# Renders text so the first real page does not pay for fontconfig set-up
+_WARM_UP_SVG = (
+    b'<svg xmlns="http://www.w3.org/2000/svg" width="10" height="10">'
+    b"<text y='8'>a</text></svg>"
+)
+
+_ENGINES = {"library", "cli"}
+
+
+def _warm_up() -> None:
+    """Import CairoSVG and initialize fonts once per worker."""
+    try:
+        import cairosvg
+
+        cairosvg.svg2pdf(bytestring=_WARM_UP_SVG)
+    except Exception:
+        # Let the first task report the problem instead of killing the worker.
+        pass
+
+
+def _render_pdf(source: bytes | str, output_path: str) -> None:
+    """Render an SVG to PDF with the CairoSVG library (runs in a worker).
+
+    Args:
+        source: SVG document as bytes, or the path of an SVG file
+        output_path: Path for the output PDF
+    """
+    import cairosvg
+
+    if isinstance(source, bytes):
+        cairosvg.svg2pdf(bytestring=source, write_to=output_path)
+    else:
+        cairosvg.svg2pdf(url=source, write_to=output_path)
+
 
 class CairoBackend(Backend):
-    """Backend using Cairo/CairoSVG."""
+    """Backend using Cairo/CairoSVG.
+
+    By default SVGs are rendered by the CairoSVG library in warm worker
+    threads, or worker processes when ``processing.engine`` is
+    ``processes``. Set the backend parameter ``engine`` to ``cli`` to run the
+    ``cairosvg`` executable per page instead.
+    """
 
     @property
     def name(self) -> BackendName:
@@ -24,15 +64,30 @@ class CairoBackend(Backend):
     @property
     def capabilities(self) -> set[BackendCapability]:
         """Set of supported capabilities."""
-        return {
-            BackendCapability.SVG_TO_PDF,
-        }
+        capabilities = {BackendCapability.SVG_TO_PDF}
+        if self.parameters.get("engine", "library") == "library":
+            capabilities.add(BackendCapability.BATCH_PROCESSING)
+        return capabilities
 
     @property
     def required_commands(self) -> list[str]:
         """List of required system commands."""
+        # The library engine needs no executable, but probing the CLI proves
+        # that CairoSVG and the cairo library load.
         return ["cairosvg"]
 
+    @property
+    def engine(self) -> str:
+        """How SVGs are rendered: ``library`` (default) or ``cli``."""
+        engine = self.parameters.get("engine", "library")
+        if engine not in _ENGINES:
+            raise BackendError(
+                f"Unknown CairoSVG engine: {engine}",
+                backend_name=self.name,
+                details={"engines": sorted(_ENGINES)},
+            )
+        return engine
+
     async def split_pdf(
         self,
         input_path: PathLike,
@@ -71,12 +126,14 @@ class CairoBackend(Backend):
         self,
         input_path: PathLike,
         output_path: PathLike,
+        page_index: int = 0,
     ) -> Path:
-        """Convert PDF to SVG.
+        """Convert one page of a PDF to SVG.
 
         Args:
             input_path: Path to input PDF
             output_path: Path for output SVG
+            page_index: Zero-based page to convert
 
         Returns:
             Path to output SVG
@@ -102,6 +159,11 @@ class CairoBackend(Backend):
         input_path = Path(input_path)
         output_path = Path(output_path)
 
+        if self.engine == "library":
+            await self.render(input_path, output_path)
+            logger.debug(f"Converted {input_path} to {output_path}")
+            return output_path
+
         # Run cairosvg
         command = [
             "cairosvg",
@@ -111,7 +173,33 @@ class CairoBackend(Backend):
             str(output_path),
             str(input_path),
         ]
-        await run_async(self._run_command, command)
+        await self._run_command(command)
 
         logger.debug(f"Converted {input_path} to {output_path}")
         return output_path
+
+    async def render(self, source: bytes | PathLike, output_path: PathLike) -> Path:
+        """Render an SVG to PDF in a warm CairoSVG worker.
+
+        Args:
+            source: SVG document as bytes, or the path of an SVG file
+            output_path: Path for the output PDF
+
+        Returns:
+            Path to output PDF
+
+        Raises:
+            BackendError: If rendering fails or exceeds the backend timeout
+        """
+        output_path = Path(output_path)
+        if not isinstance(source, bytes):
+            source = str(source)
+
+        await self._run_in_worker(
+            _render_pdf,
+            source,
+            str(output_path),
+            operation=f"cairosvg.svg2pdf -> {output_path}",
+            initializer=_warm_up,
+        )
+        return output_path
@@ -4,6 +4,9 @@
 
 from __future__ import annotations
 
+import os
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
 from pathlib import Path
 
 import fitz
@@ -11,11 +14,188 @@ from loguru import logger
 
 from ..types import BackendCapability, BackendName, PathLike
 from ..utils.async_utils import run_async
-from .base import Backend
+from .base import Backend, PageWriter
+
+# Documents each worker keeps open, least recently used first
+_MAX_OPEN_DOCUMENTS = 4
+_open_documents: OrderedDict[tuple[str, int], fitz.Document] = OrderedDict()
+
+
+def _open_document(path: str) -> fitz.Document:
+    """Open a PDF, reusing this process's handle while the file is unchanged.
+
+    Args:
+        path: PDF path
+
+    Returns:
+        Open document
+    """
+    key = (path, os.stat(path).st_mtime_ns)
+    doc = _open_documents.get(key)
+    if doc is not None:
+        _open_documents.move_to_end(key)
+        return doc
+
+    doc = fitz.open(path)
+    _open_documents[key] = doc
+    while len(_open_documents) > _MAX_OPEN_DOCUMENTS:
+        _, oldest = _open_documents.popitem(last=False)
+        oldest.close()
+    return doc
+
+
+def _page_svg(input_path: str, page_index: int, text_as_path: bool) -> str:
+    """Render one page to SVG text (runs in a worker).
+
+    Args:
+        input_path: PDF path
+        page_index: Zero-based page to render
+        text_as_path: Draw glyphs as paths instead of SVG text
+
+    Returns:
+        SVG document
+    """
+    page = _open_document(input_path)[page_index]
+    return page.get_svg_image(text_as_path=text_as_path)
+
+
+def _render_svg(
+    input_path: str,
+    output_path: str,
+    page_index: int,
+    text_as_path: bool,
+) -> None:
+    """Render one page to an SVG file (runs in a worker).
+
+    Args:
+        input_path: PDF path
+        output_path: Path for the output SVG
+        page_index: Zero-based page to render
+        text_as_path: Draw glyphs as paths instead of SVG text
+    """
+    svg = _page_svg(input_path, page_index, text_as_path)
+    Path(output_path).write_text(svg, encoding="utf-8")
+
+
+def _svg_to_pdf_bytes(svg: str | bytes) -> bytes:
+    """Convert an SVG document to a one-page PDF (runs in a worker).
+
+    Args:
+        svg: SVG document
+
+    Returns:
+        PDF content
+    """
+    if isinstance(svg, str):
+        svg = svg.encode("utf-8")
+    with fitz.open(stream=svg, filetype="svg") as doc:
+        return doc.convert_to_pdf()
+
+
+def _svg_file_to_pdf(input_path: str, output_path: str) -> None:
+    """Convert an SVG file to a PDF file (runs in a worker).
+
+    Args:
+        input_path: SVG path
+        output_path: Path for the output PDF
+    """
+    Path(output_path).write_bytes(_svg_to_pdf_bytes(Path(input_path).read_bytes()))
+
+
+def _write_page(doc: fitz.Document, page_index: int, output_path: Path) -> None:
+    """Save one page of a document as a single-page PDF.
+
+    Args:
+        doc: Open source document
+        page_index: Zero-based page to save
+        output_path: Path for the page PDF
+    """
+    single_page_doc = fitz.open()
+    try:
+        single_page_doc.insert_pdf(doc, from_page=page_index, to_page=page_index)
+        single_page_doc.save(str(output_path))
+    finally:
+        single_page_doc.close()
+
+
+class _FitzPageWriter(PageWriter):
+    """Output document that pages are inserted into in order.
+
+    The first flush saves the output and reopens it, so later flushes only
+    append an incremental update to the file.
+    """
+
+    def __init__(self, output_path: Path) -> None:
+        """Start an empty output.
+
+        Args:
+            output_path: Path for the output PDF
+        """
+        self.output_path = output_path
+        self._doc = fitz.open()
+        # First output page written for each page key
+        self._first: dict[str, int] = {}
+        self._saved = False
+
+    def append(self, page: Path | bytes, key: str | None = None) -> None:
+        """Append a page after the pages already written.
+
+        Args:
+            page: One-page PDF file or content
+            key: Identifies identical pages; repeats reference the page
+                object already written
+        """
+        if key is not None:
+            if key in self._first:
+                self._doc.copy_page(self._first[key])
+                return
+            self._first[key] = self._doc.page_count
+
+        if isinstance(page, bytes):
+            source = fitz.open(stream=page, filetype="pdf")
+        else:
+            source = fitz.open(str(page))
+        with source:
+            self._doc.insert_pdf(source)
+
+    def flush(self) -> None:
+        """Write the pages appended so far to the output path."""
+        if self._saved:
+            self._doc.saveIncr()
+            return
+        self._doc.save(str(self.output_path))
+        self._doc.close()
+        self._doc = fitz.open(str(self.output_path))
+        self._saved = True
+
+    def finish(self) -> None:
+        """Write the complete output and close it."""
+        try:
+            if self._saved:
+                self._doc.saveIncr()
+            else:
+                self._doc.save(str(self.output_path))
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Close the output document."""
+        if not self._doc.is_closed:
+            self._doc.close()
 
 
 class FitzBackend(Backend):
-    """Backend using PyMuPDF (Fitz)."""
+    """Backend using PyMuPDF (Fitz).
+
+    PDF to SVG and SVG to PDF conversion run in the backend's workers. PyMuPDF
+    is not thread-safe, so they run one at a time unless ``processing.engine``
+    is ``processes``. Each worker keeps its documents open across pages. When Fitz handles every stage, the converter runs the whole round
+    trip in memory through ``page_svg`` and ``svg_to_pdf_bytes``. The
+    ``text_as_path`` parameter (default True) draws text as outlines like
+    ``pdftocairo`` does; set it to False to keep selectable SVG text.
+    """
+
+    threadsafe_workers = False
 
     @property
     def name(self) -> BackendName:
@@ -28,6 +208,12 @@ class FitzBackend(Backend):
         return {
             BackendCapability.PDF_SPLIT,
             BackendCapability.PDF_MERGE,
+            BackendCapability.PDF_TO_SVG,
+            BackendCapability.SVG_TO_PDF,
+            BackendCapability.PDF_SPLIT_TO_SVG,
+            BackendCapability.DOCUMENT_ROUND_TRIP,
+            BackendCapability.BATCH_PROCESSING,
+            BackendCapability.INCREMENTAL_MERGE,
         }
 
     @property
@@ -36,6 +222,16 @@ class FitzBackend(Backend):
         # Fitz is a Python library, no system commands needed
         return []
 
+    @property
+    def version(self) -> str:
+        """PyMuPDF binding version."""
+        return str(fitz.VersionBind)
+
+    @property
+    def prefers_source_document(self) -> bool:
+        """Workers keep the source PDF open, so render from it directly."""
+        return True
+
     def is_available(self) -> bool:
         """Check if backend is available.
 
@@ -72,16 +268,9 @@ class FitzBackend(Backend):
 
             try:
                 for i in range(len(doc)):
-                    # Create single page document
                     output_path = output_dir / f"{prefix}_{i:04d}.pdf"
-                    single_page_doc = fitz.open()
-
-                    try:
-                        single_page_doc.insert_pdf(doc, from_page=i, to_page=i)
-                        single_page_doc.save(str(output_path))
-                        output_files.append(output_path)
-                    finally:
-                        single_page_doc.close()
+                    _write_page(doc, i, output_path)
+                    output_files.append(output_path)
 
                 logger.debug(f"Split {input_path} into {len(output_files)} pages")
                 return output_files
@@ -91,6 +280,36 @@ class FitzBackend(Backend):
 
         return await run_async(split_sync)
 
+    async def split_pages(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> AsyncGenerator[Path, None]:
+        """Split PDF into individual pages, yielding each once it is written.
+
+        Each page is written only when the caller asks for it, so a caller
+        that stops pulling pauses the split.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Yields:
+            Paths to individual page PDFs in page order
+        """
+        output_dir = Path(output_dir)
+        doc = await run_async(fitz.open, str(input_path))
+
+        try:
+            for i in range(doc.page_count):
+                output_path = output_dir / f"{prefix}_{i:04d}.pdf"
+                await run_async(_write_page, doc, i, output_path)
+                yield output_path
+        finally:
+            doc.close()
+
     async def merge_pdfs(
         self,
         input_paths: list[PathLike],
@@ -110,11 +329,24 @@ class FitzBackend(Backend):
         def merge_sync() -> Path:
             """Synchronous merge function."""
             merged_doc = fitz.open()
+            # First merged page and page count of every input already inserted
+            inserted: dict[Path, tuple[int, int]] = {}
 
             try:
                 for input_path in input_paths:
+                    key = Path(input_path).resolve()
+
+                    # Repeated inputs reference the pages already merged
+                    # instead of embedding another copy of them.
+                    if key in inserted:
+                        first, count = inserted[key]
+                        for page_number in range(first, first + count):
+                            merged_doc.copy_page(page_number)
+                        continue
+
                     doc = fitz.open(str(input_path))
                     try:
+                        inserted[key] = (merged_doc.page_count, doc.page_count)
                         merged_doc.insert_pdf(doc)
                     finally:
                         doc.close()
@@ -128,22 +360,47 @@ class FitzBackend(Backend):
 
         return await run_async(merge_sync)
 
+    def open_merge(self, output_path: PathLike) -> PageWriter:
+        """Start an output PDF that pages are appended to as they finish.
+
+        Args:
+            output_path: Path for the output PDF
+
+        Returns:
+            Writer for the output
+        """
+        return _FitzPageWriter(Path(output_path))
+
     async def pdf_to_svg(
         self,
         input_path: PathLike,
         output_path: PathLike,
+        page_index: int = 0,
     ) -> Path:
-        """Convert PDF to SVG.
+        """Convert one page of a PDF to SVG.
 
         Args:
             input_path: Path to input PDF
             output_path: Path for output SVG
+            page_index: Zero-based page to convert
 
         Returns:
             Path to output SVG
         """
-        # PyMuPDF doesn't have direct PDF to SVG conversion
-        raise NotImplementedError("Fitz backend does not support PDF to SVG conversion")
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        await self._run_in_worker(
+            _render_svg,
+            str(input_path),
+            str(output_path),
+            page_index,
+            bool(self.parameters.get("text_as_path", True)),
+            operation=f"get_svg_image {input_path}[{page_index}] -> {output_path}",
+        )
+
+        logger.debug(f"Converted page {page_index} of {input_path} to {output_path}")
+        return output_path
 
     async def svg_to_pdf(
         self,
@@ -159,5 +416,48 @@ class FitzBackend(Backend):
         Returns:
             Path to output PDF
         """
-        # PyMuPDF doesn't support SVG to PDF conversion
-        raise NotImplementedError("Fitz backend does not support SVG to PDF conversion")
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        await self._run_in_worker(
+            _svg_file_to_pdf,
+            str(input_path),
+            str(output_path),
+            operation=f"convert_to_pdf {input_path} -> {output_path}",
+        )
+
+        logger.debug(f"Converted {input_path} to {output_path}")
+        return output_path
+
+    async def page_svg(self, input_path: PathLike, page_index: int) -> str:
+        """Render one page of a PDF to SVG text without writing files.
+
+        Args:
+            input_path: Path to input PDF
+            page_index: Zero-based page to convert
+
+        Returns:
+            SVG document
+        """
+        return await self._run_in_worker(
+            _page_svg,
+            str(input_path),
+            page_index,
+            bool(self.parameters.get("text_as_path", True)),
+            operation=f"get_svg_image {input_path}[{page_index}]",
+        )
+
+    async def svg_to_pdf_bytes(self, svg: str | bytes) -> bytes:
+        """Convert an SVG document to a one-page PDF without writing files.
+
+        Args:
+            svg: SVG document
+
+        Returns:
+            PDF content
+        """
+        return await self._run_in_worker(
+            _svg_to_pdf_bytes,
+            svg,
+            operation="convert_to_pdf <memory>",
+        )
@@ -0,0 +1,512 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/backends/inkscape.py
+"""Inkscape backend implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import os
+import queue
+import select
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import fitz
+from loguru import logger
+
+from ..core.exceptions import BackendError
+from ..types import BackendCapability, BackendName, PathLike
+from ..utils.async_utils import run_async
+from .base import Backend
+
+if TYPE_CHECKING:
+    from ..config import Configuration
+
+# Pages one shell converts before it is replaced, bounding leaked memory
+_DEFAULT_PAGES_PER_PROCESS = 100
+
+
+def _extract_page(input_path: Path, page_index: int, output_path: Path) -> None:
+    """Write one page of a PDF to its own file.
+
+    Args:
+        input_path: Source PDF
+        page_index: Zero-based page
+        output_path: Path for the single-page PDF
+    """
+    with fitz.open(str(input_path)) as source, fitz.open() as page_doc:
+        page_doc.insert_pdf(source, from_page=page_index, to_page=page_index)
+        page_doc.save(str(output_path))
+
+
+class _ShellSession:
+    """One ``inkscape --shell`` process fed one action line per page."""
+
+    def __init__(self, timeout: float) -> None:
+        """Start the shell and wait for its first prompt.
+
+        Args:
+            timeout: Seconds to wait for Inkscape to start
+        """
+        self.process = subprocess.Popen(
+            ["inkscape", "--shell"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            # Merged so warnings cannot fill an undrained pipe
+            stderr=subprocess.STDOUT,
+        )
+        self.pages = 0
+        try:
+            self._read_until_prompt(timeout)
+        except Exception:
+            self.close()
+            raise
+
+    def run(self, actions: str, timeout: float) -> str:
+        """Run one line of actions.
+
+        Args:
+            actions: Semicolon-separated Inkscape actions
+            timeout: Seconds to wait for the actions to finish
+
+        Returns:
+            Everything Inkscape printed while running them
+        """
+        assert self.process.stdin is not None
+        self.process.stdin.write(actions.encode("utf-8") + b"\n")
+        self.process.stdin.flush()
+        self.pages += 1
+        return self._read_until_prompt(timeout)
+
+    def _read_until_prompt(self, timeout: float) -> str:
+        """Read output until the shell prompts for the next line.
+
+        Args:
+            timeout: Seconds to wait
+
+        Returns:
+            Output before the prompt
+
+        Raises:
+            TimeoutError: If no prompt appears in time
+            RuntimeError: If Inkscape exits
+        """
+        assert self.process.stdout is not None
+        fd = self.process.stdout.fileno()
+        deadline = time.monotonic() + timeout
+        output = bytearray()
+
+        while True:
+            text = output.decode("utf-8", errors="replace").rstrip(" ")
+            if text == ">" or text.endswith("\n>"):
+                return text[:-1]
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No Inkscape prompt after {timeout} seconds")
+
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if ready:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    raise RuntimeError(f"Inkscape exited: {text.strip()}")
+                output += chunk
+
+    def interrupt(self) -> None:
+        """Kill the shell from another thread; the running line then fails."""
+        if self.process.poll() is None:
+            self.process.kill()
+
+    def close(self) -> None:
+        """Stop the shell."""
+        if self.process.poll() is None:
+            self.process.kill()
+        self.process.wait()
+
+
+class _SessionPool:
+    """Fixed number of shell slots, each started on first use."""
+
+    def __init__(self, size: int, pages_per_process: int) -> None:
+        """Create the slots.
+
+        Args:
+            size: Number of concurrent shells
+            pages_per_process: Pages a shell converts before it is replaced
+        """
+        self.pages_per_process = pages_per_process
+        # None marks a slot whose shell has not been started or was retired
+        self._idle: queue.Queue[_ShellSession | None] = queue.Queue()
+        for _ in range(max(1, size)):
+            self._idle.put(None)
+        self._sessions: set[_ShellSession] = set()
+        # Shells running a line, by the cancellation flag of their caller
+        self._busy: dict[threading.Event, _ShellSession] = {}
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        actions: str,
+        timeout: float,
+        cancelled: threading.Event | None = None,
+    ) -> str:
+        """Run actions in an idle shell, waiting up to ``timeout`` for one.
+
+        Args:
+            actions: Semicolon-separated Inkscape actions
+            timeout: Seconds to wait for a free shell, and then to allow for
+                start-up and for the actions
+            cancelled: Set by ``cancel`` when the caller gives up
+
+        Returns:
+            Inkscape output
+
+        Raises:
+            TimeoutError: If no shell becomes free in time
+        """
+        try:
+            session = self._idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No Inkscape shell free after {timeout} seconds"
+            ) from None
+
+        try:
+            if session is None:
+                session = _ShellSession(timeout)
+                with self._lock:
+                    self._sessions.add(session)
+        except Exception:
+            self._idle.put(None)
+            raise
+
+        if cancelled is not None:
+            with self._lock:
+                abandoned = cancelled.is_set()
+                if not abandoned:
+                    self._busy[cancelled] = session
+            if abandoned:
+                # Nobody wants the result; leave the shell for the next caller
+                self._idle.put(session)
+                raise RuntimeError("Cancelled while waiting for a shell")
+
+        try:
+            output = session.run(actions, timeout)
+        except Exception:
+            # The shell may be wedged or half-way through a document
+            self._retire(session)
+            self._idle.put(None)
+            raise
+        finally:
+            if cancelled is not None:
+                with self._lock:
+                    self._busy.pop(cancelled, None)
+
+        if session.pages >= self.pages_per_process:
+            self._retire(session)
+            self._idle.put(None)
+        else:
+            self._idle.put(session)
+        return output
+
+    def cancel(self, cancelled: threading.Event) -> None:
+        """Give up on a call; its shell is killed and then replaced.
+
+        Args:
+            cancelled: Flag passed to the ``run`` call
+        """
+        with self._lock:
+            cancelled.set()
+            session = self._busy.get(cancelled)
+        if session is not None:
+            session.interrupt()
+
+    def _retire(self, session: _ShellSession | None) -> None:
+        """Stop a shell and forget it.
+
+        Args:
+            session: Shell to stop, if one was started
+        """
+        if session is None:
+            return
+        with self._lock:
+            self._sessions.discard(session)
+        session.close()
+
+    def close(self) -> None:
+        """Stop every shell."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, set()
+        for session in sessions:
+            session.close()
+
+
+class InkscapeBackend(Backend):
+    """Backend using Inkscape through long-lived ``inkscape --shell`` sessions.
+
+    Inkscape takes seconds to start, so each shell converts many pages, one
+    action line per page. There is one shell per concurrent page (the
+    ``workers`` parameter, or ``processing.parallel_pages``). A shell is
+    replaced after ``pages_per_process`` pages (default 100) and after any
+    error or timeout. The shell cannot choose a PDF page, so pages other
+    than the first are extracted with PyMuPDF before they are opened.
+    """
+
+    def __init__(self, config: Configuration | None = None) -> None:
+        """Initialize backend with configuration.
+
+        Args:
+            config: Optional configuration
+        """
+        super().__init__(config)
+        # Separate shells per direction, since export settings persist
+        self._pools: dict[str, _SessionPool] = {}
+        self._pools_lock = threading.Lock()
+
+    @property
+    def name(self) -> BackendName:
+        """Backend identifier."""
+        return "inkscape"
+
+    @property
+    def capabilities(self) -> set[BackendCapability]:
+        """Set of supported capabilities."""
+        return {
+            BackendCapability.PDF_TO_SVG,
+            BackendCapability.SVG_TO_PDF,
+            BackendCapability.BATCH_PROCESSING,
+        }
+
+    @property
+    def required_commands(self) -> list[str]:
+        """List of required system commands."""
+        return ["inkscape"]
+
+    def _pool(self, kind: str) -> _SessionPool:
+        """Get the shells for one conversion direction.
+
+        Args:
+            kind: Pool name
+
+        Returns:
+            Session pool, created on first use
+        """
+        with self._pools_lock:
+            if kind not in self._pools:
+                if not self._pools:
+                    atexit.register(self.close)
+                self._pools[kind] = _SessionPool(
+                    self.worker_count,
+                    int(
+                        self.parameters.get(
+                            "pages_per_process", _DEFAULT_PAGES_PER_PROCESS
+                        )
+                    ),
+                )
+            return self._pools[kind]
+
+    async def _convert(
+        self,
+        kind: str,
+        actions: list[str],
+        output_path: Path,
+    ) -> None:
+        """Run one conversion in a shell off the event loop.
+
+        If the caller is cancelled, the shell running the conversion is
+        killed and replaced rather than left busy with abandoned work.
+
+        Args:
+            kind: Pool to run in
+            actions: Inkscape actions for the page
+            output_path: File the actions export
+
+        Raises:
+            BackendError: If the conversion fails or times out
+        """
+        cancelled = threading.Event()
+        try:
+            await run_async(self._convert_sync, kind, actions, output_path, cancelled)
+        except asyncio.CancelledError:
+            self._pool(kind).cancel(cancelled)
+            raise
+
+    def _convert_sync(
+        self,
+        kind: str,
+        actions: list[str],
+        output_path: Path,
+        cancelled: threading.Event,
+    ) -> None:
+        """Run one conversion in a shell and check that it wrote its output.
+
+        Args:
+            kind: Pool to run in
+            actions: Inkscape actions for the page
+            output_path: File the actions export
+            cancelled: Set when the caller gives up
+
+        Raises:
+            BackendError: If the conversion fails or times out
+        """
+        line = "; ".join(actions)
+        output_path.unlink(missing_ok=True)
+        try:
+            output = self._pool(kind).run(line, self.timeout_seconds, cancelled)
+        except TimeoutError as e:
+            raise BackendError(
+                f"Command timed out after {self.timeout_seconds} seconds",
+                backend_name=self.name,
+                operation=line,
+            ) from e
+        except Exception as e:
+            raise BackendError(
+                f"Failed to run command: {e}",
+                backend_name=self.name,
+                operation=line,
+            ) from e
+
+        if not output_path.exists() or output_path.stat().st_size == 0:
+            raise BackendError(
+                "Inkscape did not write its output",
+                backend_name=self.name,
+                operation=line,
+                details={"output": output},
+            )
+
+    def close(self) -> None:
+        """Stop every Inkscape shell."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        for pool in pools:
+            pool.close()
+
+    @staticmethod
+    def _action_path(path: Path) -> str:
+        """Make a path safe to use as an action argument.
+
+        Args:
+            path: File path
+
+        Returns:
+            Absolute path
+
+        Raises:
+            BackendError: If the path would break the action line
+        """
+        resolved = str(path.resolve())
+        if ";" in resolved or "\n" in resolved:
+            raise BackendError(
+                f"Path cannot be passed to the Inkscape shell: {resolved!r}",
+                backend_name="inkscape",
+            )
+        return resolved
+
+    async def split_pdf(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> list[Path]:
+        """Split PDF into individual pages.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Returns:
+            List of paths to individual page PDFs
+        """
+        raise NotImplementedError("Inkscape backend does not support PDF splitting")
+
+    async def merge_pdfs(
+        self,
+        input_paths: list[PathLike],
+        output_path: PathLike,
+    ) -> Path:
+        """Merge multiple PDFs into one.
+
+        Args:
+            input_paths: List of PDF paths to merge
+            output_path: Path for merged PDF
+
+        Returns:
+            Path to merged PDF
+        """
+        raise NotImplementedError("Inkscape backend does not support PDF merging")
+
+    async def pdf_to_svg(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+        page_index: int = 0,
+    ) -> Path:
+        """Convert one page of a PDF to SVG.
+
+        Args:
+            input_path: Path to input PDF
+            output_path: Path for output SVG
+            page_index: Zero-based page to convert
+
+        Returns:
+            Path to output SVG
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        page_path = input_path
+        if page_index:
+            page_path = output_path.with_suffix(".page.pdf")
+            await run_async(_extract_page, input_path, page_index, page_path)
+
+        actions = [
+            f"file-open:{self._action_path(page_path)}",
+            f"export-filename:{self._action_path(output_path)}",
+            "export-plain-svg",
+        ]
+        if self.parameters.get("text_as_path", True):
+            actions.append("export-text-to-path")
+        actions += ["export-do", "file-close"]
+
+        try:
+            await self._convert("pdf_to_svg", actions, output_path)
+        finally:
+            if page_path != input_path:
+                page_path.unlink(missing_ok=True)
+
+        logger.debug(f"Converted page {page_index} of {input_path} to {output_path}")
+        return output_path
+
+    async def svg_to_pdf(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+    ) -> Path:
+        """Convert SVG to PDF.
+
+        Args:
+            input_path: Path to input SVG
+            output_path: Path for output PDF
+
+        Returns:
+            Path to output PDF
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        actions = [
+            f"file-open:{self._action_path(input_path)}",
+            f"export-filename:{self._action_path(output_path)}",
+            "export-type:pdf",
+            "export-do",
+            "file-close",
+        ]
+        await self._convert("svg_to_pdf", actions, output_path)
+
+        logger.debug(f"Converted {input_path} to {output_path}")
+        return output_path
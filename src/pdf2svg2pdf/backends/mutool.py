@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/backends/mutool.py
+"""MuPDF command-line (mutool) backend implementation."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import re
+import shutil
+import tempfile
+from collections.abc import Coroutine
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..core.exceptions import BackendError
+from ..types import BackendCapability, BackendName, PathLike
+from ..utils.async_utils import run_async
+from ..utils.io import get_page_count
+from .base import Backend
+
+if TYPE_CHECKING:
+    from ..config import Configuration
+
+
+class _DocumentRender:
+    """One ``mutool draw`` run writing every page of a document to SVG."""
+
+    def __init__(self, directory: Path, input_path: Path) -> None:
+        """Track a render; ``start`` runs it.
+
+        Args:
+            directory: Directory the page SVGs are written to
+            input_path: PDF being rendered, as passed to mutool
+        """
+        self.directory = directory
+        self.task: asyncio.Task[Any] | None = None
+        # Highest page index mutool has started drawing
+        self.reached = -1
+        # mutool announces each page on stderr as "page <input> <number>"
+        self._header = re.compile(re.escape(f"page {input_path} ".encode()) + rb"(\d+)")
+        self._stderr = b""
+        self._progress = asyncio.Event()
+
+    def start(self, draw: Coroutine[Any, Any, Any]) -> None:
+        """Run the render.
+
+        Args:
+            draw: Coroutine running ``mutool draw`` with ``read_progress``
+                as its stderr callback
+        """
+        self.task = asyncio.create_task(draw)
+        self.task.add_done_callback(self._finished)
+
+    def page_path(self, page_index: int) -> Path:
+        """Path mutool writes a page to.
+
+        Args:
+            page_index: Zero-based page
+
+        Returns:
+            Page SVG path
+        """
+        return self.directory / f"page{page_index + 1}.svg"
+
+    def read_progress(self, chunk: bytes) -> None:
+        """Note the pages mutool has started from a chunk of its stderr.
+
+        Args:
+            chunk: Bytes mutool wrote to stderr
+        """
+        self._stderr += chunk
+        numbers = [int(m.group(1)) for m in self._header.finditer(self._stderr)]
+        # Keep enough to match a header split across chunks; a number cut
+        # short only ever reads as an earlier page
+        self._stderr = self._stderr[-(len(self._header.pattern) + 20) :]
+        if numbers and max(numbers) - 1 > self.reached:
+            self.reached = max(numbers) - 1
+            self._notify()
+
+    def _finished(self, task: asyncio.Task[Any]) -> None:
+        """Wake every waiting page, and mark an unwanted error as retrieved."""
+        if not task.cancelled():
+            task.exception()
+        self._notify()
+
+    def _notify(self) -> None:
+        """Wake the pages waiting for progress."""
+        self._progress.set()
+        self._progress = asyncio.Event()
+
+    async def wait_for_page(self, page_index: int) -> Path:
+        """Wait until a page's SVG is completely written.
+
+        mutool draws pages in order, so a page is complete once mutool
+        starts the next one or exits.
+
+        Args:
+            page_index: Zero-based page
+
+        Returns:
+            Page SVG path
+
+        Raises:
+            Exception: The render's error if it failed before the page
+        """
+        assert self.task is not None
+        while self.reached <= page_index and not self.task.done():
+            await self._progress.wait()
+
+        if self.reached <= page_index:
+            self.task.result()
+        return self.page_path(page_index)
+
+    async def stop(self) -> None:
+        """Cancel the render, killing mutool, and wait until it is gone."""
+        if self.task is not None and not self.task.done():
+            self.task.cancel()
+            with contextlib.suppress(BaseException):
+                await self.task
+
+
+class MutoolBackend(Backend):
+    """Backend using MuPDF's ``mutool``.
+
+    ``mutool draw`` renders every page of a document in one process. The
+    first request for a page of a document starts that render and later
+    requests wait for their page's file, so SVG filters start on early pages
+    while later ones are still being drawn.
+    """
+
+    def __init__(self, config: Configuration | None = None) -> None:
+        """Initialize backend with configuration.
+
+        Args:
+            config: Optional configuration
+        """
+        super().__init__(config)
+        # Renders by (input path, input mtime, output directory)
+        self._renders: dict[tuple[str, int, str], _DocumentRender] = {}
+
+    @property
+    def name(self) -> BackendName:
+        """Backend identifier."""
+        return "mutool"
+
+    @property
+    def capabilities(self) -> set[BackendCapability]:
+        """Set of supported capabilities."""
+        return {
+            BackendCapability.PDF_MERGE,
+            BackendCapability.PDF_TO_SVG,
+            BackendCapability.PDF_SPLIT_TO_SVG,
+            BackendCapability.STREAMING,
+        }
+
+    @property
+    def required_commands(self) -> list[str]:
+        """List of required system commands."""
+        return ["mutool"]
+
+    @property
+    def prefers_source_document(self) -> bool:
+        """One render covers the whole source, so render from it directly."""
+        return True
+
+    async def split_pdf(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> list[Path]:
+        """Split PDF into individual pages.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Returns:
+            List of paths to individual page PDFs
+        """
+        # mutool can only extract one page per run; pdfseparate and Fitz
+        # split in one pass, and split-free addressing needs no split at all.
+        raise NotImplementedError("Mutool backend does not support PDF splitting")
+
+    async def merge_pdfs(
+        self,
+        input_paths: list[PathLike],
+        output_path: PathLike,
+    ) -> Path:
+        """Merge multiple PDFs into one.
+
+        Args:
+            input_paths: List of PDF paths to merge
+            output_path: Path for merged PDF
+
+        Returns:
+            Path to merged PDF
+        """
+        output_path = Path(output_path)
+
+        command = ["mutool", "merge", "-o", str(output_path)]
+        command.extend(str(p) for p in input_paths)
+        await self._run_command(command)
+
+        logger.debug(f"Merged {len(input_paths)} PDFs into {output_path}")
+        return output_path
+
+    def _document_render(self, input_path: Path, output_dir: Path) -> _DocumentRender:
+        """Get the render of a document, starting it if needed.
+
+        Renders start on the first page request, which callers only make
+        for pages they found no cached result for.
+
+        Args:
+            input_path: PDF to render
+            output_dir: Directory the caller wants page SVGs in
+
+        Returns:
+            Render writing into a private directory under ``output_dir``
+        """
+        key = (
+            str(input_path.resolve()),
+            input_path.stat().st_mtime_ns,
+            str(output_dir.resolve()),
+        )
+        render = self._renders.get(key)
+        if render is not None:
+            return render
+
+        directory = Path(tempfile.mkdtemp(prefix=".mutool-", dir=output_dir))
+        render = self._renders[key] = _DocumentRender(directory, input_path)
+        command = [
+            "mutool",
+            "draw",
+            "-F",
+            "svg",
+            "-o",
+            str(directory / "page%d.svg"),
+            str(input_path),
+        ]
+
+        async def draw() -> None:
+            # The time limit applies per page, like one pdftocairo run per page
+            pages = await run_async(get_page_count, input_path)
+            timeout = self.timeout_seconds * max(1, pages)
+            await self._run_command(command, timeout, progress=render.read_progress)
+            logger.debug(f"Rendered {pages} pages of {input_path} to SVG")
+
+        render.start(draw())
+        return render
+
+    async def release(self, directory: PathLike) -> None:
+        """Stop the renders started for outputs under a directory.
+
+        Args:
+            directory: The conversion's temporary directory
+        """
+        root = Path(directory).resolve()
+        for key in [k for k in self._renders if Path(k[2]).is_relative_to(root)]:
+            await self._renders.pop(key).stop()
+
+    async def pdf_to_svg(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+        page_index: int = 0,
+    ) -> Path:
+        """Convert one page of a PDF to SVG.
+
+        Args:
+            input_path: Path to input PDF
+            output_path: Path for output SVG
+            page_index: Zero-based page to convert
+
+        Returns:
+            Path to output SVG
+
+        Raises:
+            BackendError: If the render did not produce the page
+        """
+        input_path = Path(input_path)
+        output_path = Path(output_path)
+
+        render = self._document_render(input_path, output_path.parent)
+        page_svg = await render.wait_for_page(page_index)
+
+        # The render keeps the raw page: callers filter their copy in place,
+        # and a repeated request must not pick up those edits.
+        if page_svg.exists():
+            await run_async(shutil.copyfile, page_svg, output_path)
+        else:
+            raise BackendError(
+                f"mutool did not write page {page_index + 1}",
+                backend_name=self.name,
+                operation=f"draw {input_path}",
+            )
+
+        logger.debug(f"Converted page {page_index} of {input_path} to {output_path}")
+        return output_path
+
+    async def svg_to_pdf(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+    ) -> Path:
+        """Convert SVG to PDF.
+
+        Args:
+            input_path: Path to input SVG
+            output_path: Path for output PDF
+
+        Returns:
+            Path to output PDF
+        """
+        raise NotImplementedError(
+            "Mutool backend does not support SVG to PDF conversion"
+        )
@@ -4,12 +4,14 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from pathlib import Path
 
 from loguru import logger
 
 from ..types import BackendCapability, BackendName, PathLike
 from ..utils.async_utils import run_async
+from ..utils.io import get_page_count
 from .base import Backend
 
 
@@ -59,7 +61,7 @@ class PopplerBackend(Backend):
 
         # Run pdfseparate
         command = ["pdfseparate", str(input_path), output_pattern]
-        await run_async(self._run_command, command)
+        await self._run_command(command)
 
         # Find generated files
         page_files = sorted(output_dir.glob(f"{prefix}_*.pdf"))
@@ -67,6 +69,42 @@ class PopplerBackend(Backend):
         logger.debug(f"Split {input_path} into {len(page_files)} pages")
         return page_files
 
+    async def split_pages(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> AsyncGenerator[Path, None]:
+        """Split PDF into individual pages, yielding each once it is written.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Yields:
+            Paths to individual page PDFs in page order
+        """
+        input_path = Path(input_path)
+        output_dir = Path(output_dir)
+
+        # pdfseparate numbers pages from 1 and writes them in order
+        page_count = await run_async(get_page_count, input_path)
+        page_paths = [
+            output_dir / f"{prefix}_{number:04d}.pdf"
+            for number in range(1, page_count + 1)
+        ]
+        command = [
+            "pdfseparate",
+            str(input_path),
+            str(output_dir / f"{prefix}_%04d.pdf"),
+        ]
+
+        async for page_path in self._follow_split(
+            self._run_command(command), page_paths
+        ):
+            yield page_path
+
     async def merge_pdfs(
         self,
         input_paths: list[PathLike],
@@ -89,7 +127,7 @@ class PopplerBackend(Backend):
         command.append(str(output_path))
 
         # Run pdfunite
-        await run_async(self._run_command, command)
+        await self._run_command(command)
 
         logger.debug(f"Merged {len(input_paths)} PDFs into {output_path}")
         return output_path
@@ -98,12 +136,14 @@ class PopplerBackend(Backend):
         self,
         input_path: PathLike,
         output_path: PathLike,
+        page_index: int = 0,
     ) -> Path:
-        """Convert PDF to SVG.
+        """Convert one page of a PDF to SVG.
 
         Args:
             input_path: Path to input PDF
             output_path: Path for output SVG
+            page_index: Zero-based page to convert
 
         Returns:
             Path to output SVG
@@ -111,9 +151,19 @@ class PopplerBackend(Backend):
         input_path = Path(input_path)
         output_path = Path(output_path)
 
-        # Run pdftocairo
-        command = ["pdftocairo", "-svg", str(input_path), str(output_path)]
-        await run_async(self._run_command, command)
+        # Run pdftocairo on the one page; -svg writes a single page anyway
+        page = str(page_index + 1)
+        command = [
+            "pdftocairo",
+            "-svg",
+            "-f",
+            page,
+            "-l",
+            page,
+            str(input_path),
+            str(output_path),
+        ]
+        await self._run_command(command)
 
         logger.debug(f"Converted {input_path} to {output_path}")
         return output_path
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/backends/qpdf.py
+"""qpdf backend implementation."""
+
+from __future__ import annotations
+
+import tempfile
+from collections.abc import AsyncGenerator
+from pathlib import Path
+
+from loguru import logger
+
+from ..core.exceptions import BackendError
+from ..types import BackendCapability, BackendName, PathLike
+from ..utils.async_utils import run_async
+from ..utils.io import get_page_count
+from .base import Backend
+
+# qpdf exits with 3 when it succeeded but repaired or ignored damage
+_EXIT_WARNINGS = 3
+
+
+class QpdfBackend(Backend):
+    """Backend using qpdf for structural split and merge.
+
+    qpdf copies page objects together with the resources they use, so it
+    splits and merges without re-encoding. Merge inputs are passed in an
+    argument file, which keeps very large page counts clear of ARG_MAX.
+    """
+
+    @property
+    def name(self) -> BackendName:
+        """Backend identifier."""
+        return "qpdf"
+
+    @property
+    def capabilities(self) -> set[BackendCapability]:
+        """Set of supported capabilities."""
+        return {
+            BackendCapability.PDF_SPLIT,
+            BackendCapability.PDF_MERGE,
+        }
+
+    @property
+    def required_commands(self) -> list[str]:
+        """List of required system commands."""
+        return ["qpdf"]
+
+    async def _qpdf(self, arguments: list[str]) -> None:
+        """Run qpdf, accepting output written with warnings.
+
+        Args:
+            arguments: qpdf arguments
+
+        Raises:
+            BackendError: If qpdf fails
+        """
+        command = ["qpdf", *arguments]
+        result = await self._run_command(command, check=False)
+        if result.returncode not in (0, _EXIT_WARNINGS):
+            raise BackendError(
+                f"Command failed with exit code {result.returncode}",
+                backend_name=self.name,
+                operation=" ".join(command),
+                details={
+                    "stdout": result.stdout,
+                    "stderr": result.stderr,
+                    "returncode": result.returncode,
+                },
+            )
+        if result.returncode == _EXIT_WARNINGS:
+            logger.warning(f"qpdf reported warnings: {result.stderr.strip()}")
+
+    async def split_pdf(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> list[Path]:
+        """Split PDF into individual pages.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Returns:
+            List of paths to individual page PDFs
+        """
+        input_path = Path(input_path)
+        output_dir = Path(output_dir)
+
+        # One pass writes every page; qpdf zero-pads %d to the page count's
+        # width, so the names sort in page order.
+        arguments = [
+            "--split-pages=1",
+            str(input_path),
+            str(output_dir / f"{prefix}_%d.pdf"),
+        ]
+        await self._qpdf(arguments)
+
+        page_files = sorted(output_dir.glob(f"{prefix}_*.pdf"))
+
+        logger.debug(f"Split {input_path} into {len(page_files)} pages")
+        return page_files
+
+    async def split_pages(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> AsyncGenerator[Path, None]:
+        """Split PDF into individual pages, yielding each once it is written.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Yields:
+            Paths to individual page PDFs in page order
+        """
+        input_path = Path(input_path)
+        output_dir = Path(output_dir)
+
+        # qpdf numbers pages from 1, zero-padded to the page count's width,
+        # and writes them in order
+        page_count = await run_async(get_page_count, input_path)
+        width = len(str(page_count))
+        page_paths = [
+            output_dir / f"{prefix}_{number:0{width}d}.pdf"
+            for number in range(1, page_count + 1)
+        ]
+        arguments = [
+            "--split-pages=1",
+            str(input_path),
+            str(output_dir / f"{prefix}_%d.pdf"),
+        ]
+
+        async for page_path in self._follow_split(self._qpdf(arguments), page_paths):
+            yield page_path
+
+    async def merge_pdfs(
+        self,
+        input_paths: list[PathLike],
+        output_path: PathLike,
+    ) -> Path:
+        """Merge multiple PDFs into one.
+
+        Args:
+            input_paths: List of PDF paths to merge
+            output_path: Path for merged PDF
+
+        Returns:
+            Path to merged PDF
+        """
+        output_path = Path(output_path)
+
+        # qpdf reads one argument per line from @file
+        arguments = ["--empty", "--pages", *(str(p) for p in input_paths), "--"]
+        arguments.append(str(output_path))
+
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            suffix=".args",
+            dir=output_path.parent,
+            delete=False,
+        ) as f:
+            f.write("\n".join(arguments) + "\n")
+            args_path = Path(f.name)
+
+        try:
+            await self._qpdf([f"@{args_path}"])
+        finally:
+            args_path.unlink(missing_ok=True)
+
+        logger.debug(f"Merged {len(input_paths)} PDFs into {output_path}")
+        return output_path
+
+    async def pdf_to_svg(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+        page_index: int = 0,
+    ) -> Path:
+        """Convert one page of a PDF to SVG.
+
+        Args:
+            input_path: Path to input PDF
+            output_path: Path for output SVG
+            page_index: Zero-based page to convert
+
+        Returns:
+            Path to output SVG
+        """
+        raise NotImplementedError("Qpdf backend does not support PDF to SVG conversion")
+
+    async def svg_to_pdf(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+    ) -> Path:
+        """Convert SVG to PDF.
+
+        Args:
+            input_path: Path to input SVG
+            output_path: Path for output PDF
+
+        Returns:
+            Path to output PDF
+        """
+        raise NotImplementedError("Qpdf backend does not support SVG to PDF conversion")
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/backends/rsvg.py
+"""librsvg (rsvg-convert) backend implementation."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import fitz
+from loguru import logger
+
+from ..types import BackendCapability, BackendName, PathLike
+from ..utils.async_utils import run_async
+from .base import Backend
+
+# Bytes of SVG paths per rsvg-convert run. rsvg-convert has no argument
+# file, so longer lists are rendered in parts that stay well under the
+# command line limit (32 KiB on Windows, ARG_MAX elsewhere).
+_MAX_ARGUMENT_BYTES = 24_000 if os.name == "nt" else 128 * 1024
+
+
+def _chunks(paths: list[str], limit: int) -> list[list[str]]:
+    """Split paths into runs whose arguments fit in ``limit`` bytes.
+
+    Args:
+        paths: Paths in order
+        limit: Maximum bytes of arguments per run
+
+    Returns:
+        Non-empty runs of paths, in order
+    """
+    chunks: list[list[str]] = [[]]
+    size = 0
+    for path in paths:
+        length = len(os.fsencode(path)) + 1
+        if chunks[-1] and size + length > limit:
+            chunks.append([])
+            size = 0
+        chunks[-1].append(path)
+        size += length
+    return chunks
+
+
+def _concatenate(parts: list[Path], output_path: Path) -> None:
+    """Write the pages of several PDFs into one.
+
+    Args:
+        parts: PDFs in order
+        output_path: Path for the combined PDF
+    """
+    with fitz.open() as doc:
+        for part in parts:
+            with fitz.open(str(part)) as source:
+                doc.insert_pdf(source)
+        doc.save(str(output_path))
+
+
+class RsvgBackend(Backend):
+    """Backend using librsvg's ``rsvg-convert``.
+
+    ``rsvg-convert -f pdf`` writes one page per input SVG, so a whole
+    document's SVGs become the merged output PDF in a single process, or
+    in a few whose parts are joined when the paths do not fit on one
+    command line.
+    """
+
+    @property
+    def name(self) -> BackendName:
+        """Backend identifier."""
+        return "rsvg"
+
+    @property
+    def capabilities(self) -> set[BackendCapability]:
+        """Set of supported capabilities."""
+        return {
+            BackendCapability.SVG_TO_PDF,
+            BackendCapability.SVG_TO_PDF_MERGE,
+        }
+
+    @property
+    def required_commands(self) -> list[str]:
+        """List of required system commands."""
+        return ["rsvg-convert"]
+
+    async def split_pdf(
+        self,
+        input_path: PathLike,
+        output_dir: PathLike,
+        prefix: str = "page",
+    ) -> list[Path]:
+        """Split PDF into individual pages.
+
+        Args:
+            input_path: Path to input PDF
+            output_dir: Directory for output pages
+            prefix: Prefix for output filenames
+
+        Returns:
+            List of paths to individual page PDFs
+        """
+        raise NotImplementedError("Rsvg backend does not support PDF splitting")
+
+    async def merge_pdfs(
+        self,
+        input_paths: list[PathLike],
+        output_path: PathLike,
+    ) -> Path:
+        """Merge multiple PDFs into one.
+
+        Args:
+            input_paths: List of PDF paths to merge
+            output_path: Path for merged PDF
+
+        Returns:
+            Path to merged PDF
+        """
+        raise NotImplementedError("Rsvg backend does not support PDF merging")
+
+    async def pdf_to_svg(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+        page_index: int = 0,
+    ) -> Path:
+        """Convert one page of a PDF to SVG.
+
+        Args:
+            input_path: Path to input PDF
+            output_path: Path for output SVG
+            page_index: Zero-based page to convert
+
+        Returns:
+            Path to output SVG
+        """
+        raise NotImplementedError("Rsvg backend does not support PDF to SVG conversion")
+
+    async def svg_to_pdf(
+        self,
+        input_path: PathLike,
+        output_path: PathLike,
+    ) -> Path:
+        """Convert SVG to PDF.
+
+        Args:
+            input_path: Path to input SVG
+            output_path: Path for output PDF
+
+        Returns:
+            Path to output PDF
+        """
+        return await self.svgs_to_pdf([input_path], output_path)
+
+    async def svgs_to_pdf(
+        self,
+        input_paths: list[PathLike],
+        output_path: PathLike,
+    ) -> Path:
+        """Render SVGs into one PDF with a page per SVG.
+
+        Args:
+            input_paths: SVG paths in page order
+            output_path: Path for the output PDF
+
+        Returns:
+            Path to output PDF
+        """
+        output_path = Path(output_path)
+        chunks = _chunks([str(p) for p in input_paths], _MAX_ARGUMENT_BYTES)
+
+        if len(chunks) == 1:
+            await self._render(chunks[0], output_path)
+        else:
+            parts = [
+                output_path.with_name(f".{output_path.stem}.part{i}.pdf")
+                for i in range(len(chunks))
+            ]
+            try:
+                for chunk, part in zip(chunks, parts, strict=True):
+                    await self._render(chunk, part)
+                await run_async(_concatenate, parts, output_path)
+            finally:
+                for part in parts:
+                    part.unlink(missing_ok=True)
+
+        logger.debug(
+            f"Rendered {len(input_paths)} SVGs into {output_path} "
+            f"in {len(chunks)} run(s)"
+        )
+        return output_path
+
+    async def _render(self, input_paths: list[str], output_path: Path) -> None:
+        """Run rsvg-convert once.
+
+        Args:
+            input_paths: SVG paths in page order
+            output_path: Path for the output PDF
+        """
+        command = ["rsvg-convert", "-f", "pdf", "-o", str(output_path), *input_paths]
+        # The time limit applies per page, like one SVG_TO_PDF run per page
+        timeout = self.timeout_seconds * max(1, len(input_paths))
+        await self._run_command(command, timeout)
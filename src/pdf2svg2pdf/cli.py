@@ -24,9 +24,12 @@ from rich.table import Table
 
 from . import __version__
 from .config import Configuration, load_configuration
+from .core.cache import ResultCache
 from .core.converter import Converter
 from .core.exceptions import PDF2SVG2PDFError
-from .types import ConversionResult
+from .types import ConversionResult, FilterConfig
+from .utils.io import safe_temp_directory
+from .utils.tools import tools as discovered
 
 console = Console()
 
@@ -100,6 +103,30 @@ class PDF2SVG2PDFCLI:
 
         return config
 
+    @staticmethod
+    def _apply_filters(
+        config: Configuration,
+        pdf_filters: str | None,
+        svg_filters: str | None,
+    ) -> None:
+        """Replace the configured filters with ones named on the command line.
+
+        Args:
+            config: Configuration to update
+            pdf_filters: Comma-separated list of PDF filters
+            svg_filters: Comma-separated list of SVG filters
+        """
+        if pdf_filters:
+            config.pdf_filters = [
+                FilterConfig(name=name.strip(), enabled=True)
+                for name in pdf_filters.split(",")
+            ]
+        if svg_filters:
+            config.svg_filters = [
+                FilterConfig(name=name.strip(), enabled=True)
+                for name in svg_filters.split(",")
+            ]
+
     def _show_result(self, result: ConversionResult, path: Path) -> None:
         """Show conversion result.
 
@@ -119,6 +146,20 @@ class PDF2SVG2PDFCLI:
                     f"   Pages: {m.processed_pages}/{m.total_pages} | "
                     f"Size: {m.input_file_size_mb:.1f}MB → {m.output_file_size_mb:.1f}MB"
                 )
+                if m.cache_hit:
+                    console.print("   Served from the document cache")
+                if m.duplicate_pages:
+                    console.print(f"   Reused {m.duplicate_pages} duplicate pages")
+                if m.optimized_bytes_saved:
+                    console.print(
+                        f"   Optimizer saved {m.optimized_bytes_saved / 1024:.1f}KB"
+                    )
+                if m.cache_stats:
+                    console.print(
+                        f"   Cache: {m.cache_stats.hits} hits, "
+                        f"{m.cache_stats.misses} misses, "
+                        f"{m.cache_stats.evictions} evictions"
+                    )
         else:
             console.print(
                 f"❌ [red]Failed to convert[/red] {path.name}: {result['error']}"
@@ -153,20 +194,7 @@ class PDF2SVG2PDFCLI:
             )
 
             # Parse filters
-            if pdf_filters:
-                from .types import FilterConfig
-
-                config.pdf_filters = [
-                    FilterConfig(name=name.strip(), enabled=True)
-                    for name in pdf_filters.split(",")
-                ]
-            if svg_filters:
-                from .types import FilterConfig
-
-                config.svg_filters = [
-                    FilterConfig(name=name.strip(), enabled=True)
-                    for name in svg_filters.split(",")
-                ]
+            self._apply_filters(config, pdf_filters, svg_filters)
 
             # Create converter
             with Progress(
@@ -322,21 +350,175 @@ class PDF2SVG2PDFCLI:
                 console.print_exception()
             sys.exit(1)
 
+    def cache(self, action: str = "stats", *input_paths: str) -> None:
+        """Inspect and maintain the result cache.
+
+        Args:
+            action: One of ``stats``, ``prune``, ``clear`` or ``warm``
+            *input_paths: PDF files or directories to convert when warming
+        """
+        try:
+            config = self._load_config()
+            result_cache = ResultCache(config.cache)
+
+            if action == "stats":
+                self._show_cache_stats(result_cache)
+            elif action == "prune":
+                removed = result_cache.prune()
+                console.print(
+                    f"Pruned {removed['expired']} expired, "
+                    f"{removed['orphaned']} orphaned and "
+                    f"{removed['evicted']} evicted entries"
+                )
+            elif action == "clear":
+                result_cache.clear()
+                console.print(f"Cleared cache at {result_cache.directory}")
+            elif action == "warm":
+                self._warm_cache(config, input_paths)
+            else:
+                raise ValueError(
+                    f"Unknown cache action: {action} "
+                    "(expected stats, prune, clear or warm)"
+                )
+
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            if self.verbose:
+                console.print_exception()
+            sys.exit(1)
+
+    def _show_cache_stats(self, result_cache: ResultCache) -> None:
+        """Show per-namespace cache usage.
+
+        Args:
+            result_cache: Cache to describe
+        """
+        usage = result_cache.usage() if result_cache.index.path.exists() else {}
+
+        table = Table(title=f"Cache: {result_cache.directory}")
+        table.add_column("Namespace", style="cyan")
+        table.add_column("Entries", justify="right")
+        table.add_column("Size", justify="right", style="green")
+
+        total = 0
+        for namespace, (count, size) in sorted(usage.items()):
+            table.add_row(namespace, str(count), f"{size / (1024 * 1024):.1f}MB")
+            total += size
+
+        console.print(table)
+        console.print(
+            f"Total: {total / (1024 * 1024):.1f}MB of "
+            f"{result_cache.config.max_size_mb}MB | "
+            f"TTL: {result_cache.config.ttl_seconds}s | "
+            f"Enabled: {result_cache.enabled}"
+        )
+
+    def _warm_cache(self, config: Configuration, input_paths: tuple[str, ...]) -> None:
+        """Convert files into a throwaway directory to populate the cache.
+
+        Args:
+            config: Configuration to convert with
+            input_paths: PDF files or directories of PDFs
+        """
+        if not config.cache.enabled:
+            raise ValueError("The cache is disabled in the configuration")
+
+        files: list[Path] = []
+        for p in input_paths:
+            path = Path(p)
+            files.extend(sorted(path.glob("*.pdf")) if path.is_dir() else [path])
+
+        if not files:
+            console.print("[yellow]No files to warm the cache with[/yellow]")
+            return
+
+        converter = Converter(config)
+        cached = 0
+        with safe_temp_directory(prefix="pdf2svg2pdf_warm_") as temp_dir:
+            for file_path in files:
+                result = converter.convert_sync(file_path, output_dir=temp_dir)
+                if not result["success"]:
+                    console.print(
+                        f"❌ [red]Failed to warm[/red] {file_path.name}: "
+                        f"{result['error']}"
+                    )
+                elif result["metrics"] and result["metrics"].cache_hit:
+                    cached += 1
+
+        console.print(
+            f"Warmed the cache with {len(files)} files ({cached} were already cached)"
+        )
+
+    def plan(
+        self,
+        pdf_filters: str | None = None,
+        svg_filters: str | None = None,
+    ) -> None:
+        """Show the execution plan conversions would run with.
+
+        Args:
+            pdf_filters: Comma-separated list of PDF filters
+            svg_filters: Comma-separated list of SVG filters
+        """
+        try:
+            config = self._load_config()
+            self._apply_filters(config, pdf_filters, svg_filters)
+            plan = Converter(config).plan
+
+            table = Table(title=f"Execution Plan (cost {plan.cost})")
+            table.add_column("Stages", style="cyan")
+            table.add_column("Capability", style="white")
+            table.add_column("Backend", style="green")
+            table.add_column("Workers", justify="right")
+            table.add_column("Cost", justify="right")
+
+            for step in plan.steps:
+                table.add_row(
+                    ", ".join(step.stages),
+                    step.capability.name,
+                    step.backend.identity,
+                    str(step.workers),
+                    str(step.cost),
+                )
+
+            console.print(table)
+            console.print(
+                "PDF filters: "
+                + (", ".join(f.name for f in plan.pdf_filter_chain.filters) or "none")
+            )
+            console.print(
+                "SVG filters: "
+                + (", ".join(f.name for f in plan.svg_filter_chain.filters) or "none")
+            )
+            console.print(
+                f"Parallel pages: {plan.parallel_pages} | "
+                f"Queue depth: {plan.queue_depth} | Engine: {plan.engine}"
+            )
+            console.print(
+                "Stage limits: "
+                + ", ".join(f"{k}={v}" for k, v in plan.stage_limits.items())
+            )
+            console.print(
+                f"Cache: {'enabled' if config.cache.enabled else 'disabled'} | "
+                f"Page tier: {plan.fingerprints.page[:12]} | "
+                f"Document: {plan.document_fingerprint[:12]}"
+            )
+
+        except Exception as e:
+            console.print(f"[red]Error:[/red] {e}")
+            if self.verbose:
+                console.print_exception()
+            sys.exit(1)
+
+    explain = plan
+
     def list_filters(self) -> None:
         """List available filters."""
         # Initialize filters
-        from .filters import (
-            GrayscaleFilter,
-            PDFCompressFilter,
-            SVGOptimizeFilter,
-            SVGTransparentWhiteFilter,
-        )
+        from .filters import register_builtin_filters
         from .filters.base import pdf_filter_registry, svg_filter_registry
 
-        pdf_filter_registry.register(GrayscaleFilter)
-        pdf_filter_registry.register(PDFCompressFilter)
-        svg_filter_registry.register(SVGOptimizeFilter)
-        svg_filter_registry.register(SVGTransparentWhiteFilter)
+        register_builtin_filters()
 
         # Create table
         table = Table(title="Available Filters")
@@ -356,6 +538,32 @@ class PDF2SVG2PDFCLI:
 
         console.print(table)
 
+    def tools(self, refresh: bool = False) -> None:
+        """Show the external tools found on PATH.
+
+        Args:
+            refresh: Probe every tool again instead of using saved results
+        """
+        if refresh:
+            discovered.refresh()
+
+        table = Table(title="External Tools")
+        table.add_column("Tool", style="cyan")
+        table.add_column("Status", style="white")
+        table.add_column("Version", style="green")
+        table.add_column("Path", style="dim")
+
+        for name, info in discovered.all().items():
+            if info.available:
+                status = "[green]ok[/green]"
+            elif info.path:
+                status = "[red]broken[/red]"
+            else:
+                status = "[yellow]missing[/yellow]"
+            table.add_row(name, status, info.version or "", info.path or "")
+
+        console.print(table)
+
     def version(self) -> None:
         """Show version information."""
         console.print(
@@ -4,16 +4,38 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, cast
 
 import yaml
 from loguru import logger
 
 from .core.exceptions import ConfigurationError, ValidationError
-from .types import BackendConfig, FilterConfig, PathLike
+from .types import (
+    PIPELINE_STAGES,
+    BackendConfig,
+    BackendName,
+    ExecutionEngine,
+    FilterConfig,
+    PathLike,
+    SVGTrust,
+)
+
+# Backends and priorities used when the configuration lists none
+DEFAULT_BACKEND_PRIORITIES: dict[str, int] = {
+    "qpdf": 110,
+    "mutool": 105,
+    "poppler": 100,
+    "rsvg": 85,
+    "cairo": 80,
+    # Below every renderer it can stand in for, so it is the fallback
+    "fitz": 75,
+    "inkscape": 50,
+}
 
 
 @dataclass
@@ -28,6 +50,30 @@ class ProcessingConfig:
     cleanup_on_error: bool = True
     preserve_temp_files: bool = False
     progress_updates: bool = True
+    # False renders page i straight from the input instead of splitting it
+    # into single-page files first
+    split_pages: bool = True
+    # "processes" runs filters and the library backends (cairo, fitz) in warm
+    # worker processes instead of threads, so CPU-bound work is not
+    # serialized by the GIL. Scripts then need an `if __name__ == "__main__":`
+    # guard; without it the workers fall back to threads.
+    engine: ExecutionEngine = "threads"
+    # Worker processes for the "processes" engine; 0 uses one per CPU
+    worker_processes: int = 0
+    # Pages sent to a worker process in one task
+    chunk_size: int = 4
+    # Split pages waiting for a free page worker; an in-process split pauses
+    # when this many are queued, which bounds its temp disk use
+    queue_depth: int = 8
+    # Save the output every this many merged pages so readers can start on
+    # the first pages; 0 writes it once at the end
+    flush_pages: int = 0
+    # True plans the backends that start the fewest processes (fused and
+    # in-memory ones) ahead of backend priority
+    plan_by_cost: bool = False
+    # Calls running at once per stage (split, pdf_filter, pdf_to_svg,
+    # svg_filter, svg_to_pdf, merge); unlisted stages use parallel_pages
+    stage_concurrency: dict[str, int] = field(default_factory=dict)
 
 
 @dataclass
@@ -39,6 +85,9 @@ class SecurityConfig:
     max_file_size_mb: int = 500
     allowed_extensions: set[str] = field(default_factory=lambda: {".pdf", ".svg"})
     sanitize_svg: bool = True
+    # Trust in SVGs from our own PDF_TO_SVG backends: "untrusted" sanitizes,
+    # "checked" rejects active content, "trusted" skips sanitizing.
+    svg_trust: SVGTrust = "untrusted"
     temp_dir_permissions: int = 0o700
 
 
@@ -46,11 +95,17 @@ class SecurityConfig:
 class CacheConfig:
     """Cache configuration."""
 
-    enabled: bool = True
+    # Off unless asked for: results are kept on disk across runs
+    enabled: bool = False
     directory: Path | None = None
     max_size_mb: int = 1024
     ttl_seconds: int = 86400  # 24 hours
     compression: bool = True
+    memory_size_mb: int = 64  # In-process L1 in front of the on-disk store
+    # Serve document hits as hardlinks to the cache entry instead of copies.
+    # Faster for large outputs, but the output shares the entry's inode:
+    # editing it in place changes what later hits get.
+    link_outputs: bool = False
 
 
 @dataclass
@@ -202,6 +257,12 @@ class Configuration:
             config.processing.max_memory_mb = int(val)
         if val := os.getenv("PDF2SVG2PDF_TIMEOUT_SECONDS"):
             config.processing.timeout_seconds = float(val)
+        if val := os.getenv("PDF2SVG2PDF_SPLIT_PAGES"):
+            config.processing.split_pages = val.lower() in ("true", "1", "yes")
+        if val := os.getenv("PDF2SVG2PDF_ENGINE"):
+            config.processing.engine = cast("ExecutionEngine", val.lower())
+        if val := os.getenv("PDF2SVG2PDF_WORKER_PROCESSES"):
+            config.processing.worker_processes = int(val)
 
         # Security settings
         if val := os.getenv("PDF2SVG2PDF_VALIDATE_PATHS"):
@@ -269,6 +330,27 @@ class Configuration:
 
         return merged
 
+    def fingerprint(self) -> str:
+        """Canonical fingerprint of the settings that shape the output document.
+
+        Processing, logging and cache settings change how a conversion runs,
+        not what it produces, so they are left out.
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        data = {
+            "backends": [asdict(b) for b in self.backends if b.enabled],
+            "pdf_filters": [asdict(f) for f in self.pdf_filters if f.enabled],
+            "svg_filters": [asdict(f) for f in self.svg_filters if f.enabled],
+            "sanitize_svg": self.security.sanitize_svg,
+            "svg_trust": self.security.svg_trust,
+            "output_format": self.output_format,
+            "compress_output": self.compress_output,
+        }
+        canonical = json.dumps(data, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
     def validate(self) -> None:
         """Validate configuration.
 
@@ -283,6 +365,51 @@ class Configuration:
                 value=self.processing.parallel_pages,
             )
 
+        if self.processing.queue_depth < 1:
+            raise ValidationError(
+                "queue_depth must be at least 1",
+                field="processing.queue_depth",
+                value=self.processing.queue_depth,
+            )
+
+        if self.processing.flush_pages < 0:
+            raise ValidationError(
+                "flush_pages must not be negative",
+                field="processing.flush_pages",
+                value=self.processing.flush_pages,
+            )
+
+        if self.processing.engine not in {"threads", "processes"}:
+            raise ValidationError(
+                f"Invalid execution engine: {self.processing.engine}",
+                field="processing.engine",
+                value=self.processing.engine,
+            )
+
+        if self.processing.worker_processes < 0 or self.processing.chunk_size < 1:
+            raise ValidationError(
+                "worker_processes must not be negative and chunk_size must be "
+                "at least 1",
+                field="processing.worker_processes",
+                value=self.processing.worker_processes,
+            )
+
+        for stage, limit in self.processing.stage_concurrency.items():
+            if stage not in PIPELINE_STAGES or limit < 1:
+                raise ValidationError(
+                    f"Invalid concurrency limit for stage {stage}: {limit}",
+                    field=f"processing.stage_concurrency.{stage}",
+                    value=limit,
+                )
+
+        for backend in self.backends:
+            if backend.max_concurrency is not None and backend.max_concurrency < 1:
+                raise ValidationError(
+                    f"max_concurrency must be at least 1 for backend {backend.name}",
+                    field=f"backends.{backend.name}.max_concurrency",
+                    value=backend.max_concurrency,
+                )
+
         if self.processing.max_memory_mb < 64:
             raise ValidationError(
                 "max_memory_mb must be at least 64",
@@ -298,6 +425,13 @@ class Configuration:
                 value=self.security.max_file_size_mb,
             )
 
+        if self.security.svg_trust not in {"untrusted", "checked", "trusted"}:
+            raise ValidationError(
+                f"Invalid SVG trust level: {self.security.svg_trust}",
+                field="security.svg_trust",
+                value=self.security.svg_trust,
+            )
+
         # Validate cache settings
         if (
             self.cache.enabled
@@ -310,6 +444,13 @@ class Configuration:
                 value=str(self.cache.directory),
             )
 
+        if self.cache.memory_size_mb < 0:
+            raise ValidationError(
+                "memory_size_mb must not be negative",
+                field="cache.memory_size_mb",
+                value=self.cache.memory_size_mb,
+            )
+
         # Validate output format
         if self.output_format not in {"pdf", "svg"}:
             raise ValidationError(
@@ -322,9 +463,8 @@ class Configuration:
         if not self.backends:
             # Add default backends if none specified
             self.backends = [
-                BackendConfig(name="poppler", priority=100),
-                BackendConfig(name="fitz", priority=90),
-                BackendConfig(name="cairo", priority=80),
+                BackendConfig(name=cast(BackendName, name), priority=priority)
+                for name, priority in DEFAULT_BACKEND_PRIORITIES.items()
             ]
 
         # Validate filters have unique names
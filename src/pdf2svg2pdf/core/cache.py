@@ -0,0 +1,933 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/core/cache.py
+"""Content-addressed on-disk cache for conversion results."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any
+
+from loguru import logger
+
+from ..types import CacheStats, PathLike
+from ..utils.io import (
+    atomic_write,
+    default_cache_directory,
+    default_file_mode,
+    ensure_directory,
+)
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no advisory locks on Windows
+    fcntl = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from ..config import CacheConfig
+
+# Per-file metadata that differs between otherwise identical page PDFs (the
+# trailer /ID and the Info dictionary timestamps). It is masked out before
+# hashing so the same page split from two source files gets the same key.
+_VOLATILE_PDF_METADATA = re.compile(
+    rb"/ID\s*\[\s*<[0-9A-Fa-f]*>\s*<[0-9A-Fa-f]*>\s*\]"
+    rb"|/(?:CreationDate|ModDate)\s*\([^)]*\)"
+)
+
+# Indirect references inside a PDF object's source, and the keys that point
+# back up the page tree or at annotations' pages. Back links are left out of
+# page digests so identical pages hash alike wherever they sit.
+_REFERENCE = re.compile(r"\b(\d+) \d+ R\b")
+_BACK_LINK = re.compile(r"/(?:Parent|P)\s*\d+ \d+ R\b")
+
+# Page attributes a page may inherit from its ancestors in the page tree
+_INHERITABLE = ("Resources", "MediaBox", "CropBox", "Rotate")
+
+# Namespaces whose entries are gzipped when compression is on. Page and
+# document PDFs are already Flate-compressed by the backends, and keeping them
+# uncompressed lets document hits be served as hardlinks (cache.link_outputs).
+_COMPRESSED_NAMESPACES = frozenset({"svg"})
+
+# Eviction frees space down to this fraction of max_size_mb so that the next
+# few writes do not each trigger another eviction pass.
+_EVICTION_TARGET = 0.9
+
+# Single-flight lock files live here, next to the namespace directories.
+_LOCK_DIR = "locks"
+
+# Lock files untouched for this long are removed by prune().
+_STALE_LOCK_SECONDS = 3600
+
+# Accesses served from memory are written to the index once this many are
+# pending, or when the oldest has waited this long, so the shared LRU order
+# sees them without a database write per hit.
+_TOUCH_BATCH = 64
+_TOUCH_INTERVAL_SECONDS = 5.0
+
+# Unindexed files younger than this may be another process's write in
+# progress (an atomic_write temp file, or an entry not yet indexed), so
+# prune() leaves them alone.
+_ORPHAN_GRACE_SECONDS = 3600
+
+
+def _is_current(handle: IO[bytes], path: Path) -> bool:
+    """Check that an open lock file is still the file at its path.
+
+    Args:
+        handle: Open lock file
+        path: Path it was opened from
+
+    Returns:
+        False if the file was unlinked or replaced since it was opened
+    """
+    try:
+        return os.path.samestat(os.fstat(handle.fileno()), os.stat(path))
+    except FileNotFoundError:
+        return False
+
+
+def file_digest(path: PathLike) -> str:
+    """Hash a file's bytes.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def page_digest(path: PathLike) -> str:
+    """Hash a single-page PDF, ignoring per-file IDs and timestamps.
+
+    Args:
+        path: Page PDF to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    content = Path(path).read_bytes()
+    return hashlib.sha256(_VOLATILE_PDF_METADATA.sub(b"", content)).hexdigest()
+
+
+def document_page_digests(path: PathLike) -> list[str]:
+    """Hash every page of a PDF by its content, without splitting it.
+
+    A page's digest covers its content streams and, recursively, every
+    object they use (fonts, images, forms), with references replaced by the
+    digest of what they point to. Identical pages therefore hash alike
+    within a document and across documents, like ``page_digest`` of their
+    split files would. Links to pages hash as a placeholder so a page does
+    not depend on the rest of the document.
+
+    Args:
+        path: PDF to hash
+
+    Returns:
+        Hex SHA-256 digest per page, in page order
+    """
+    import fitz
+
+    with fitz.open(str(path)) as doc:
+        pages = {doc.page_xref(i) for i in range(doc.page_count)}
+        digests: dict[int, str] = {}
+
+        def resolve(source: str) -> str:
+            return _REFERENCE.sub(
+                lambda m: reference(int(m.group(1))), _BACK_LINK.sub("", source)
+            )
+
+        def object_digest(xref: int) -> str:
+            digest = hashlib.sha256(
+                resolve(doc.xref_object(xref, compressed=True)).encode()
+            )
+            if doc.xref_is_stream(xref):
+                digest.update(doc.xref_stream_raw(xref) or b"")
+            return digest.hexdigest()
+
+        def reference(xref: int) -> str:
+            if xref in pages:
+                return "page"
+            if xref not in digests:
+                # Placeholder that ends reference cycles
+                digests[xref] = "cycle"
+                digests[xref] = object_digest(xref)
+            return digests[xref]
+
+        # Document-wide state that changes how pages render
+        catalog = doc.pdf_catalog()
+        kind, value = doc.xref_get_key(catalog, "OCProperties")
+        shared = resolve(value) if kind != "null" else ""
+
+        result = []
+        for index in range(doc.page_count):
+            xref = doc.page_xref(index)
+            parts = [shared, object_digest(xref)]
+            for key in _INHERITABLE:
+                node = xref
+                while node:
+                    kind, value = doc.xref_get_key(node, key)
+                    if kind != "null":
+                        parts.append(f"/{key} {resolve(value)}")
+                        break
+                    kind, parent = doc.xref_get_key(node, "Parent")
+                    node = int(parent.split()[0]) if kind == "xref" else 0
+            result.append(cache_key(*parts))
+        return result
+
+
+def cache_key(*parts: str) -> str:
+    """Combine key components into a single cache key.
+
+    Args:
+        *parts: Key components (digests, fingerprints, versions)
+
+    Returns:
+        Hex SHA-256 digest of the components
+    """
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _unshare(path: Path) -> None:
+    """Remove a file that is hardlinked elsewhere, so writes cannot alias.
+
+    Args:
+        path: File about to be rewritten
+    """
+    try:
+        if path.stat().st_nlink > 1:
+            path.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _hardlink(source: Path, destination: Path) -> bool:
+    """Atomically replace destination with a hardlink to source.
+
+    Args:
+        source: Existing file
+        destination: Path to (re)point at source
+
+    Returns:
+        True if linked, False if the filesystem refused (e.g. across devices)
+    """
+    temp = destination.with_name(f".{destination.name}.link")
+    try:
+        temp.unlink(missing_ok=True)
+        os.link(source, temp)
+        os.replace(temp, destination)
+    except OSError:
+        temp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+@dataclass(frozen=True)
+class CacheFingerprints:
+    """Per-run fingerprints that, combined with a page digest, key each tier."""
+
+    svg: str  # PDF filters and PDF_TO_SVG backend: keys the raw SVG tier
+    page: str  # svg plus SVG filters and SVG_TO_PDF backend: keys page PDFs
+
+
+class MemoryCache:
+    """Bounded in-process LRU of entry contents.
+
+    Sits in front of the on-disk store as an L1 so repeated hits within one
+    process skip the disk read and decompression.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        """Initialize memory cache.
+
+        Args:
+            max_bytes: Total size budget; 0 disables the memory tier
+        """
+        self.max_bytes = max_bytes
+        # A single huge document must not flush every page out of the cache.
+        self.max_entry_bytes = max_bytes // 8
+        self._entries: OrderedDict[tuple[str, str], tuple[bytes, float]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, str]) -> tuple[bytes, float] | None:
+        """Return ``(content, created)`` and mark the entry as recently used."""
+        with self._lock:
+            found = self._entries.get(key)
+            if found is not None:
+                self._entries.move_to_end(key)
+            return found
+
+    def put(self, key: tuple[str, str], content: bytes, created: float) -> None:
+        """Add an entry, evicting least recently used ones to fit."""
+        if len(content) > self.max_entry_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+            self._entries[key] = (content, created)
+            self._size += len(content)
+            while self._size > self.max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def discard(self, key: tuple[str, str]) -> None:
+        """Drop an entry if present."""
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[0])
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+@dataclass
+class _Flight:
+    """In-process state of one single-flight key."""
+
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    holders: int = 0
+
+
+# Entries, plus their total size kept up to date by triggers so that every
+# put can check the size limit without summing the table. A database from
+# before the totals table gets it filled in once.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created REAL NOT NULL,
+    accessed REAL NOT NULL,
+    compressed INTEGER NOT NULL,
+    PRIMARY KEY (namespace, key));
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed);
+CREATE TABLE IF NOT EXISTS totals (size INTEGER NOT NULL);
+INSERT INTO totals SELECT COALESCE(SUM(size), 0) FROM entries
+    WHERE NOT EXISTS (SELECT 1 FROM totals);
+CREATE TRIGGER IF NOT EXISTS entries_added AFTER INSERT ON entries
+    BEGIN UPDATE totals SET size = size + NEW.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_removed AFTER DELETE ON entries
+    BEGIN UPDATE totals SET size = size - OLD.size; END;
+CREATE TRIGGER IF NOT EXISTS entries_resized AFTER UPDATE OF size ON entries
+    BEGIN UPDATE totals SET size = size + NEW.size - OLD.size; END;
+"""
+
+
+class CacheIndex:
+    """SQLite index of cache entries with their sizes and access times.
+
+    Lookups, size accounting and eviction query the index instead of scanning
+    the cache directory. The database is safe to share between processes.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize index.
+
+        Args:
+            path: Database file (created on first use)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and create the schema if needed."""
+        if self._connection is None:
+            ensure_directory(self.path.parent)
+            connection = sqlite3.connect(
+                self.path,
+                timeout=30,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            try:
+                # One transaction, so two processes cannot both fill totals
+                connection.executescript(f"BEGIN IMMEDIATE; {_SCHEMA} COMMIT;")
+            except BaseException:
+                if connection.in_transaction:
+                    connection.execute("ROLLBACK")
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _query(self, sql: str, params: tuple[Any, ...] = ()) -> list[Any]:
+        """Run a statement and return all rows."""
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def lookup(self, namespace: str, key: str) -> tuple[float, bool] | None:
+        """Return ``(created, compressed)`` for an entry, or None."""
+        rows = self._query(
+            "SELECT created, compressed FROM entries WHERE namespace = ? AND key = ?",
+            (namespace, key),
+        )
+        return (rows[0][0], bool(rows[0][1])) if rows else None
+
+    def touch(self, namespace: str, key: str, now: float) -> None:
+        """Record an access for LRU ordering."""
+        self._query(
+            "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+            (now, namespace, key),
+        )
+
+    def touch_many(self, accesses: dict[tuple[str, str], float]) -> None:
+        """Record several accesses in one transaction.
+
+        Args:
+            accesses: Access time per ``(namespace, key)``
+        """
+        with self._lock:
+            connection = self._connect()
+            connection.execute("BEGIN")
+            try:
+                connection.executemany(
+                    "UPDATE entries SET accessed = ? WHERE namespace = ? AND key = ?",
+                    [(now, ns, key) for (ns, key), now in accesses.items()],
+                )
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+
+    def add(
+        self, namespace: str, key: str, size: int, compressed: bool, now: float
+    ) -> None:
+        """Insert or replace an entry."""
+        # An upsert rather than INSERT OR REPLACE, whose implicit delete
+        # would not fire the trigger that keeps the total
+        self._query(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT (namespace, key) DO UPDATE SET size = excluded.size,"
+            " created = excluded.created, accessed = excluded.accessed,"
+            " compressed = excluded.compressed",
+            (namespace, key, size, now, now, int(compressed)),
+        )
+
+    def remove(self, namespace: str, key: str) -> None:
+        """Drop an entry."""
+        self._query(
+            "DELETE FROM entries WHERE namespace = ? AND key = ?", (namespace, key)
+        )
+
+    def total_size(self) -> int:
+        """Total size of all entries in bytes."""
+        return int(self._query("SELECT size FROM totals")[0][0])
+
+    def least_recent(self, limit: int) -> list[tuple[str, str, int]]:
+        """Least recently used entries as ``(namespace, key, size)``."""
+        return self._query(
+            "SELECT namespace, key, size FROM entries ORDER BY accessed LIMIT ?",
+            (limit,),
+        )
+
+    def created_before(self, cutoff: float) -> list[tuple[str, str, int]]:
+        """Entries created before a timestamp as ``(namespace, key, size)``."""
+        return self._query(
+            "SELECT namespace, key, size FROM entries WHERE created < ?", (cutoff,)
+        )
+
+    def keys(self) -> set[tuple[str, str]]:
+        """All ``(namespace, key)`` pairs."""
+        return {tuple(row) for row in self._query("SELECT namespace, key FROM entries")}
+
+    def usage(self) -> dict[str, tuple[int, int]]:
+        """Entry count and total bytes per namespace."""
+        rows = self._query(
+            "SELECT namespace, COUNT(*), SUM(size) FROM entries GROUP BY namespace"
+        )
+        return {namespace: (count, size) for namespace, count, size in rows}
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._query("DELETE FROM entries")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class ResultCache:
+    """Content-addressed store for conversion results.
+
+    Entries live under ``<directory>/<namespace>/<key[:2]>/<key>`` and are
+    tracked in a :class:`CacheIndex`. The cache stays within ``max_size_mb`` by
+    evicting the least recently used entries, and entries older than
+    ``ttl_seconds`` are treated as misses. Cache failures are logged and never
+    fail a conversion.
+
+    Hits are also kept in a :class:`MemoryCache` (L1) in front of the disk
+    store (L2). The disk store may be shared by several processes: entries are
+    published atomically, and :meth:`single_flight` lets one producer compute
+    an entry while the others wait for it.
+    """
+
+    def __init__(self, config: CacheConfig) -> None:
+        """Initialize cache.
+
+        Args:
+            config: Cache configuration
+        """
+        self.config = config
+        self.directory = (
+            Path(config.directory) if config.directory else default_cache_directory()
+        )
+        self.index = CacheIndex(self.directory / "index.sqlite3")
+        self.memory = MemoryCache(config.memory_size_mb * 1024 * 1024)
+        self._flights: dict[tuple[str, str], _Flight] = {}
+
+        # Memory hits not yet recorded in the index
+        self._touch_lock = threading.Lock()
+        self._touches: dict[tuple[str, str], float] = {}
+        self._touches_since = 0.0
+
+        self._counter_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether the cache is in use."""
+        return self.config.enabled
+
+    @property
+    def max_size_bytes(self) -> int:
+        """Size limit in bytes."""
+        return self.config.max_size_mb * 1024 * 1024
+
+    def stats(self) -> CacheStats:
+        """Counters since this cache object was created.
+
+        Returns:
+            Hit, miss, eviction and expiration counts
+        """
+        with self._counter_lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                expirations=self._expirations,
+            )
+
+    def usage(self) -> dict[str, tuple[int, int]]:
+        """Entry count and total bytes per namespace.
+
+        Returns:
+            Mapping of namespace to ``(entries, bytes)``
+        """
+        return self.index.usage()
+
+    def _count(self, counter: str, amount: int = 1) -> None:
+        """Increment a statistics counter."""
+        with self._counter_lock:
+            setattr(self, counter, getattr(self, counter) + amount)
+
+    def _entry_path(self, namespace: str, key: str) -> Path:
+        """Path of the entry for a key."""
+        return self.directory / namespace / key[:2] / key
+
+    def _is_expired(self, created: float, now: float) -> bool:
+        """Whether an entry created at a timestamp is past its TTL."""
+        return self.config.ttl_seconds > 0 and now - created > self.config.ttl_seconds
+
+    def _record_access(self, memory_key: tuple[str, str], now: float) -> None:
+        """Queue an access served from memory for the index.
+
+        Args:
+            memory_key: ``(namespace, key)`` of the entry
+            now: Access time
+        """
+        with self._touch_lock:
+            if not self._touches:
+                self._touches_since = now
+            self._touches[memory_key] = now
+            due = (
+                len(self._touches) >= _TOUCH_BATCH
+                or now - self._touches_since >= _TOUCH_INTERVAL_SECONDS
+            )
+        if due:
+            self._flush_touches()
+
+    def _flush_touches(self) -> None:
+        """Write queued memory hits to the index."""
+        with self._touch_lock:
+            touches, self._touches = self._touches, {}
+        if not touches:
+            return
+        try:
+            self.index.touch_many(touches)
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to record cache accesses: {e}")
+
+    def _remove(self, namespace: str, key: str) -> None:
+        """Delete an entry's file and index row."""
+        self._entry_path(namespace, key).unlink(missing_ok=True)
+        self.index.remove(namespace, key)
+
+    def _lookup(self, namespace: str, key: str) -> tuple[Path, bool, float] | None:
+        """Find a live entry and record the access.
+
+        Returns:
+            ``(path, compressed, created)`` on a hit, None on a miss
+        """
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        try:
+            row = self.index.lookup(namespace, key)
+            if row is None:
+                return None
+
+            created, compressed = row
+            entry = self._entry_path(namespace, key)
+            if self._is_expired(created, now):
+                self._remove(namespace, key)
+                self._count("_expirations")
+                return None
+            if not entry.is_file():
+                self.index.remove(namespace, key)
+                return None
+
+            self.index.touch(namespace, key, now)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Cache lookup failed for {namespace}/{key[:12]}: {e}")
+            return None
+
+        return entry, compressed, created
+
+    def get(self, namespace: str, key: str) -> Path | None:
+        """Look up an entry.
+
+        Args:
+            namespace: Cache namespace (e.g. ``pages``)
+            key: Cache key
+
+        Returns:
+            Path to the stored file (gzipped for compressed namespaces), or
+            None on a miss
+        """
+        found = self._lookup(namespace, key)
+        return found[0] if found else None
+
+    def fetch(
+        self,
+        namespace: str,
+        key: str,
+        destination: PathLike,
+        link: bool = False,
+    ) -> bool:
+        """Copy a cached entry to a destination path.
+
+        Args:
+            namespace: Cache namespace
+            key: Cache key
+            destination: Where to write the cached content
+            link: Hardlink instead of copying when the filesystem allows it.
+                The destination then shares its inode with the entry, so
+                editing it in place changes the cached copy.
+
+        Returns:
+            True on a hit, False on a miss
+        """
+        destination = Path(destination)
+        memory_key = (namespace, key)
+        # A copy must not write through an earlier hit's hardlink
+        _unshare(destination)
+
+        # L1: the content is already in memory
+        if not link and (cached := self.memory.get(memory_key)):
+            content, created = cached
+            if not self._is_expired(created, time.time()):
+                try:
+                    destination.write_bytes(content)
+                except OSError as e:
+                    logger.warning(f"Failed to write {destination}: {e}")
+                    self._count("_misses")
+                    return False
+                self._record_access(memory_key, time.time())
+                self._count("_hits")
+                return True
+            self.memory.discard(memory_key)
+
+        # L2: the shared on-disk store
+        found = self._lookup(namespace, key)
+        if found is None:
+            self._count("_misses")
+            return False
+
+        entry, compressed, created = found
+        try:
+            if link and not compressed and _hardlink(entry, destination):
+                pass
+            elif entry.stat().st_size > self.memory.max_entry_bytes:
+                opener = gzip.open if compressed else open
+                with opener(entry, "rb") as src, open(destination, "wb") as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                content = entry.read_bytes()
+                if compressed:
+                    content = gzip.decompress(content)
+                destination.write_bytes(content)
+                self.memory.put(memory_key, content, created)
+        except OSError as e:
+            logger.warning(f"Failed to read cache entry {entry}: {e}")
+            self._count("_misses")
+            return False
+
+        self._count("_hits")
+        logger.debug(f"Cache hit: {namespace}/{key[:12]}")
+        return True
+
+    def put(self, namespace: str, key: str, source: PathLike) -> None:
+        """Store a file under a key.
+
+        Args:
+            namespace: Cache namespace
+            key: Cache key
+            source: File whose content is cached
+        """
+        if not self.enabled:
+            return
+
+        entry = self._entry_path(namespace, key)
+        compressed = self.config.compression and namespace in _COMPRESSED_NAMESPACES
+        try:
+            ensure_directory(entry.parent)
+            with open(source, "rb") as src, atomic_write(entry, "wb") as dst:
+                if compressed:
+                    with gzip.GzipFile(fileobj=dst, mode="wb", mtime=0) as gz:
+                        shutil.copyfileobj(src, gz)
+                else:
+                    shutil.copyfileobj(src, dst)
+            # mkstemp creates 0600 files; hardlinked hits must look like
+            # any other output
+            os.chmod(entry, default_file_mode())
+
+            now = time.time()
+            self.index.add(namespace, key, entry.stat().st_size, compressed, now)
+            self._enforce_size_limit()
+
+            if Path(source).stat().st_size <= self.memory.max_entry_bytes:
+                self.memory.put((namespace, key), Path(source).read_bytes(), now)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Failed to write cache entry {entry}: {e}")
+            return
+
+        logger.debug(f"Cached {namespace}/{key[:12]}")
+
+    @asynccontextmanager
+    async def single_flight(
+        self, namespace: str, key: str | None
+    ) -> AsyncIterator[None]:
+        """Let one producer at a time compute an entry.
+
+        Tasks in this process queue on an asyncio lock. Other processes
+        sharing the cache directory queue on an advisory file lock. Callers
+        should check the cache again once inside, because a waiter usually
+        finds the entry the previous holder just published. This is a no-op
+        when the cache is disabled or ``key`` is None.
+
+        Args:
+            namespace: Cache namespace
+            key: Cache key, or None to skip locking
+        """
+        if not self.enabled or key is None:
+            yield
+            return
+
+        name = (namespace, key)
+        flight = self._flights.setdefault(name, _Flight())
+        flight.holders += 1
+        try:
+            async with flight.lock:
+                handle = await self._acquire_file_lock(namespace, key)
+                try:
+                    yield
+                finally:
+                    if handle is not None:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+                        handle.close()
+        finally:
+            flight.holders -= 1
+            if not flight.holders:
+                del self._flights[name]
+
+    async def _acquire_file_lock(self, namespace: str, key: str) -> IO[bytes] | None:
+        """Take the cross-process lock for a key without blocking a thread.
+
+        Returns:
+            Open lock file, or None if advisory locking is unavailable
+        """
+        if fcntl is None:
+            return None
+
+        path = self.directory / _LOCK_DIR / f"{namespace}-{key}.lock"
+        delay = 0.01
+        while True:
+            try:
+                ensure_directory(path.parent)
+                handle = open(path, "ab")  # noqa: SIM115 - closed by single_flight
+            except OSError as e:
+                logger.warning(
+                    f"Cache lock unavailable for {namespace}/{key[:12]}: {e}"
+                )
+                return None
+
+            try:
+                while True:
+                    try:
+                        fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                        break
+                    except BlockingIOError:
+                        await asyncio.sleep(delay)
+                        delay = min(delay * 2, 0.5)
+
+                # prune() may have removed the file while we waited; a lock
+                # on an unlinked file excludes nobody, so start over.
+                if _is_current(handle, path):
+                    # Marks the lock as in use so prune() keeps it
+                    os.utime(path)
+                    return handle
+            except OSError as e:
+                logger.warning(f"Cache lock failed for {namespace}/{key[:12]}: {e}")
+                handle.close()
+                return None
+
+            handle.close()
+
+    def _enforce_size_limit(self) -> int:
+        """Evict least recently used entries until under ``max_size_mb``.
+
+        Returns:
+            Number of evicted entries
+        """
+        total = self.index.total_size()
+        if total <= self.max_size_bytes:
+            return 0
+
+        # Entries used from memory are not the least recently used
+        self._flush_touches()
+
+        target = int(self.max_size_bytes * _EVICTION_TARGET)
+        evicted = 0
+        while total > target:
+            batch = self.index.least_recent(256)
+            if not batch:
+                break
+            for namespace, key, size in batch:
+                self._remove(namespace, key)
+                total -= size
+                evicted += 1
+                if total <= target:
+                    break
+
+        self._count("_evictions", evicted)
+        logger.debug(f"Evicted {evicted} cache entries")
+        return evicted
+
+    def prune(self) -> dict[str, int]:
+        """Expire old entries, drop orphans and enforce the size limit.
+
+        Unlike lookups, this walks the cache directory, so it also removes
+        files the index does not know about (e.g. interrupted writes).
+
+        Returns:
+            Counts of ``expired``, ``orphaned`` and ``evicted`` entries
+        """
+        removed = {"expired": 0, "orphaned": 0, "evicted": 0}
+
+        if self.config.ttl_seconds > 0:
+            cutoff = time.time() - self.config.ttl_seconds
+            for namespace, key, _size in self.index.created_before(cutoff):
+                self._remove(namespace, key)
+                removed["expired"] += 1
+            self._count("_expirations", removed["expired"])
+
+        known = self.index.keys()
+        on_disk: set[tuple[str, str]] = set()
+        grace_cutoff = time.time() - _ORPHAN_GRACE_SECONDS
+        for namespace_dir in self._namespace_dirs():
+            for path in namespace_dir.glob("*/*"):
+                entry = (namespace_dir.name, path.name)
+                if entry in known:
+                    on_disk.add(entry)
+                    continue
+                try:
+                    if path.stat().st_mtime > grace_cutoff:
+                        continue
+                except OSError:
+                    continue
+                path.unlink(missing_ok=True)
+                removed["orphaned"] += 1
+
+        for namespace, key in known - on_disk:
+            self.index.remove(namespace, key)
+            removed["orphaned"] += 1
+
+        removed["evicted"] = self._enforce_size_limit()
+        self._prune_locks()
+        return removed
+
+    def _prune_locks(self) -> None:
+        """Delete lock files that are old and not currently held."""
+        lock_dir = self.directory / _LOCK_DIR
+        if fcntl is None or not lock_dir.is_dir():
+            return
+
+        cutoff = time.time() - _STALE_LOCK_SECONDS
+        for path in lock_dir.iterdir():
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                with open(path, "ab") as handle:
+                    fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    # Only unlink while holding the lock, so a process that
+                    # opened the file meanwhile sees it is gone and retries.
+                    if _is_current(handle, path):
+                        path.unlink()
+            except OSError:
+                continue
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        for namespace_dir in self._namespace_dirs():
+            shutil.rmtree(namespace_dir, ignore_errors=True)
+        if self.index.path.exists():
+            self.index.clear()
+        self.memory.clear()
+
+    def _namespace_dirs(self) -> list[Path]:
+        """Existing namespace directories."""
+        if not self.directory.is_dir():
+            return []
+        return [
+            p for p in self.directory.iterdir() if p.is_dir() and p.name != _LOCK_DIR
+        ]
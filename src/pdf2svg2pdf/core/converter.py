@@ -5,8 +5,12 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import shutil
+import time
+from collections.abc import AsyncGenerator
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
@@ -17,14 +21,22 @@ from ..types import (
     PageInfo,
     PathLike,
     ProcessingMetrics,
+    ProcessingStatus,
     ProgressCallback,
 )
-from ..utils.io import ensure_directory, safe_temp_directory
+from ..utils.async_utils import run_async
+from ..utils.io import ensure_directory, get_page_count, safe_temp_directory
 from ..utils.validation import validate_file_size, validate_path
+from .cache import cache_key, document_page_digests, file_digest, page_digest
 from .exceptions import ProcessingError, ValidationError
+from .merge import OrderedMerge
+from .optimize import optimize_pdf
 from .pipeline import ProcessingPipeline
+from .planner import plan_conversion
 
 if TYPE_CHECKING:
+    from ..backends.base import Backend
+    from ..backends.fitz import FitzBackend
     from ..config import Configuration
 
 
@@ -44,7 +56,6 @@ class Converter:
         """
         self.config = config
         self.progress_callback = progress_callback
-        self.pipeline = ProcessingPipeline(config)
 
         # Set up logging
         config.setup_logging()
@@ -55,16 +66,32 @@ class Converter:
         # Initialize filters
         self._init_filters()
 
+        # Choose backends and build filters once for every page and document
+        self.plan = plan_conversion(config)
+        self.pipeline = ProcessingPipeline(config, self.plan)
+
     def _init_backends(self) -> None:
         """Initialize and validate backends."""
         # Import the backend registry lazily to avoid a core<->backends import
         # cycle (backends.base imports core.exceptions).
-        from ..backends import CairoBackend, FitzBackend, PopplerBackend
+        from ..backends import (
+            CairoBackend,
+            FitzBackend,
+            InkscapeBackend,
+            MutoolBackend,
+            PopplerBackend,
+            QpdfBackend,
+            RsvgBackend,
+        )
         from ..backends.base import registry as backend_registry
 
         backend_registry.register(PopplerBackend)
         backend_registry.register(FitzBackend)
         backend_registry.register(CairoBackend)
+        backend_registry.register(MutoolBackend)
+        backend_registry.register(RsvgBackend)
+        backend_registry.register(QpdfBackend)
+        backend_registry.register(InkscapeBackend)
 
         # Check availability
         available = backend_registry.get_available(config=self.config)
@@ -73,6 +100,10 @@ class Converter:
                 "No backends available. Please install required dependencies.",
                 details={
                     "poppler": "apt-get install poppler-utils",
+                    "mutool": "apt-get install mupdf-tools",
+                    "rsvg": "apt-get install librsvg2-bin",
+                    "qpdf": "apt-get install qpdf",
+                    "inkscape": "apt-get install inkscape",
                     "pymupdf": "pip install PyMuPDF",
                     "cairo": "apt-get install libcairo2",
                 },
@@ -83,17 +114,9 @@ class Converter:
     def _init_filters(self) -> None:
         """Initialize filter registries."""
         # Register all filter implementations
-        from ..filters import (
-            GrayscaleFilter,
-            PDFCompressFilter,
-            SVGOptimizeFilter,
-            SVGTransparentWhiteFilter,
-        )
+        from ..filters import register_builtin_filters
 
-        pdf_filter_registry.register(GrayscaleFilter)
-        pdf_filter_registry.register(PDFCompressFilter)
-        svg_filter_registry.register(SVGOptimizeFilter)
-        svg_filter_registry.register(SVGTransparentWhiteFilter)
+        register_builtin_filters()
 
         logger.info(
             f"Registered PDF filters: {list(pdf_filter_registry.get_all().keys())}"
@@ -102,6 +125,58 @@ class Converter:
             f"Registered SVG filters: {list(svg_filter_registry.get_all().keys())}"
         )
 
+    def _document_cache_key(self, input_path: Path) -> str:
+        """Key a whole conversion by input content, settings and backends.
+
+        Args:
+            input_path: Input PDF
+
+        Returns:
+            Cache key for the converted document
+        """
+        return cache_key(file_digest(input_path), self.plan.document_fingerprint)
+
+    def _cached_result(
+        self,
+        input_path: Path,
+        output_path: Path,
+        started: float,
+    ) -> ConversionResult:
+        """Build the result for a conversion served from the document cache.
+
+        Args:
+            input_path: Input PDF
+            output_path: Output PDF written from the cache
+            started: ``time.perf_counter()`` value when the conversion began
+
+        Returns:
+            Conversion result with cache-hit metrics
+        """
+        page_count = get_page_count(output_path)
+        metrics = ProcessingMetrics(
+            total_pages=page_count,
+            processed_pages=page_count,
+            failed_pages=0,
+            processing_time_ms=(time.perf_counter() - started) * 1000,
+            memory_usage_mb=0,
+            input_file_size_mb=input_path.stat().st_size / (1024 * 1024),
+            output_file_size_mb=output_path.stat().st_size / (1024 * 1024),
+            cache_hit=True,
+            cache_stats=self.pipeline.cache.stats(),
+        )
+
+        if self.progress_callback:
+            self.progress_callback(1.0, "Conversion complete (cached)")
+
+        logger.info(f"Served {output_path} from the document cache")
+
+        return ConversionResult(
+            success=True,
+            output_path=output_path,
+            error=None,
+            metrics=metrics,
+        )
+
     async def convert(
         self,
         input_path: PathLike,
@@ -118,7 +193,7 @@ class Converter:
         Returns:
             Conversion result
         """
-        from ..backends.base import registry as backend_registry
+        started = time.perf_counter()
 
         try:
             # Validate input
@@ -150,102 +225,497 @@ class Converter:
                 output_path = Path(output_path)
                 ensure_directory(output_path.parent)
 
-            # Process the file
-            logger.info(f"Converting {input_path} to {output_path}")
+            # Serve a previously converted identical document. While another
+            # task or process converts the same document we wait here, then
+            # find its output in the cache.
+            cache = self.pipeline.cache
+            document_key = None
+            if cache.enabled:
+                document_key = await run_async(self._document_cache_key, input_path)
+
+            async with cache.single_flight("documents", document_key):
+                if document_key:
+                    hit = await run_async(
+                        cache.fetch,
+                        "documents",
+                        document_key,
+                        output_path,
+                        self.config.cache.link_outputs,
+                    )
+                    if hit:
+                        return self._cached_result(input_path, output_path, started)
 
-            with safe_temp_directory(
-                cleanup=self.config.processing.cleanup_on_error
-            ) as temp_dir:
-                # Create subdirectories
-                pdf_pages_dir = ensure_directory(temp_dir / "pdf_pages")
-                svg_dir = ensure_directory(temp_dir / "svg")
-                pdf_output_dir = ensure_directory(temp_dir / "pdf_output")
+                # An earlier cache hit may have hardlinked the output to a
+                # cache entry; unlink it so backends that rewrite in place
+                # cannot corrupt the cached copy.
+                if output_path.exists() and output_path.stat().st_nlink > 1:
+                    output_path.unlink()
 
-                # Split PDF into pages
-                if self.progress_callback:
-                    self.progress_callback(0.1, "Splitting PDF into pages")
+                # Process the file
+                logger.info(f"Converting {input_path} to {output_path}")
+                result = await self._convert_document(input_path, output_path, started)
 
-                split_backend = backend_registry.find_best(
-                    BackendCapability.PDF_SPLIT,
-                    self.config,
-                )
-                page_paths = await split_backend.split_pdf(
-                    input_path,
-                    pdf_pages_dir,
+                # Only complete conversions are worth serving again
+                metrics = result["metrics"]
+                if document_key and metrics and metrics.failed_pages == 0:
+                    await run_async(cache.put, "documents", document_key, output_path)
+
+                return result
+
+        except Exception as e:
+            logger.error(f"Conversion failed: {e}")
+            return ConversionResult(
+                success=False,
+                output_path=None,
+                error=str(e),
+                metrics=None,
+            )
+
+    async def _convert_document(
+        self,
+        input_path: Path,
+        output_path: Path,
+        started: float,
+    ) -> ConversionResult:
+        """Split, process and merge a validated input.
+
+        Args:
+            input_path: Input PDF
+            output_path: Output PDF
+            started: ``time.perf_counter()`` value when the conversion began
+
+        Returns:
+            Conversion result
+        """
+        from ..backends.fitz import FitzBackend
+
+        plan = self.plan
+        if plan.uses(BackendCapability.DOCUMENT_ROUND_TRIP):
+            backend = plan.backend_for("split")
+            assert isinstance(backend, FitzBackend)
+            return await self._convert_in_memory(
+                backend, input_path, output_path, started
+            )
+
+        cache = self.pipeline.cache
+
+        with safe_temp_directory(
+            cleanup=self.config.processing.cleanup_on_error
+        ) as temp_dir:
+            # Create subdirectories
+            pdf_pages_dir = ensure_directory(temp_dir / "pdf_pages")
+            svg_dir = ensure_directory(temp_dir / "svg")
+            pdf_output_dir = ensure_directory(temp_dir / "pdf_output")
+
+            page_count = await run_async(get_page_count, input_path)
+            split_step = plan.step_for("split")
+            split_backend = (
+                split_step.backend
+                if split_step.capability == BackendCapability.PDF_SPLIT
+                else None
+            )
+
+            # A backend that renders every SVG into the output in one call
+            # replaces per-page SVG to PDF and the merge
+            fused_to_pdf = plan.uses(BackendCapability.SVG_TO_PDF_MERGE)
+
+            pages: list[PageInfo] = []
+            # First page of each group of identical pages, keyed by digest
+            representatives: dict[str, PageInfo] = {}
+            # Digests whose representative has its result, and duplicates
+            # found while it was still converting
+            settled: set[str] = set()
+            waiting: dict[str, list[PageInfo]] = {}
+            # Split pages flow to the page workers through a bounded queue;
+            # None tells a worker the split is done.
+            queue: asyncio.Queue[PageInfo | None] = asyncio.Queue(plan.queue_depth)
+            workers = plan.parallel_pages
+            finished = 0
+
+            # Backends that append pages one at a time merge each page once
+            # every earlier page is in, instead of after the last page
+            merge_backend = plan.backend_for("merge")
+            merge = None
+            if (
+                not fused_to_pdf
+                and BackendCapability.INCREMENTAL_MERGE in merge_backend.capabilities
+            ):
+                merge = OrderedMerge(
+                    merge_backend.open_merge(output_path),
+                    self.pipeline.stages,
+                    flush_pages=self.config.processing.flush_pages,
+                    discard=not self.config.processing.preserve_temp_files,
                 )
 
-                # Create page info objects
-                pages = [
-                    PageInfo(
-                        page_number=i,
-                        input_path=page_path,
-                        temp_pdf_path=page_path,
+            async def page_done(page: PageInfo) -> None:
+                nonlocal finished
+                # Duplicates share their representative's result
+                source = representatives[page.digest or ""]
+                if source is not page:
+                    page.status = source.status
+                    page.svg_path = source.svg_path
+                    page.output_pdf_path = source.output_pdf_path
+                    page.error = source.error
+
+                finished += 1
+                if self.progress_callback:
+                    self.progress_callback(
+                        0.1 + 0.8 * finished / page_count,
+                        f"Processing page {finished}/{page_count}",
                     )
-                    for i, page_path in enumerate(page_paths)
-                ]
 
-                # Process pages through pipeline
-                if self.progress_callback:
-                    self.progress_callback(0.2, "Processing pages")
+                if merge:
+                    completed = page.status == ProcessingStatus.COMPLETED
+                    await merge.add(
+                        page.page_number,
+                        page.output_pdf_path if completed else None,
+                        page.digest,
+                    )
 
-                processed_pages = await self.pipeline.process_pages(
-                    pages,
-                    svg_dir,
-                    pdf_output_dir,
-                    self.progress_callback,
-                )
+            async def split() -> None:
+                input_digests = None
+                async with contextlib.aclosing(
+                    self._stream_pages(
+                        input_path, pdf_pages_dir, split_backend, page_count
+                    )
+                ) as stream:
+                    async for page in stream:
+                        pages.append(page)
+                        # Pages addressed inside the input have no file of
+                        # their own, so they are hashed inside the input.
+                        if page.input_path == input_path:
+                            if input_digests is None:
+                                input_digests = await run_async(
+                                    self._input_page_digests, input_path, page_count
+                                )
+                            page.digest = input_digests[page.page_index]
+                        else:
+                            page.digest = await run_async(page_digest, page.input_path)
+
+                        # Convert one representative of every group of
+                        # identical pages
+                        if representatives.setdefault(page.digest, page) is page:
+                            await queue.put(page)
+                            continue
+
+                        self._discard_split_page(page)
+                        if page.digest in settled:
+                            await page_done(page)
+                        else:
+                            waiting.setdefault(page.digest, []).append(page)
+
+                for _ in range(workers):
+                    await queue.put(None)
+
+            async def convert() -> None:
+                while (page := await queue.get()) is not None:
+                    await self.pipeline.process_page(
+                        page,
+                        svg_dir,
+                        pdf_output_dir,
+                        svg_only=fused_to_pdf,
+                        pdf_pages_dir=pdf_pages_dir,
+                    )
+                    self._discard_split_page(page)
+                    digest = page.digest or ""
+                    settled.add(digest)
+                    await page_done(page)
+                    for duplicate in waiting.pop(digest, []):
+                        await page_done(duplicate)
+
+            if self.progress_callback:
+                self.progress_callback(0.1, "Processing pages")
+
+            try:
+                async with asyncio.TaskGroup() as group:
+                    group.create_task(split())
+                    for _ in range(workers):
+                        group.create_task(convert())
 
-                # Merge processed PDFs
                 if self.progress_callback:
                     self.progress_callback(0.9, "Merging processed pages")
-
-                merge_backend = backend_registry.find_best(
-                    BackendCapability.PDF_MERGE,
-                    self.config,
+                if merge:
+                    await merge.finish()
+            except ExceptionGroup as e:
+                # Report the failure that stopped the conversion
+                raise e.exceptions[0] from None
+            finally:
+                if merge:
+                    merge.close()
+                # Stop renders that ran ahead for pages nobody waits for now
+                await plan.backend_for("to_svg").release(temp_dir)
+
+            duplicates = len(pages) - len(representatives)
+            if duplicates:
+                logger.info(
+                    f"Found {duplicates} duplicate pages; "
+                    f"converted {len(representatives)} distinct pages"
                 )
 
-                output_pdfs: list[str | Path] = [
-                    p.output_pdf_path
+            processed_pages = [
+                page for page in pages if page.status == ProcessingStatus.COMPLETED
+            ]
+
+            if merge is None:
+                page_outputs: list[PathLike] = [
+                    output
                     for p in processed_pages
-                    if p.output_pdf_path and p.output_pdf_path.exists()
+                    if (output := p.svg_path if fused_to_pdf else p.output_pdf_path)
+                    and output.exists()
                 ]
 
-                if not output_pdfs:
+                if not page_outputs:
                     raise ProcessingError("No pages were successfully processed")
 
-                await merge_backend.merge_pdfs(output_pdfs, output_path)
-
-                # Calculate metrics
-                metrics = ProcessingMetrics(
-                    total_pages=len(pages),
-                    processed_pages=len(output_pdfs),
-                    failed_pages=len(pages) - len(output_pdfs),
-                    processing_time_ms=0,  # TODO: Add timing
-                    memory_usage_mb=0,  # TODO: Add memory tracking
-                    input_file_size_mb=input_path.stat().st_size / (1024 * 1024),
-                    output_file_size_mb=output_path.stat().st_size / (1024 * 1024),
-                )
+                async with self.pipeline.stages.stage("merge"):
+                    if fused_to_pdf:
+                        await merge_backend.svgs_to_pdf(page_outputs, output_path)
+                    elif len(pages) == 1:
+                        # Nothing to merge; the page is the document
+                        await run_async(shutil.copyfile, page_outputs[0], output_path)
+                    else:
+                        await merge_backend.merge_pdfs(page_outputs, output_path)
+
+            # Share fonts, images and ICC profiles repeated across pages
+            bytes_saved = 0
+            if self.config.compress_output:
+                if self.progress_callback:
+                    self.progress_callback(0.95, "Optimizing output")
+                bytes_saved = await run_async(optimize_pdf, output_path)
+
+            # Calculate metrics
+            metrics = ProcessingMetrics(
+                total_pages=len(pages),
+                processed_pages=len(processed_pages),
+                failed_pages=len(pages) - len(processed_pages),
+                processing_time_ms=(time.perf_counter() - started) * 1000,
+                memory_usage_mb=0,  # TODO: Add memory tracking
+                input_file_size_mb=input_path.stat().st_size / (1024 * 1024),
+                output_file_size_mb=output_path.stat().st_size / (1024 * 1024),
+                cache_stats=cache.stats() if cache.enabled else None,
+                duplicate_pages=len(pages) - len(representatives),
+                optimized_bytes_saved=bytes_saved,
+            )
+
+            if self.progress_callback:
+                self.progress_callback(1.0, "Conversion complete")
+
+            logger.info(f"Successfully converted to {output_path}")
+
+            return ConversionResult(
+                success=True,
+                output_path=output_path,
+                error=None,
+                metrics=metrics,
+            )
+
+    async def _convert_in_memory(
+        self,
+        backend: FitzBackend,
+        input_path: Path,
+        output_path: Path,
+        started: float,
+    ) -> ConversionResult:
+        """Convert a document without subprocesses or intermediate files.
+
+        Pages are rendered to SVG straight from the input, filtered, converted
+        back to PDF in the backend's worker processes and appended to the
+        output in page order as soon as all earlier pages are in.
+        Pages whose filtered SVG is identical are converted once and share
+        one page in the output.
+
+        Args:
+            backend: Fitz backend that handles every stage
+            input_path: Input PDF
+            output_path: Output PDF
+            started: ``time.perf_counter()`` value when the conversion began
+
+        Returns:
+            Conversion result
+        """
+        cache = self.pipeline.cache
+        page_count = await run_async(get_page_count, input_path)
+        semaphore = asyncio.Semaphore(self.plan.parallel_pages)
+        conversions: dict[str, asyncio.Task[bytes]] = {}
+
+        stages = self.pipeline.stages
+
+        async def to_pdf(svg: str) -> bytes:
+            async with stages.stage("svg_to_pdf"):
+                return await backend.svg_to_pdf_bytes(svg)
+
+        async def convert_page(index: int) -> tuple[str, bytes]:
+            async with semaphore:
+                async with stages.stage("pdf_to_svg"):
+                    svg = await backend.page_svg(input_path, index)
+                svg = await self.pipeline.apply_svg_filters(svg)
+                digest = cache_key(svg)
+                if digest not in conversions:
+                    conversions[digest] = asyncio.create_task(to_pdf(svg))
+                return digest, await conversions[digest]
+
+        if self.progress_callback:
+            self.progress_callback(0.1, "Processing pages")
+
+        tasks = [asyncio.create_task(convert_page(i)) for i in range(page_count)]
+        merge = OrderedMerge(
+            backend.open_merge(output_path),
+            stages,
+            flush_pages=self.config.processing.flush_pages,
+        )
+        # Digests of the distinct converted pages
+        distinct: set[str] = set()
+        failed = 0
+
+        try:
+            for index, task in enumerate(tasks):
+                try:
+                    digest, pdf = await task
+                except Exception as e:
+                    if not self.config.processing.cleanup_on_error:
+                        raise ProcessingError(
+                            f"Failed to process page {index}",
+                            page_number=index,
+                            stage="pipeline",
+                        ) from e
+                    failed += 1
+                    logger.error(f"Failed to process page {index}: {e}")
+                    await merge.add(index, None)
+                    continue
+
+                distinct.add(digest)
+                await merge.add(index, pdf, digest)
 
                 if self.progress_callback:
-                    self.progress_callback(1.0, "Conversion complete")
+                    self.progress_callback(
+                        0.1 + 0.8 * (index + 1) / page_count,
+                        f"Processing page {index + 1}/{page_count}",
+                    )
+
+            await merge.finish()
+        finally:
+            pending: list[asyncio.Task[Any]] = [*tasks, *conversions.values()]
+            for task in pending:
+                task.cancel()
+            merge.close()
+
+        # Share fonts, images and ICC profiles repeated across pages
+        bytes_saved = 0
+        if self.config.compress_output:
+            if self.progress_callback:
+                self.progress_callback(0.95, "Optimizing output")
+            bytes_saved = await run_async(optimize_pdf, output_path)
+
+        processed = page_count - failed
+        metrics = ProcessingMetrics(
+            total_pages=page_count,
+            processed_pages=processed,
+            failed_pages=failed,
+            processing_time_ms=(time.perf_counter() - started) * 1000,
+            memory_usage_mb=0,
+            input_file_size_mb=input_path.stat().st_size / (1024 * 1024),
+            output_file_size_mb=output_path.stat().st_size / (1024 * 1024),
+            cache_stats=cache.stats() if cache.enabled else None,
+            duplicate_pages=processed - len(distinct),
+            optimized_bytes_saved=bytes_saved,
+        )
+
+        if self.progress_callback:
+            self.progress_callback(1.0, "Conversion complete")
+
+        logger.info(f"Successfully converted {input_path} in memory to {output_path}")
+
+        return ConversionResult(
+            success=True,
+            output_path=output_path,
+            error=None,
+            metrics=metrics,
+        )
+
+    async def _stream_pages(
+        self,
+        input_path: Path,
+        pdf_pages_dir: Path,
+        split_backend: Backend | None,
+        page_count: int,
+    ) -> AsyncGenerator[PageInfo, None]:
+        """Locate the pages of an input, splitting it only when needed.
+
+        Single-page inputs are used as they are. Without a split step in the
+        plan (``processing.split_pages`` off, or a backend that renders SVGs
+        straight from the input), every page is addressed by index.
+        Otherwise each page is yielded as soon as the split has written it.
 
-                logger.info(f"Successfully converted to {output_path}")
+        Args:
+            input_path: Input PDF
+            pdf_pages_dir: Directory for split pages
+            split_backend: Backend of the plan's split step, if it has one
+            page_count: Pages in the input
 
-                return ConversionResult(
-                    success=True,
-                    output_path=output_path,
-                    error=None,
-                    metrics=metrics,
+        Yields:
+            Pages in document order
+        """
+        if page_count == 1 or split_backend is None:
+            for i in range(page_count):
+                yield PageInfo(
+                    page_number=i,
+                    input_path=input_path,
+                    temp_pdf_path=input_path,
+                    source_path=input_path,
+                    page_index=i,
                 )
+            return
+
+        async with (
+            contextlib.aclosing(
+                split_backend.split_pages(input_path, pdf_pages_dir)
+            ) as page_paths,
+            contextlib.aclosing(
+                self.pipeline.stages.stream("split", page_paths)
+            ) as split_paths,
+        ):
+            index = 0
+            async for page_path in split_paths:
+                yield PageInfo(
+                    page_number=index,
+                    input_path=page_path,
+                    temp_pdf_path=page_path,
+                    source_path=input_path,
+                    page_index=index,
+                )
+                index += 1
+
+    @staticmethod
+    def _input_page_digests(input_path: Path, page_count: int) -> list[str]:
+        """Hash the pages of an unsplit input.
 
+        Args:
+            input_path: Input PDF
+            page_count: Number of pages in the input
+
+        Returns:
+            Content digest per page, or input digest and page index for
+            inputs whose objects cannot be walked
+        """
+        try:
+            return document_page_digests(input_path)
         except Exception as e:
-            logger.error(f"Conversion failed: {e}")
-            return ConversionResult(
-                success=False,
-                output_path=None,
-                error=str(e),
-                metrics=None,
-            )
+            logger.debug(f"Keying pages of {input_path} by position: {e}")
+            input_digest = file_digest(input_path)
+            return [cache_key(input_digest, str(i)) for i in range(page_count)]
+
+    def _discard_split_page(self, page: PageInfo) -> None:
+        """Delete a page's split and filtered files once nothing reads them.
+
+        Args:
+            page: Converted or duplicate page
+        """
+        if self.config.processing.preserve_temp_files:
+            return
+        for path in {page.input_path, page.temp_pdf_path}:
+            # Addressed pages point into the input itself
+            if path is not None and path != page.source_path:
+                path.unlink(missing_ok=True)
 
     def convert_sync(
         self,
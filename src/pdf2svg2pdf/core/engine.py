@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/core/engine.py
+"""Process-pool engine for the pipeline's in-process Python work."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, Literal
+
+from ..filters.base import ChainFilter, pdf_filter_registry, svg_filter_registry
+from ..utils.security import sanitize_svg_content
+from ..utils.workers import WorkerPool
+from .exceptions import ProcessingError
+
+if TYPE_CHECKING:
+    from ..config import Configuration
+    from ..types import FilterConfig, SVGTrust
+
+type EngineStage = Literal["pdf", "svg"]
+
+# Filter functions built once in each worker by _warm_worker
+_stages: dict[str, Callable[[Any], Any]] = {}
+
+
+def filter_svg_content(
+    svg_content: str,
+    chain: ChainFilter,
+    sanitize: bool,
+    trust: SVGTrust,
+) -> str:
+    """Sanitize an SVG and run it through a filter chain.
+
+    Args:
+        svg_content: SVG document
+        chain: SVG filter chain
+        sanitize: Whether to sanitize before filtering
+        trust: Trust level passed to the sanitizer
+
+    Returns:
+        Filtered SVG; unchanged when the chain is empty
+    """
+    if not chain.filters:
+        return svg_content
+
+    # Sanitize SVG for security
+    if sanitize:
+        svg_content = sanitize_svg_content(svg_content, trust)
+
+    return chain(svg_content)
+
+
+def _warm_worker(
+    pdf_filters: list[FilterConfig],
+    svg_filters: list[FilterConfig],
+    sanitize: bool,
+    trust: SVGTrust,
+) -> None:
+    """Import backends, discover tools and build the filter chains once.
+
+    Args:
+        pdf_filters: PDF filter configurations
+        svg_filters: SVG filter configurations
+        sanitize: Whether SVGs are sanitized before filtering
+        trust: Trust level passed to the sanitizer
+    """
+    from .. import backends  # noqa: F401 - imports the rendering libraries
+    from ..filters import register_builtin_filters
+    from ..utils.tools import tools
+
+    register_builtin_filters()
+    # Filters that shell out (gs, svgo) look their tools up here
+    tools.all()
+
+    _stages["pdf"] = pdf_filter_registry.create_chain(pdf_filters, name="pdf_filters")
+    _stages["svg"] = partial(
+        filter_svg_content,
+        chain=svg_filter_registry.create_chain(svg_filters, name="svg_filters"),
+        sanitize=sanitize,
+        trust=trust,
+    )
+
+
+def _run_chunk(stage: EngineStage, items: list[Any]) -> list[tuple[bool, Any]]:
+    """Filter a chunk of pages in a worker.
+
+    Args:
+        stage: Which filter chain to run
+        items: Page contents
+
+    Returns:
+        ``(True, result)`` or ``(False, error message)`` per page, so one bad
+        page does not fail the rest of its chunk
+    """
+    run = _stages[stage]
+    results: list[tuple[bool, Any]] = []
+    for item in items:
+        try:
+            results.append((True, run(item)))
+        except Exception as e:
+            results.append((False, f"{type(e).__name__}: {e}"))
+    return results
+
+
+class ProcessEngine:
+    """Runs PDF and SVG filters in warm worker processes.
+
+    Workers import the backends, discover tools and build the filter chains
+    once when they start, so a task only carries page contents. Pages
+    submitted in the same event-loop iteration are sent together, up to
+    ``processing.chunk_size`` per task.
+    """
+
+    def __init__(self, config: Configuration) -> None:
+        """Initialize the engine; worker processes start on first use.
+
+        Args:
+            config: Configuration object
+        """
+        processing = config.processing
+        self.chunk_size = processing.chunk_size
+        self.timeout_seconds = processing.timeout_seconds
+        self._pool = WorkerPool(
+            processing.worker_processes or os.cpu_count() or 1,
+            partial(
+                _warm_worker,
+                config.pdf_filters,
+                config.svg_filters,
+                config.security.sanitize_svg,
+                config.security.svg_trust,
+            ),
+            name="pipeline",
+            processes=True,
+        )
+        # Pages waiting to be sent, per stage
+        self._queued: dict[EngineStage, list[tuple[Any, asyncio.Future[Any]]]] = {}
+        self._chunks: set[asyncio.Task[None]] = set()
+
+    async def filter_pdf(self, pdf_content: bytes) -> bytes:
+        """Run a page PDF through the PDF filter chain.
+
+        Args:
+            pdf_content: PDF bytes
+
+        Returns:
+            Filtered PDF bytes
+        """
+        result: bytes = await self._submit("pdf", pdf_content)
+        return result
+
+    async def filter_svg(self, svg_content: str) -> str:
+        """Sanitize a page SVG and run it through the SVG filter chain.
+
+        Args:
+            svg_content: SVG document
+
+        Returns:
+            Filtered SVG
+        """
+        result: str = await self._submit("svg", svg_content)
+        return result
+
+    async def _submit(self, stage: EngineStage, item: Any) -> Any:
+        """Queue a page for the next chunk of a stage.
+
+        Args:
+            stage: Which filter chain to run
+            item: Page content
+
+        Returns:
+            Filtered content
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        queue = self._queued.setdefault(stage, [])
+        queue.append((item, future))
+
+        if len(queue) >= self.chunk_size:
+            self._flush(stage)
+        elif len(queue) == 1:
+            # Send whatever else arrives before the loop comes back around
+            loop.call_soon(self._flush, stage)
+
+        return await future
+
+    def _flush(self, stage: EngineStage) -> None:
+        """Send a stage's queued pages to a worker as one task.
+
+        Args:
+            stage: Stage to flush
+        """
+        chunk = self._queued.pop(stage, [])
+        if chunk:
+            task = asyncio.create_task(self._run(stage, chunk))
+            self._chunks.add(task)
+            task.add_done_callback(self._chunks.discard)
+
+    async def _run(
+        self,
+        stage: EngineStage,
+        chunk: list[tuple[Any, asyncio.Future[Any]]],
+    ) -> None:
+        """Run a chunk in a worker and settle each page's future.
+
+        Args:
+            stage: Which filter chain to run
+            chunk: Pages and the futures their callers wait on
+        """
+        items = [item for item, _ in chunk]
+        try:
+            # The time limit applies per page
+            results = await self._pool.run(
+                _run_chunk,
+                stage,
+                items,
+                timeout=self.timeout_seconds * len(items),
+            )
+        except Exception as e:
+            for _, future in chunk:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), (ok, value) in zip(chunk, results, strict=True):
+            if future.done():
+                continue
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(
+                    ProcessingError(value, stage=f"{stage}_filter"),
+                )
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        self._pool.close()
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/core/merge.py
+"""Merge pages into the output in page order as they finish."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from loguru import logger
+
+from ..utils.async_utils import StageExecutors, run_async
+from .exceptions import ProcessingError
+
+if TYPE_CHECKING:
+    from ..backends.base import PageWriter
+
+
+class OrderedMerge:
+    """Appends finished pages to the output in page order.
+
+    Pages finish in any order. Each one waits in a reorder buffer until every
+    earlier page is in, then is appended and its page PDF deleted, so only
+    out-of-order pages stay on disk. Whichever caller hands over the next
+    missing page appends it along with every buffered page after it; the
+    others return at once.
+    """
+
+    def __init__(
+        self,
+        writer: PageWriter,
+        stages: StageExecutors,
+        flush_pages: int = 0,
+        discard: bool = True,
+    ) -> None:
+        """Initialize the merge.
+
+        Args:
+            writer: Output the pages are appended to
+            stages: Stage executors; appends run as merge stage calls
+            flush_pages: Save the output every this many appended pages;
+                0 saves it once in ``finish``
+            discard: Delete page PDFs once they are appended
+        """
+        self.writer = writer
+        self.stages = stages
+        self.flush_pages = flush_pages
+        self.discard = discard
+        # Finished pages waiting for an earlier one, by output position
+        self._buffer: dict[int, tuple[Path | bytes | None, str | None]] = {}
+        self._next = 0
+        self._draining = False
+        self.appended = 0
+
+    async def add(
+        self,
+        index: int,
+        page: Path | bytes | None,
+        key: str | None = None,
+    ) -> None:
+        """Hand over a finished page.
+
+        Args:
+            index: Zero-based position in the output; every position is
+                handed over exactly once
+            page: One-page PDF file or content, or None for a page that
+                failed and is left out
+            key: Identifies identical pages, which share one page object
+        """
+        self._buffer[index] = (page, key)
+        if self._draining:
+            # The caller appending earlier pages picks this one up
+            return
+
+        self._draining = True
+        try:
+            while self._next in self._buffer:
+                page, key = self._buffer.pop(self._next)
+                self._next += 1
+                if page is not None:
+                    await self._append(page, key)
+        finally:
+            self._draining = False
+
+    async def _append(self, page: Path | bytes, key: str | None) -> None:
+        """Append one page and flush the output when due.
+
+        Args:
+            page: One-page PDF file or content
+            key: Identifies identical pages
+        """
+        async with self.stages.stage("merge"):
+            await run_async(self.writer.append, page, key)
+            self.appended += 1
+            if self.flush_pages and self.appended % self.flush_pages == 0:
+                await run_async(self.writer.flush)
+                logger.debug(f"Flushed {self.appended} merged pages")
+
+        if self.discard and isinstance(page, Path):
+            page.unlink(missing_ok=True)
+
+    async def finish(self) -> None:
+        """Write the complete output.
+
+        Raises:
+            ProcessingError: If pages are missing or none were appended
+        """
+        if self._buffer:
+            raise ProcessingError(
+                f"Page {self._next} never finished; "
+                f"{len(self._buffer)} later pages were not merged",
+                page_number=self._next,
+                stage="merge",
+            )
+        if not self.appended:
+            raise ProcessingError("No pages were successfully processed")
+
+        async with self.stages.stage("merge"):
+            await run_async(self.writer.finish)
+
+    def close(self) -> None:
+        """Release the output; a finished merge is left as written."""
+        self.writer.close()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/core/optimize.py
+"""Post-merge optimization of output PDFs."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import fitz
+from loguru import logger
+
+from ..types import PathLike
+from .exceptions import ProcessingError
+
+
+def optimize_pdf(path: PathLike) -> int:
+    """Deduplicate and recompress a merged PDF in place.
+
+    Every page rendered by cairosvg carries its own copies of fonts, images
+    and ICC profiles. Rewriting the merged file with full garbage collection
+    merges identical objects and streams across pages, drops unreferenced
+    objects, deflates streams and packs objects into object streams.
+
+    Args:
+        path: PDF to optimize
+
+    Returns:
+        Number of bytes saved; 0 if the rewrite did not make the file smaller
+
+    Raises:
+        ProcessingError: If the PDF cannot be rewritten
+    """
+    path = Path(path)
+    original_size = path.stat().st_size
+    temp_path = path.with_name(f".{path.name}.optimized")
+
+    try:
+        with fitz.open(str(path)) as doc:
+            doc.save(
+                str(temp_path),
+                garbage=4,  # Also merge duplicate streams, not just objects
+                deflate=True,
+                deflate_images=True,
+                deflate_fonts=True,
+                use_objstms=True,
+            )
+
+        optimized_size = temp_path.stat().st_size
+        if optimized_size >= original_size:
+            logger.debug(f"Optimizing {path} saved nothing; keeping the original")
+            return 0
+
+        os.replace(temp_path, path)
+    except Exception as e:
+        raise ProcessingError(
+            f"Failed to optimize {path}: {e}",
+            stage="optimize",
+        ) from e
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+    saved = original_size - optimized_size
+    logger.debug(
+        f"Optimized {path} from {original_size} to {optimized_size} bytes "
+        f"({saved / original_size * 100:.1f}% reduction)"
+    )
+    return saved
@@ -9,50 +9,84 @@ from typing import TYPE_CHECKING
 
 from loguru import logger
 
-from ..filters.base import pdf_filter_registry, svg_filter_registry
 from ..types import (
-    BackendCapability,
     PageInfo,
     PathLike,
     ProcessingStatus,
     ProgressCallback,
 )
-from ..utils.async_utils import AsyncPool
+from ..utils.async_utils import AsyncPool, StageExecutors, run_async
 from ..utils.io import ensure_directory
 from ..utils.security import sanitize_svg_content
+from .cache import CacheFingerprints, ResultCache, cache_key, page_digest
+from .engine import ProcessEngine, filter_svg_content
 from .exceptions import ProcessingError
+from .planner import ExecutionPlan, plan_conversion
 
 if TYPE_CHECKING:
     from ..config import Configuration
+    from ..filters.base import ChainFilter
 
 
 class ProcessingPipeline:
     """Pipeline for processing PDF pages through filters."""
 
-    def __init__(self, config: Configuration) -> None:
+    def __init__(
+        self,
+        config: Configuration,
+        plan: ExecutionPlan | None = None,
+    ) -> None:
         """Initialize pipeline.
 
         Args:
             config: Configuration object
+            plan: Compiled plan; compiled from ``config`` on first use if omitted
         """
         self.config = config
 
-        # Create filter chains
-        self.pdf_filter_chain = pdf_filter_registry.create_chain(
-            config.pdf_filters,
-            name="pdf_filters",
-        )
-        self.svg_filter_chain = svg_filter_registry.create_chain(
-            config.svg_filters,
-            name="svg_filters",
+        # Cache of raw SVGs and finished page PDFs, shared with the converter
+        self.cache = ResultCache(config.cache)
+
+        self._plan = plan
+        self._stages: StageExecutors | None = None
+
+        # Worker processes for filtering, when the process engine is selected
+        self.engine = (
+            ProcessEngine(config) if config.processing.engine == "processes" else None
         )
 
+    @property
+    def plan(self) -> ExecutionPlan:
+        """Backends, filters and cache fingerprints for every page."""
+        if self._plan is None:
+            self._plan = plan_conversion(self.config)
+        return self._plan
+
+    @property
+    def stages(self) -> StageExecutors:
+        """Threads and concurrency limits for each stage, shared by documents."""
+        if self._stages is None:
+            self._stages = StageExecutors(self.plan.stage_limits)
+        return self._stages
+
+    @property
+    def pdf_filter_chain(self) -> ChainFilter:
+        """Filters applied to each page PDF."""
+        return self.plan.pdf_filter_chain
+
+    @property
+    def svg_filter_chain(self) -> ChainFilter:
+        """Filters applied to each page SVG."""
+        return self.plan.svg_filter_chain
+
     async def process_pages(
         self,
         pages: list[PageInfo],
         svg_dir: PathLike,
         pdf_output_dir: PathLike,
         progress_callback: ProgressCallback | None = None,
+        svg_only: bool = False,
+        pdf_pages_dir: PathLike | None = None,
     ) -> list[PageInfo]:
         """Process pages through the pipeline.
 
@@ -61,15 +95,24 @@ class ProcessingPipeline:
             svg_dir: Directory for SVG files
             pdf_output_dir: Directory for output PDFs
             progress_callback: Optional progress callback
+            svg_only: Stop after the SVG filters, for callers that render
+                all SVGs into one PDF themselves
+            pdf_pages_dir: Directory for PDF-filtered pages; defaults to
+                ``pdf_output_dir``
 
         Returns:
             List of processed pages
         """
         svg_dir = ensure_directory(svg_dir)
         pdf_output_dir = ensure_directory(pdf_output_dir)
+        pdf_pages_dir = (
+            ensure_directory(pdf_pages_dir) if pdf_pages_dir else pdf_output_dir
+        )
 
         # Create task pool
-        pool = AsyncPool(self.config.processing.parallel_pages)
+        pool = AsyncPool(self.plan.parallel_pages)
+
+        fingerprints = self.plan.fingerprints if self.cache.enabled else None
 
         # Process each page. AsyncPool.submit is a coroutine, so it must be
         # awaited or the page is never scheduled onto the pool.
@@ -79,6 +122,9 @@ class ProcessingPipeline:
                     page,
                     svg_dir,
                     pdf_output_dir,
+                    fingerprints,
+                    svg_only,
+                    pdf_pages_dir,
                 )
             )
 
@@ -97,11 +143,44 @@ class ProcessingPipeline:
         # Return successfully processed pages
         return [p for p in pages if p.status == ProcessingStatus.COMPLETED]
 
+    async def process_page(
+        self,
+        page: PageInfo,
+        svg_dir: Path,
+        pdf_output_dir: Path,
+        svg_only: bool = False,
+        pdf_pages_dir: Path | None = None,
+    ) -> PageInfo:
+        """Process one page, for callers that feed pages as they arrive.
+
+        The caller bounds how many pages run at once; stage limits still
+        apply to each call.
+
+        Args:
+            page: Page to process
+            svg_dir: Existing directory for SVG files
+            pdf_output_dir: Existing directory for output PDFs
+            svg_only: Stop after the SVG filters
+            pdf_pages_dir: Existing directory for PDF-filtered pages;
+                defaults to ``pdf_output_dir``
+
+        Returns:
+            The page, with its status and outputs set
+        """
+        fingerprints = self.plan.fingerprints if self.cache.enabled else None
+        await self._process_single_page(
+            page, svg_dir, pdf_output_dir, fingerprints, svg_only, pdf_pages_dir
+        )
+        return page
+
     async def _process_single_page(
         self,
         page: PageInfo,
         svg_dir: Path,
         pdf_output_dir: Path,
+        fingerprints: CacheFingerprints | None = None,
+        svg_only: bool = False,
+        pdf_pages_dir: Path | None = None,
     ) -> None:
         """Process a single page.
 
@@ -109,54 +188,56 @@ class ProcessingPipeline:
             page: Page to process
             svg_dir: Directory for SVG files
             pdf_output_dir: Directory for output PDFs
+            fingerprints: Cache fingerprints; enables the cache when set
+            svg_only: Stop after the SVG filters
+            pdf_pages_dir: Directory for PDF-filtered pages; defaults to
+                ``pdf_output_dir``
         """
         try:
             page.status = ProcessingStatus.IN_PROGRESS
-
-            # Apply PDF filters if any
-            if self.pdf_filter_chain.filters and page.temp_pdf_path:
-                logger.debug(f"Applying PDF filters to page {page.page_number}")
-
-                with open(page.temp_pdf_path, "rb") as f:
-                    pdf_content = f.read()
-
-                filtered_pdf = self.pdf_filter_chain(pdf_content)
-
-                # Write filtered PDF
-                filtered_path = page.temp_pdf_path.parent / (
-                    page.temp_pdf_path.stem + "_filtered.pdf"
-                )
-                with open(filtered_path, "wb") as f:
-                    f.write(filtered_pdf)
-
-                page.temp_pdf_path = filtered_path
-
-            # Convert PDF to SVG
             svg_path = svg_dir / f"page_{page.page_number:04d}.svg"
-            page.svg_path = await self._pdf_to_svg(page.temp_pdf_path, svg_path)
-
-            # Apply SVG filters if any
-            if self.svg_filter_chain.filters and page.svg_path:
-                logger.debug(f"Applying SVG filters to page {page.page_number}")
-
-                with open(page.svg_path, encoding="utf-8") as f:
-                    svg_content = f.read()
+            output_pdf_path = pdf_output_dir / f"page_{page.page_number:04d}.pdf"
+            # Never next to the page's PDF, which may be the user's input
+            filtered_pdf_path = (pdf_pages_dir or pdf_output_dir) / (
+                f"page_{page.page_number:04d}_filtered.pdf"
+            )
 
-                # Sanitize SVG for security
-                if self.config.security.sanitize_svg:
-                    svg_content = sanitize_svg_content(svg_content)
+            page_key = svg_key = None
+            if fingerprints and page.temp_pdf_path:
+                digest = page.digest
+                if digest is None:
+                    digest = await run_async(page_digest, page.temp_pdf_path)
+                svg_key = cache_key(digest, fingerprints.svg)
+                # The page tier holds finished page PDFs
+                if not svg_only:
+                    page_key = cache_key(digest, fingerprints.page)
+
+            # While another task or process converts the same page we wait
+            # here, then find its result in the cache.
+            async with self.cache.single_flight("pages", page_key):
+                # Reuse a previously converted identical page
+                hit = page_key is not None and await run_async(
+                    self.cache.fetch, "pages", page_key, output_pdf_path
+                )
+                if hit:
+                    page.output_pdf_path = output_pdf_path
+                    page.status = ProcessingStatus.COMPLETED
+                    logger.debug(f"Reused cached result for page {page.page_number}")
+                    return
 
-                filtered_svg = self.svg_filter_chain(svg_content)
+                await self._convert_page(
+                    page,
+                    svg_path,
+                    output_pdf_path,
+                    filtered_pdf_path,
+                    svg_key,
+                    svg_only,
+                )
 
-                # Write filtered SVG
-                with open(page.svg_path, "w", encoding="utf-8") as f:
-                    f.write(filtered_svg)
-
-            # Convert SVG back to PDF
-            output_pdf_path = pdf_output_dir / f"page_{page.page_number:04d}.pdf"
-            page.output_pdf_path = await self._svg_to_pdf(
-                page.svg_path, output_pdf_path
-            )
+                if page_key and page.output_pdf_path:
+                    await run_async(
+                        self.cache.put, "pages", page_key, page.output_pdf_path
+                    )
 
             page.status = ProcessingStatus.COMPLETED
             logger.debug(f"Successfully processed page {page.page_number}")
@@ -174,16 +255,163 @@ class ProcessingPipeline:
                     stage="pipeline",
                 ) from e
 
+    async def _convert_page(
+        self,
+        page: PageInfo,
+        svg_path: Path,
+        output_pdf_path: Path,
+        filtered_pdf_path: Path,
+        svg_key: str | None = None,
+        svg_only: bool = False,
+    ) -> None:
+        """Run a page through PDF to SVG, the SVG filters and SVG to PDF.
+
+        Args:
+            page: Page to convert
+            svg_path: Path for the page SVG
+            output_pdf_path: Path for the output page PDF
+            filtered_pdf_path: Path for the page PDF after the PDF filters
+            svg_key: Key of the raw SVG cache tier, if caching
+            svg_only: Stop after the SVG filters
+        """
+        # Restart from the cached raw SVG when only later stages changed
+        hit = svg_key is not None and await run_async(
+            self.cache.fetch, "svg", svg_key, svg_path
+        )
+        if hit:
+            page.svg_path = svg_path
+            logger.debug(f"Reused cached SVG for page {page.page_number}")
+        else:
+            await self._render_svg(page, svg_path, filtered_pdf_path)
+            if svg_key and page.svg_path:
+                await run_async(self.cache.put, "svg", svg_key, page.svg_path)
+
+        # Apply SVG filters if any
+        if self.svg_filter_chain.filters and page.svg_path:
+            logger.debug(f"Applying SVG filters to page {page.page_number}")
+
+            with open(page.svg_path, encoding="utf-8") as f:
+                svg_content = f.read()
+
+            filtered_svg = await self.apply_svg_filters(svg_content)
+
+            # Write filtered SVG
+            with open(page.svg_path, "w", encoding="utf-8") as f:
+                f.write(filtered_svg)
+
+        # Convert SVG back to PDF
+        if not svg_only:
+            page.output_pdf_path = await self._svg_to_pdf(
+                page.svg_path, output_pdf_path
+            )
+
+    def filter_svg(self, svg_content: str) -> str:
+        """Sanitize an SVG and run it through the SVG filter chain.
+
+        Args:
+            svg_content: SVG document
+
+        Returns:
+            Filtered SVG; unchanged when no SVG filters are configured
+        """
+        return filter_svg_content(
+            svg_content,
+            self.svg_filter_chain,
+            self.config.security.sanitize_svg,
+            self.config.security.svg_trust,
+        )
+
+    async def apply_svg_filters(self, svg_content: str) -> str:
+        """Filter an SVG off the event loop, in the configured engine.
+
+        With the thread engine, filters that run tools (svgo) await them on
+        the event loop and the rest run in the stage's threads.
+
+        Args:
+            svg_content: SVG document
+
+        Returns:
+            Filtered SVG; unchanged when no SVG filters are configured
+        """
+        if not self.svg_filter_chain.filters:
+            return svg_content
+        async with self.stages.stage("svg_filter"):
+            if self.engine:
+                return await self.engine.filter_svg(svg_content)
+
+            # Sanitize SVG for security
+            if self.config.security.sanitize_svg:
+                svg_content = await run_async(
+                    sanitize_svg_content,
+                    svg_content,
+                    self.config.security.svg_trust,
+                )
+            return await self.svg_filter_chain.call_async(svg_content)
+
+    async def apply_pdf_filters(self, pdf_content: bytes) -> bytes:
+        """Run a page PDF through the PDF filters in the configured engine.
+
+        Args:
+            pdf_content: PDF bytes
+
+        Returns:
+            Filtered PDF bytes
+        """
+        async with self.stages.stage("pdf_filter"):
+            if self.engine:
+                return await self.engine.filter_pdf(pdf_content)
+            return await self.pdf_filter_chain.call_async(pdf_content)
+
+    def close(self) -> None:
+        """Stop the stage threads and the engine's worker processes."""
+        if self._stages:
+            self._stages.close()
+        if self.engine:
+            self.engine.close()
+
+    async def _render_svg(
+        self,
+        page: PageInfo,
+        svg_path: Path,
+        filtered_path: Path,
+    ) -> None:
+        """Apply PDF filters to a page and convert it to SVG.
+
+        Args:
+            page: Page to render
+            svg_path: Output SVG path
+            filtered_path: Path for the filtered page PDF
+        """
+        # Apply PDF filters if any
+        if self.pdf_filter_chain.filters and page.temp_pdf_path:
+            logger.debug(f"Applying PDF filters to page {page.page_number}")
+
+            with open(page.temp_pdf_path, "rb") as f:
+                pdf_content = f.read()
+
+            filtered_pdf = await self.apply_pdf_filters(pdf_content)
+
+            # Write filtered PDF
+            with open(filtered_path, "wb") as f:
+                f.write(filtered_pdf)
+
+            page.temp_pdf_path = filtered_path
+
+        # Convert PDF to SVG
+        page.svg_path = await self._pdf_to_svg(page.temp_pdf_path, svg_path, page)
+
     async def _pdf_to_svg(
         self,
         pdf_path: Path | None,
         svg_path: Path,
+        page: PageInfo | None = None,
     ) -> Path:
         """Convert PDF to SVG.
 
         Args:
             pdf_path: Input PDF path
             svg_path: Output SVG path
+            page: Page being converted, to locate it in the unsplit input
 
         Returns:
             Path to SVG file
@@ -191,15 +419,23 @@ class ProcessingPipeline:
         if not pdf_path:
             raise ProcessingError("No PDF path provided")
 
-        # Imported lazily to avoid a core<->backends import cycle.
-        from ..backends.base import registry as backend_registry
+        backend = self.plan.backend_for("to_svg")
 
-        backend = backend_registry.find_best(
-            BackendCapability.PDF_TO_SVG,
-            self.config,
-        )
+        # Unfiltered pages are read straight from the source when the page
+        # was never split out of it, or when the backend keeps documents open
+        # and would rather not open each split file.
+        if (
+            page is not None
+            and page.source_path is not None
+            and pdf_path == page.input_path
+            and (page.input_path == page.source_path or backend.prefers_source_document)
+        ):
+            source_path, page_index = page.source_path, page.page_index
+        else:
+            source_path, page_index = pdf_path, 0
 
-        return await backend.pdf_to_svg(pdf_path, svg_path)
+        async with self.stages.stage("pdf_to_svg"):
+            return await backend.pdf_to_svg(source_path, svg_path, page_index)
 
     async def _svg_to_pdf(
         self,
@@ -218,12 +454,7 @@ class ProcessingPipeline:
         if not svg_path:
             raise ProcessingError("No SVG path provided")
 
-        # Imported lazily to avoid a core<->backends import cycle.
-        from ..backends.base import registry as backend_registry
-
-        backend = backend_registry.find_best(
-            BackendCapability.SVG_TO_PDF,
-            self.config,
-        )
+        backend = self.plan.backend_for("to_pdf")
 
-        return await backend.svg_to_pdf(svg_path, pdf_path)
+        async with self.stages.stage("svg_to_pdf"):
+            return await backend.svg_to_pdf(svg_path, pdf_path)
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/core/planner.py
+"""Compile a configuration into the plan every conversion runs by."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from loguru import logger
+
+from ..filters.base import ChainFilter, pdf_filter_registry, svg_filter_registry
+from ..types import (
+    PIPELINE_STAGES,
+    BackendCapability,
+    ExecutionEngine,
+    PipelineStage,
+)
+from .cache import CacheFingerprints, cache_key
+from .exceptions import DependencyError
+
+if TYPE_CHECKING:
+    from ..backends.base import Backend
+    from ..config import Configuration
+
+type Stage = Literal["split", "to_svg", "to_pdf", "merge"]
+
+STAGES: tuple[Stage, ...] = ("split", "to_svg", "to_pdf", "merge")
+
+# Consecutive stages each capability covers
+CAPABILITY_STAGES: dict[BackendCapability, tuple[Stage, ...]] = {
+    BackendCapability.PDF_SPLIT: ("split",),
+    BackendCapability.PDF_TO_SVG: ("to_svg",),
+    BackendCapability.SVG_TO_PDF: ("to_pdf",),
+    BackendCapability.PDF_MERGE: ("merge",),
+    BackendCapability.PDF_SPLIT_TO_SVG: ("split", "to_svg"),
+    BackendCapability.SVG_TO_PDF_MERGE: ("to_pdf", "merge"),
+    BackendCapability.DOCUMENT_ROUND_TRIP: STAGES,
+}
+
+# Stages that start a process per page unless the backend batches pages
+_PER_PAGE_STAGES: frozenset[Stage] = frozenset({"to_svg", "to_pdf"})
+
+# Page count assumed when weighing per-page against per-document work
+_NOMINAL_PAGES = 100
+
+# Plan stage whose backend runs each backend-driven pipeline stage
+_BACKEND_STAGES: dict[PipelineStage, Stage] = {
+    "split": "split",
+    "pdf_to_svg": "to_svg",
+    "svg_to_pdf": "to_pdf",
+    "merge": "merge",
+}
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """One backend operation in a plan."""
+
+    capability: BackendCapability
+    backend: Backend
+    # Estimated process launches for a document of _NOMINAL_PAGES pages
+    cost: int
+
+    @property
+    def stages(self) -> tuple[Stage, ...]:
+        """Pipeline stages this step covers."""
+        return CAPABILITY_STAGES[self.capability]
+
+    @property
+    def workers(self) -> int:
+        """Calls the backend runs at once in its own pool or shells."""
+        return self.backend.worker_count
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """Everything a conversion needs that only depends on the configuration.
+
+    Compiled once per converter and shared by all of its pages and
+    documents, so nothing is looked up or hashed again per page.
+    """
+
+    # Backends for every pipeline stage, in stage order
+    steps: tuple[PlanStep, ...]
+    pdf_filter_chain: ChainFilter
+    svg_filter_chain: ChainFilter
+    # Everything besides the page that shapes each cache tier
+    fingerprints: CacheFingerprints
+    # Settings and backends that shape a whole converted document
+    document_fingerprint: str
+    # Pages converted at once
+    parallel_pages: int
+    # Split pages queued ahead of the page workers
+    queue_depth: int
+    # Where filters run: threads or warm worker processes
+    engine: ExecutionEngine
+    # Calls running at once in each stage, each with its own threads
+    stage_limits: dict[PipelineStage, int]
+
+    @property
+    def cost(self) -> int:
+        """Estimated process launches for the whole chain."""
+        return sum(step.cost for step in self.steps)
+
+    def step_for(self, stage: Stage) -> PlanStep:
+        """Get the step that covers a stage.
+
+        Args:
+            stage: Pipeline stage
+
+        Returns:
+            Step covering the stage
+        """
+        for step in self.steps:
+            if stage in step.stages:
+                return step
+        raise KeyError(stage)  # pragma: no cover - plans cover every stage
+
+    def backend_for(self, stage: Stage) -> Backend:
+        """Get the backend that runs a stage.
+
+        Args:
+            stage: Pipeline stage
+
+        Returns:
+            Backend
+        """
+        return self.step_for(stage).backend
+
+    def uses(self, capability: BackendCapability) -> bool:
+        """Check whether the plan contains a step with a capability.
+
+        Args:
+            capability: Capability, usually a fused one
+
+        Returns:
+            True if a step uses it
+        """
+        return any(step.capability == capability for step in self.steps)
+
+
+def _allowed(capability: BackendCapability, config: Configuration) -> bool:
+    """Check whether the configuration lets a capability be used.
+
+    Args:
+        capability: Capability
+        config: Configuration
+
+    Returns:
+        False if a setting needs the stages it fuses to stay separate
+    """
+    # PDF filters work on split single-page files
+    if capability in (
+        BackendCapability.PDF_SPLIT_TO_SVG,
+        BackendCapability.DOCUMENT_ROUND_TRIP,
+    ) and any(f.enabled for f in config.pdf_filters):
+        return False
+    # The in-memory round trip writes no temp files to preserve
+    return not (
+        capability == BackendCapability.DOCUMENT_ROUND_TRIP
+        and config.processing.preserve_temp_files
+    )
+
+
+def _candidates(
+    capability: BackendCapability,
+    config: Configuration,
+) -> list[PlanStep]:
+    """List the steps that could provide a capability.
+
+    Args:
+        capability: Capability
+        config: Configuration
+
+    Returns:
+        One step per available, enabled backend
+    """
+    from ..backends.base import registry as backend_registry
+
+    backends = backend_registry.get_available(capability, config)
+
+    # Without a split, every PDF_TO_SVG backend addresses pages in the input
+    if (
+        capability == BackendCapability.PDF_SPLIT_TO_SVG
+        and not config.processing.split_pages
+    ):
+        backends += [
+            backend
+            for backend in backend_registry.get_available(
+                BackendCapability.PDF_TO_SVG, config
+            )
+            if backend not in backends
+        ]
+
+    steps = []
+    for backend in backends:
+        fused = len(CAPABILITY_STAGES[capability]) > 1 and (
+            capability in backend.capabilities
+        )
+        per_page = (
+            not fused
+            and BackendCapability.BATCH_PROCESSING not in backend.capabilities
+            and any(
+                stage in _PER_PAGE_STAGES for stage in CAPABILITY_STAGES[capability]
+            )
+        )
+        steps.append(PlanStep(capability, backend, _NOMINAL_PAGES if per_page else 1))
+    return steps
+
+
+def _preference(step: PlanStep, config: Configuration) -> tuple[int, int, int, int]:
+    """Rank steps: priority per stage, then cheaper, streaming, priority.
+
+    Args:
+        step: Candidate step
+        config: Configuration
+
+    Returns:
+        Sort key; smaller is better. The priority counts once per stage the
+        step covers, so fusing stages neither gains nor loses it. With
+        ``processing.plan_by_cost`` it is left out and cost comes first.
+    """
+    from ..backends.base import registry as backend_registry
+
+    priority = backend_registry.priority(step.backend, config)
+    streaming = BackendCapability.STREAMING in step.backend.capabilities
+    return (
+        0 if config.processing.plan_by_cost else -priority * len(step.stages),
+        step.cost,
+        0 if streaming else 1,
+        -priority,
+    )
+
+
+def _choose_steps(config: Configuration) -> tuple[PlanStep, ...]:
+    """Find the preferred chain of backends covering split to merge.
+
+    Fused capabilities (PDF_SPLIT_TO_SVG, SVG_TO_PDF_MERGE,
+    DOCUMENT_ROUND_TRIP) compete with chains of single-stage backends.
+    Backend priority comes first: each stage counts the priority of the
+    backend that runs it, so a fused backend only wins when it is preferred
+    for the stages it covers. Among chains of equal priority, and first of
+    all with ``processing.plan_by_cost``, the cheapest wins. Cost is the
+    number of processes started for a nominal document, so batching and
+    fusing backends win. Ties go to backends that stream pages, then to
+    higher priority.
+
+    Args:
+        config: Configuration
+
+    Returns:
+        Steps in stage order
+
+    Raises:
+        DependencyError: If no chain of available backends covers every stage
+    """
+    # best[i]: best-ranked steps covering STAGES[i:], with their ranking key
+    best: dict[int, tuple[tuple[int, ...], tuple[PlanStep, ...]]] = {
+        len(STAGES): ((0, 0, 0, 0, 0), ())
+    }
+
+    for start in reversed(range(len(STAGES))):
+        options = []
+        for capability, stages in CAPABILITY_STAGES.items():
+            end = start + len(stages)
+            if STAGES[start:end] != stages or end not in best:
+                continue
+            if not _allowed(capability, config):
+                continue
+
+            rest_key, rest = best[end]
+            for step in _candidates(capability, config):
+                preferred, cost, streaming, priority = _preference(step, config)
+                key = (
+                    preferred + rest_key[0],
+                    cost + rest_key[1],
+                    len(rest) + 1,
+                    streaming + rest_key[3],
+                    priority + rest_key[4],
+                )
+                options.append((key, (step, *rest)))
+
+        if options:
+            best[start] = min(options, key=lambda option: option[0])
+
+    if 0 not in best:
+        raise DependencyError(
+            "No combination of available backends covers the pipeline",
+            dependency="backends for split, PDF to SVG, SVG to PDF and merge",
+            install_command="Please install poppler-utils or pymupdf",
+        )
+
+    return best[0][1]
+
+
+def _stage_limits(
+    config: Configuration,
+    steps: tuple[PlanStep, ...],
+) -> dict[PipelineStage, int]:
+    """Work out how many calls each stage may run at once.
+
+    Args:
+        config: Configuration
+        steps: Chosen steps
+
+    Returns:
+        ``processing.stage_concurrency`` or ``parallel_pages`` per stage,
+        capped by the ``max_concurrency`` of the backend running it
+    """
+    limits: dict[PipelineStage, int] = {}
+    for stage in PIPELINE_STAGES:
+        limit = config.processing.stage_concurrency.get(
+            stage, config.processing.parallel_pages
+        )
+        if stage in _BACKEND_STAGES:
+            step = next(s for s in steps if _BACKEND_STAGES[stage] in s.stages)
+            for backend_config in config.backends:
+                if (
+                    backend_config.name == step.backend.name
+                    and backend_config.enabled
+                    and backend_config.max_concurrency
+                ):
+                    limit = min(limit, backend_config.max_concurrency)
+        limits[stage] = limit
+    return limits
+
+
+def plan_conversion(config: Configuration) -> ExecutionPlan:
+    """Compile a configuration into an execution plan.
+
+    Backends and filters must already be registered.
+
+    Args:
+        config: Configuration
+
+    Returns:
+        Execution plan
+
+    Raises:
+        DependencyError: If no chain of available backends covers every stage
+        FilterError: If a configured filter is not registered
+    """
+    steps = _choose_steps(config)
+    identities = [f"{step.capability.name}={step.backend.identity}" for step in steps]
+    pdf_filter_chain = pdf_filter_registry.create_chain(
+        config.pdf_filters,
+        name="pdf_filters",
+    )
+    svg_filter_chain = svg_filter_registry.create_chain(
+        config.svg_filters,
+        name="svg_filters",
+    )
+
+    to_svg = next(step for step in steps if "to_svg" in step.stages).backend
+    to_pdf = next(step for step in steps if "to_pdf" in step.stages).backend
+
+    # The raw SVG only depends on what happens before pdftocairo runs, so
+    # tuning SVG filters or swapping the SVG_TO_PDF backend keeps it valid.
+    svg = cache_key(pdf_filter_chain.fingerprint, to_svg.identity)
+    page = cache_key(
+        svg,
+        svg_filter_chain.fingerprint,
+        str(config.security.sanitize_svg),
+        config.security.svg_trust,
+        to_pdf.identity,
+    )
+
+    plan = ExecutionPlan(
+        steps=steps,
+        pdf_filter_chain=pdf_filter_chain,
+        svg_filter_chain=svg_filter_chain,
+        fingerprints=CacheFingerprints(svg=svg, page=page),
+        document_fingerprint=cache_key(config.fingerprint(), *identities),
+        parallel_pages=config.processing.parallel_pages,
+        queue_depth=config.processing.queue_depth,
+        engine=config.processing.engine,
+        stage_limits=_stage_limits(config, steps),
+    )
+    logger.debug(
+        f"Execution plan (cost {plan.cost}): "
+        + ", ".join(f"{s.capability.name}={s.backend.name}" for s in plan.steps)
+    )
+    return plan
@@ -2,15 +2,37 @@
 # this_file: src/pdf2svg2pdf/filters/__init__.py
 """Filter implementations for pdf2svg2pdf."""
 
-from .base import Filter, FilterRegistry
+from .base import Filter, FilterRegistry, pdf_filter_registry, svg_filter_registry
 from .pdf import GrayscaleFilter, PDFCompressFilter
-from .svg import SVGOptimizeFilter, SVGTransparentWhiteFilter
+from .rewrite import RewriteEngine, RewriteRule
+from .svg import (
+    SVGColorReplaceFilter,
+    SVGFillUnifyFilter,
+    SVGOptimizeFilter,
+    SVGTransparentWhiteFilter,
+)
+
+
+def register_builtin_filters() -> None:
+    """Register every built-in filter with the PDF and SVG registries."""
+    pdf_filter_registry.register(GrayscaleFilter)
+    pdf_filter_registry.register(PDFCompressFilter)
+    svg_filter_registry.register(SVGOptimizeFilter)
+    svg_filter_registry.register(SVGTransparentWhiteFilter)
+    svg_filter_registry.register(SVGColorReplaceFilter)
+    svg_filter_registry.register(SVGFillUnifyFilter)
+
 
 __all__ = [
     "Filter",
     "FilterRegistry",
+    "RewriteEngine",
+    "RewriteRule",
     "GrayscaleFilter",
     "PDFCompressFilter",
+    "SVGColorReplaceFilter",
+    "SVGFillUnifyFilter",
     "SVGOptimizeFilter",
     "SVGTransparentWhiteFilter",
+    "register_builtin_filters",
 ]
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import json
 from abc import ABC, abstractmethod
 from typing import TypeVar
 
@@ -11,6 +12,8 @@ from loguru import logger
 
 from ..core.exceptions import FilterError
 from ..types import FilterConfig
+from ..utils.async_utils import run_async
+from .rewrite import RewriteEngine, RewriteRule
 
 ContentType = TypeVar("ContentType", bytes, str)
 
@@ -44,6 +47,25 @@ class Filter(ABC):
         """Set of supported file formats (pdf, svg)."""
         ...
 
+    @property
+    def fingerprint(self) -> str:
+        """Stable identity of the filter and its parameters, used in cache keys."""
+        parameters = json.dumps(
+            self.config.parameters or {}, sort_keys=True, default=str
+        )
+        return f"{self.name}:{parameters}"
+
+    def rewrite_rules(self) -> list[RewriteRule] | None:
+        """Describe the filter as rewrite rules, if it can be.
+
+        Filters that only substitute patterns in text return their rules so
+        chains of them can run in a single pass over the content.
+
+        Returns:
+            Rules in application order, or None if the filter is not rule-based
+        """
+        return None
+
     def validate(self, content: ContentType) -> tuple[bool, str]:
         """Validate if filter can be applied to content.
 
@@ -71,8 +93,11 @@ class Filter(ABC):
         """
         ...
 
-    def __call__(self, content: ContentType) -> ContentType:
-        """Make filter callable.
+    async def apply_async(self, content: ContentType) -> ContentType:
+        """Apply filter to content without blocking the event loop.
+
+        Runs ``apply`` in a thread; filters that run external tools override
+        this to await them instead.
 
         Args:
             content: Content to filter
@@ -80,7 +105,17 @@ class Filter(ABC):
         Returns:
             Filtered content
         """
-        # Validate first
+        return await run_async(self.apply, content)
+
+    def _check(self, content: ContentType) -> None:
+        """Validate content before the filter runs.
+
+        Args:
+            content: Content to filter
+
+        Raises:
+            FilterError: If the content is not valid for this filter
+        """
         is_valid, message = self.validate(content)
         if not is_valid:
             raise FilterError(
@@ -88,6 +123,18 @@ class Filter(ABC):
                 filter_name=self.name,
             )
 
+    def __call__(self, content: ContentType) -> ContentType:
+        """Make filter callable.
+
+        Args:
+            content: Content to filter
+
+        Returns:
+            Filtered content
+        """
+        # Validate first
+        self._check(content)
+
         # Apply filter
         try:
             logger.debug(f"Applying filter: {self.name}")
@@ -98,6 +145,26 @@ class Filter(ABC):
                 filter_name=self.name,
             ) from e
 
+    async def call_async(self, content: ContentType) -> ContentType:
+        """Validate and apply the filter on the event loop.
+
+        Args:
+            content: Content to filter
+
+        Returns:
+            Filtered content
+        """
+        self._check(content)
+
+        try:
+            logger.debug(f"Applying filter: {self.name}")
+            return await self.apply_async(content)
+        except Exception as e:
+            raise FilterError(
+                f"Failed to apply filter: {e}",
+                filter_name=self.name,
+            ) from e
+
 
 class ChainFilter(Filter):
     """Filter that chains multiple filters together."""
@@ -115,9 +182,12 @@ class ChainFilter(Filter):
             name: Name for the chain
             config: Optional configuration
         """
-        super().__init__(config)
+        # Set before the base initializer, which reads ``name``
         self.filters = filters
         self._name = name
+        super().__init__(config)
+        self._engine: RewriteEngine | None = None
+        self._fused: bool | None = None
 
     @property
     def name(self) -> str:
@@ -143,6 +213,11 @@ class ChainFilter(Filter):
 
         return formats
 
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprints of the chained filters, in order."""
+        return "|".join(f.fingerprint for f in self.filters)
+
     def validate(self, content: ContentType) -> tuple[bool, str]:
         """Validate content against all filters.
 
@@ -168,11 +243,65 @@ class ChainFilter(Filter):
         Returns:
             Filtered content
         """
+        engine = self._rewrite_engine()
+        if engine is not None and isinstance(content, str):
+            # ChainFilter.__call__ has already validated for every filter
+            return engine.sub(content)  # type: ignore[return-value]
+
         result = content
         for f in self.filters:
             result = f(result)
         return result
 
+    async def apply_async(self, content: ContentType) -> ContentType:
+        """Apply all filters in sequence without blocking the event loop.
+
+        Args:
+            content: Content to filter
+
+        Returns:
+            Filtered content
+        """
+        engine = self._rewrite_engine()
+        if engine is not None and isinstance(content, str):
+            return await run_async(engine.sub, content)  # type: ignore[return-value]
+
+        result = content
+        for f in self.filters:
+            result = await f.call_async(result)
+        return result
+
+    def rewrite_rules(self) -> list[RewriteRule] | None:
+        """Concatenate the chained filters' rules if all are rule-based.
+
+        Returns:
+            Rules of every filter in order, or None
+        """
+        rules: list[RewriteRule] = []
+        for f in self.filters:
+            filter_rules = f.rewrite_rules()
+            if filter_rules is None:
+                return None
+            rules.extend(filter_rules)
+        return rules
+
+    def _rewrite_engine(self) -> RewriteEngine | None:
+        """Compile the fused rewrite engine once, if the chain allows it.
+
+        Returns:
+            Engine running the whole chain in one pass, or None
+        """
+        if self._fused is None:
+            rules = self.rewrite_rules() if self.filters else None
+            self._fused = rules is not None
+            if rules is not None:
+                self._engine = RewriteEngine(rules)
+                logger.debug(
+                    f"Fused {len(self.filters)} filters into one rewrite pass "
+                    f"({len(rules)} rules)"
+                )
+        return self._engine
+
 
 class FilterRegistry:
     """Registry for filter implementations."""
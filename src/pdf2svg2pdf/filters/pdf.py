@@ -6,92 +6,170 @@ from __future__ import annotations
 
 import subprocess
 import tempfile
+from abc import abstractmethod
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
 from loguru import logger
 
 from ..types import FilterConfig
+from ..utils.commands import run_command
+from ..utils.tools import tools
 from .base import Filter
 
 
-class GrayscaleFilter(Filter):
-    """Convert PDF to grayscale using Ghostscript."""
+@contextmanager
+def _pdf_files(content: bytes) -> Iterator[tuple[Path, Path]]:
+    """Write a PDF to a temporary file and reserve one for the result.
 
-    @property
-    def name(self) -> str:
-        """Filter identifier."""
-        return "grayscale"
+    Args:
+        content: PDF content as bytes
 
-    @property
-    def description(self) -> str:
-        """Human-readable description."""
-        return "Convert PDF to grayscale"
+    Yields:
+        Input and output paths, removed afterwards
+    """
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as input_file:
+        input_path = Path(input_file.name)
+        input_file.write(content)
+
+    with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as output_file:
+        output_path = Path(output_file.name)
+
+    try:
+        yield input_path, output_path
+    finally:
+        # Cleanup
+        input_path.unlink(missing_ok=True)
+        output_path.unlink(missing_ok=True)
+
+
+class _GhostscriptFilter(Filter):
+    """Filter that rewrites a PDF with Ghostscript."""
 
     @property
     def supported_formats(self) -> set[str]:
         """Set of supported file formats."""
         return {"pdf"}
 
+    @abstractmethod
+    def _command(self, input_path: Path, output_path: Path) -> list[str]:
+        """Build the Ghostscript command line.
+
+        Args:
+            input_path: PDF to read
+            output_path: PDF to write
+
+        Returns:
+            Command and arguments
+        """
+        ...
+
+    def _finish(self, content: bytes, result: bytes) -> bytes:
+        """Post-process Ghostscript's output.
+
+        Args:
+            content: Original PDF content
+            result: PDF written by Ghostscript
+
+        Returns:
+            Filtered PDF content
+        """
+        return result
+
+    def _skip(self) -> bool:
+        """Check whether Ghostscript is missing, warning if it is."""
+        if tools.available("gs"):
+            return False
+        logger.warning(f"Ghostscript not available, skipping {self.name} filter")
+        return True
+
     # PDF filters only ever handle bytes, so they narrow the generic base.
     def apply(self, content: bytes) -> bytes:  # type: ignore[override]
-        """Apply grayscale conversion to PDF.
+        """Run the PDF through Ghostscript.
 
         Args:
             content: PDF content as bytes
 
         Returns:
-            Grayscale PDF content
+            Filtered PDF content
         """
-        # Check if ghostscript is available
-        try:
-            subprocess.run(["gs", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning("Ghostscript not available, skipping grayscale filter")
+        if self._skip():
             return content
 
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as input_file:
-            input_path = Path(input_file.name)
-            input_file.write(content)
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            # Run ghostscript
-            command = [
-                "gs",
-                "-sOutputFile=" + str(output_path),
-                "-sDEVICE=pdfwrite",
-                "-sColorConversionStrategy=Gray",
-                "-dProcessColorModel=/DeviceGray",
-                "-dCompatibilityLevel=1.4",
-                "-dNOPAUSE",
-                "-dBATCH",
-                str(input_path),
-            ]
-
-            subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            # Read output
-            with open(output_path, "rb") as f:
-                return f.read()
-
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Ghostscript failed: {e.stderr}")
-            raise
-        finally:
-            # Cleanup
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
-
-
-class PDFCompressFilter(Filter):
+        with _pdf_files(content) as (input_path, output_path):
+            try:
+                subprocess.run(
+                    self._command(input_path, output_path),
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Ghostscript {self.name} failed: {e.stderr}")
+                raise
+
+            return self._finish(content, output_path.read_bytes())
+
+    async def apply_async(self, content: bytes) -> bytes:  # type: ignore[override]
+        """Run the PDF through Ghostscript on the event loop.
+
+        Args:
+            content: PDF content as bytes
+
+        Returns:
+            Filtered PDF content
+        """
+        if self._skip():
+            return content
+
+        with _pdf_files(content) as (input_path, output_path):
+            try:
+                await run_command(self._command(input_path, output_path), check=True)
+            except subprocess.CalledProcessError as e:
+                logger.error(f"Ghostscript {self.name} failed: {e.stderr}")
+                raise
+
+            return self._finish(content, output_path.read_bytes())
+
+
+class GrayscaleFilter(_GhostscriptFilter):
+    """Convert PDF to grayscale using Ghostscript."""
+
+    @property
+    def name(self) -> str:
+        """Filter identifier."""
+        return "grayscale"
+
+    @property
+    def description(self) -> str:
+        """Human-readable description."""
+        return "Convert PDF to grayscale"
+
+    def _command(self, input_path: Path, output_path: Path) -> list[str]:
+        """Build the Ghostscript command line.
+
+        Args:
+            input_path: PDF to read
+            output_path: PDF to write
+
+        Returns:
+            Command and arguments
+        """
+        return [
+            "gs",
+            "-sOutputFile=" + str(output_path),
+            "-sDEVICE=pdfwrite",
+            "-sColorConversionStrategy=Gray",
+            "-dProcessColorModel=/DeviceGray",
+            "-dCompatibilityLevel=1.4",
+            "-dNOPAUSE",
+            "-dBATCH",
+            str(input_path),
+        ]
+
+
+class PDFCompressFilter(_GhostscriptFilter):
     """Compress PDF using Ghostscript."""
 
     def __init__(self, config: FilterConfig | None = None) -> None:
@@ -116,76 +194,43 @@ class PDFCompressFilter(Filter):
         """Human-readable description."""
         return "Compress PDF file size"
 
-    @property
-    def supported_formats(self) -> set[str]:
-        """Set of supported file formats."""
-        return {"pdf"}
+    def _command(self, input_path: Path, output_path: Path) -> list[str]:
+        """Build the Ghostscript command line.
 
-    # PDF filters only ever handle bytes, so they narrow the generic base.
-    def apply(self, content: bytes) -> bytes:  # type: ignore[override]
-        """Apply compression to PDF.
+        Args:
+            input_path: PDF to read
+            output_path: PDF to write
+
+        Returns:
+            Command and arguments
+        """
+        return [
+            "gs",
+            "-sOutputFile=" + str(output_path),
+            "-sDEVICE=pdfwrite",
+            "-dCompatibilityLevel=1.4",
+            f"-dPDFSETTINGS=/{self.quality}",
+            "-dNOPAUSE",
+            "-dBATCH",
+            "-dQUIET",
+            str(input_path),
+        ]
+
+    def _finish(self, content: bytes, result: bytes) -> bytes:
+        """Log the compression ratio.
 
         Args:
-            content: PDF content as bytes
+            content: Original PDF content
+            result: PDF written by Ghostscript
 
         Returns:
             Compressed PDF content
         """
-        # Check if ghostscript is available
-        try:
-            subprocess.run(["gs", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            logger.warning("Ghostscript not available, skipping compress filter")
-            return content
-
-        # Create temporary files
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as input_file:
-            input_path = Path(input_file.name)
-            input_file.write(content)
-
-        with tempfile.NamedTemporaryFile(suffix=".pdf", delete=False) as output_file:
-            output_path = Path(output_file.name)
-
-        try:
-            # Run ghostscript with compression
-            command = [
-                "gs",
-                "-sOutputFile=" + str(output_path),
-                "-sDEVICE=pdfwrite",
-                "-dCompatibilityLevel=1.4",
-                f"-dPDFSETTINGS=/{self.quality}",
-                "-dNOPAUSE",
-                "-dBATCH",
-                "-dQUIET",
-                str(input_path),
-            ]
-
-            subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                check=True,
-            )
-
-            # Read output
-            with open(output_path, "rb") as f:
-                compressed = f.read()
-
-            # Log compression ratio
-            original_size = len(content)
-            compressed_size = len(compressed)
-            ratio = (1 - compressed_size / original_size) * 100
-            logger.debug(
-                f"Compressed PDF from {original_size} to {compressed_size} bytes "
-                f"({ratio:.1f}% reduction)"
-            )
-
-            return compressed
-
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Ghostscript compression failed: {e.stderr}")
-            raise
-        finally:
-            # Cleanup
-            input_path.unlink(missing_ok=True)
-            output_path.unlink(missing_ok=True)
+        original_size = len(content)
+        compressed_size = len(result)
+        ratio = (1 - compressed_size / original_size) * 100
+        logger.debug(
+            f"Compressed PDF from {original_size} to {compressed_size} bytes "
+            f"({ratio:.1f}% reduction)"
+        )
+        return result
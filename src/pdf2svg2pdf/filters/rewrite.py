@@ -0,0 +1,231 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/filters/rewrite.py
+"""Rewrite engine for pattern-based SVG filters."""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+# Literal rules in a row from which one fused scan beats a str.replace each.
+# A str.replace pass costs a full scan per text; the fused scan costs about
+# as much as 25 of them however many texts it covers.
+_FUSE_MIN_LITERALS = 24
+
+
+@dataclass(frozen=True)
+class RewriteRule:
+    """A pattern and what to replace its matches with."""
+
+    pattern: str
+    # ``re.sub`` replacement template, or a function of the match
+    replacement: str | Callable[[re.Match[str]], str]
+    # Fixed text the pattern matches, for rules built with ``literal``
+    text: str | None = None
+    regex: re.Pattern[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Compile the pattern once."""
+        object.__setattr__(self, "regex", re.compile(self.pattern))
+
+    @classmethod
+    def literal(cls, text: str, replacement: str) -> RewriteRule:
+        """Create a rule that replaces fixed text with fixed text.
+
+        Args:
+            text: Text to find
+            replacement: Replacement text, taken as is
+
+        Returns:
+            Rewrite rule
+        """
+        return cls(re.escape(text), replacement.replace("\\", r"\\"), text)
+
+    @property
+    def replacement_text(self) -> str:
+        """Replacement of a literal rule, unescaped."""
+        assert isinstance(self.replacement, str)
+        return self.replacement.replace(r"\\", "\\")
+
+
+def _runs_into(a: str, b: str) -> bool:
+    """Check whether a proper end of ``a`` is a start of ``b``.
+
+    Args:
+        a: Text whose end is checked
+        b: Text whose start is checked
+
+    Returns:
+        True if the texts overlap that way
+    """
+    end = len(b) - 1
+    i = b.find(a[-1], 0, end)
+    while i != -1:
+        if a.endswith(b[: i + 1]):
+            return True
+        i = b.find(a[-1], i + 1, end)
+    return False
+
+
+def _interacts(a: str, b: str) -> bool:
+    """Check whether replacing one text could create or hide the other.
+
+    Args:
+        a: First text
+        b: Second text
+
+    Returns:
+        True if either contains the other or an end of one starts the other
+    """
+    return (
+        a in b
+        or b in a
+        or (bool(a) and bool(b) and (_runs_into(a, b) or _runs_into(b, a)))
+    )
+
+
+def _trie_pattern(texts: Sequence[str]) -> str:
+    """Build a regex matching any of the texts, sharing common prefixes.
+
+    A plain alternation tries every text at every position; factoring the
+    prefixes keeps the scan about as fast for hundreds of texts as for one.
+
+    Args:
+        texts: Texts, none a prefix of another
+
+    Returns:
+        Pattern source
+    """
+    trie: dict[str, Any] = {}
+    for text in texts:
+        node = trie
+        for char in text:
+            node = node.setdefault(char, {})
+
+    def build(node: dict[str, Any]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items()]
+        if len(branches) <= 1:
+            return "".join(branches)
+        return "(?:" + "|".join(branches) + ")"
+
+    return build(trie)
+
+
+class _LiteralPass:
+    """Replace many fixed texts in one scan with a dict lookup."""
+
+    def __init__(self, rules: Sequence[RewriteRule]) -> None:
+        """Compile the texts into one prefix-factored pattern.
+
+        Args:
+            rules: Literal rules that do not interact
+        """
+        self.table = {rule.text or "": rule.replacement_text for rule in rules}
+        self.regex = re.compile(_trie_pattern(list(self.table)))
+
+    def subn(self, content: str) -> tuple[str, int]:
+        """Replace every text.
+
+        Args:
+            content: Content to rewrite
+
+        Returns:
+            Tuple of (rewritten content, number of replacements)
+        """
+        lookup = self.table.__getitem__
+        return self.regex.subn(lambda match: lookup(match.group()), content)
+
+
+class RewriteEngine:
+    """Apply a sequence of rewrite rules with as few scans as possible.
+
+    Pattern rules run as one C-level ``re.subn`` each, and literal rules as
+    one ``str.replace`` each. Long runs of literal rules, such as a large
+    color map, are fused into a single scan that looks matches up in a
+    dict, as long as no text or replacement in the run contains or runs
+    into a later text; otherwise the run is split there. The result is
+    always that of applying the rules one after another.
+    """
+
+    def __init__(self, rules: Sequence[RewriteRule]) -> None:
+        """Group the rules into passes.
+
+        Args:
+            rules: Rules in application order
+        """
+        self.rules = list(rules)
+        self._passes: list[RewriteRule | _LiteralPass] = []
+
+        run: list[RewriteRule] = []
+        for rule in self.rules:
+            if rule.text:
+                run.append(rule)
+                continue
+            self._add_literals(run)
+            run = []
+            self._passes.append(rule)
+        self._add_literals(run)
+
+    def _add_literals(self, run: list[RewriteRule]) -> None:
+        """Add passes for consecutive literal rules.
+
+        Args:
+            run: Literal rules in application order
+        """
+        if len(run) < _FUSE_MIN_LITERALS:
+            self._passes.extend(run)
+            return
+
+        group: list[RewriteRule] = []
+        for rule in [*run, None]:
+            if rule is not None and not any(
+                _interacts(rule.text or "", earlier.text or "")
+                or _interacts(rule.text or "", earlier.replacement_text)
+                for earlier in group
+            ):
+                group.append(rule)
+                continue
+            if len(group) >= _FUSE_MIN_LITERALS:
+                self._passes.append(_LiteralPass(group))
+            else:
+                self._passes.extend(group)
+            group = [rule] if rule is not None else []
+
+    def subn(self, content: str) -> tuple[str, int]:
+        """Rewrite content.
+
+        Args:
+            content: Content to rewrite
+
+        Returns:
+            Tuple of (rewritten content, number of rule matches)
+        """
+        total = 0
+        for step in self._passes:
+            if isinstance(step, _LiteralPass):
+                content, count = step.subn(content)
+            elif step.text:
+                replaced = content.replace(step.text, step.replacement_text)
+                growth = len(step.replacement_text) - len(step.text)
+                if growth:
+                    count = (len(replaced) - len(content)) // growth
+                else:
+                    count = content.count(step.text) if replaced != content else 0
+                content = replaced
+            else:
+                content, count = step.regex.subn(step.replacement, content)
+            total += count
+        return content, total
+
+    def sub(self, content: str) -> str:
+        """Rewrite content.
+
+        Args:
+            content: Content to rewrite
+
+        Returns:
+            Rewritten content
+        """
+        return self.subn(content)[0]
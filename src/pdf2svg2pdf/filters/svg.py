@@ -7,11 +7,21 @@ from __future__ import annotations
 import re
 import subprocess
 from collections import Counter
+from functools import cached_property
 
 from loguru import logger
 
 from ..types import FilterConfig
+from ..utils.commands import run_command
+from ..utils.tools import tools
 from .base import Filter
+from .rewrite import RewriteEngine, RewriteRule
+
+# A fill declaration in a style attribute
+_FILL_PATTERN = r"fill:([^;]+);"
+
+# SVGO reading from stdin and writing to stdout
+_SVGO_COMMAND = ["svgo", "--input", "-", "--output", "-", "--multipass"]
 
 
 class SVGOptimizeFilter(Filter):
@@ -43,40 +53,67 @@ class SVGOptimizeFilter(Filter):
             Optimized SVG content
         """
         # Check if svgo is available
-        try:
-            subprocess.run(["svgo", "--version"], capture_output=True, check=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if not tools.available("svgo"):
             logger.warning("SVGO not available, skipping optimization")
             return content
 
         try:
             # Run svgo
             result = subprocess.run(
-                ["svgo", "--input", "-", "--output", "-", "--multipass"],
+                _SVGO_COMMAND,
                 input=content,
                 capture_output=True,
                 text=True,
                 check=True,
             )
+        except subprocess.CalledProcessError as e:
+            logger.error(f"SVGO failed: {e.stderr}")
+            # Return original content on error
+            return content
 
-            optimized = result.stdout
+        return self._optimized(content, result.stdout)
 
-            # Log optimization results
-            original_size = len(content)
-            optimized_size = len(optimized)
-            ratio = (1 - optimized_size / original_size) * 100
-            logger.debug(
-                f"Optimized SVG from {original_size} to {optimized_size} chars "
-                f"({ratio:.1f}% reduction)"
-            )
+    async def apply_async(self, content: str) -> str:  # type: ignore[override]
+        """Apply SVGO optimization to SVG on the event loop.
 
-            return optimized
+        Args:
+            content: SVG content as string
 
+        Returns:
+            Optimized SVG content
+        """
+        if not tools.available("svgo"):
+            logger.warning("SVGO not available, skipping optimization")
+            return content
+
+        try:
+            result = await run_command(_SVGO_COMMAND, input=content, check=True)
         except subprocess.CalledProcessError as e:
             logger.error(f"SVGO failed: {e.stderr}")
-            # Return original content on error
             return content
 
+        return self._optimized(content, result.stdout)
+
+    @staticmethod
+    def _optimized(content: str, optimized: str) -> str:
+        """Log optimization results.
+
+        Args:
+            content: Original SVG
+            optimized: SVG written by SVGO
+
+        Returns:
+            Optimized SVG
+        """
+        original_size = len(content)
+        optimized_size = len(optimized)
+        ratio = (1 - optimized_size / original_size) * 100
+        logger.debug(
+            f"Optimized SVG from {original_size} to {optimized_size} chars "
+            f"({ratio:.1f}% reduction)"
+        )
+        return optimized
+
 
 class SVGTransparentWhiteFilter(Filter):
     """Make white backgrounds transparent in SVG."""
@@ -96,6 +133,31 @@ class SVGTransparentWhiteFilter(Filter):
         """Set of supported file formats."""
         return {"svg"}
 
+    def rewrite_rules(self) -> list[RewriteRule]:
+        """White fill patterns, each replaced with no fill.
+
+        Returns:
+            Rewrite rules
+        """
+        patterns = [
+            ("fill:rgb(100%,100%,100%);", "fill:none;"),
+            ("fill:rgb(255,255,255);", "fill:none;"),
+            ("fill:#ffffff;", "fill:none;"),
+            ("fill:#FFFFFF;", "fill:none;"),
+            ('fill="white"', 'fill="none"'),
+            ('fill="rgb(255,255,255)"', 'fill="none"'),
+            ('fill="#ffffff"', 'fill="none"'),
+            ('fill="#FFFFFF"', 'fill="none"'),
+        ]
+        return [
+            RewriteRule.literal(text, replacement) for text, replacement in patterns
+        ]
+
+    @cached_property
+    def _engine(self) -> RewriteEngine:
+        """The filter's rules, compiled once."""
+        return RewriteEngine(self.rewrite_rules())
+
     # SVG filters only ever handle str, so they narrow the generic base.
     def apply(self, content: str) -> str:  # type: ignore[override]
         """Make white fills transparent.
@@ -106,24 +168,7 @@ class SVGTransparentWhiteFilter(Filter):
         Returns:
             Modified SVG content
         """
-        # Replace various white fill patterns with transparent
-        patterns = [
-            (r"fill:rgb\(100%,100%,100%\);", "fill:none;"),
-            (r"fill:rgb\(255,255,255\);", "fill:none;"),
-            (r"fill:#ffffff;", "fill:none;"),
-            (r"fill:#FFFFFF;", "fill:none;"),
-            (r'fill="white"', 'fill="none"'),
-            (r'fill="rgb\(255,255,255\)"', 'fill="none"'),
-            (r'fill="#ffffff"', 'fill="none"'),
-            (r'fill="#FFFFFF"', 'fill="none"'),
-        ]
-
-        modified = content
-        replacements = 0
-
-        for pattern, replacement in patterns:
-            modified, count = re.subn(pattern, replacement, modified)
-            replacements += count
+        modified, replacements = self._engine.subn(content)
 
         if replacements > 0:
             logger.debug(f"Made {replacements} white fills transparent")
@@ -161,6 +206,28 @@ class SVGColorReplaceFilter(Filter):
         """Set of supported file formats."""
         return {"svg"}
 
+    def rewrite_rules(self) -> list[RewriteRule]:
+        """Fill and stroke replacements for every mapped color.
+
+        Returns:
+            Rewrite rules
+        """
+        rules = []
+        for old_color, new_color in self.color_map.items():
+            # Replace in various formats
+            rules += [
+                RewriteRule.literal(f"fill:{old_color};", f"fill:{new_color};"),
+                RewriteRule.literal(f'fill="{old_color}"', f'fill="{new_color}"'),
+                RewriteRule.literal(f"stroke:{old_color};", f"stroke:{new_color};"),
+                RewriteRule.literal(f'stroke="{old_color}"', f'stroke="{new_color}"'),
+            ]
+        return rules
+
+    @cached_property
+    def _engine(self) -> RewriteEngine:
+        """The filter's rules, compiled once."""
+        return RewriteEngine(self.rewrite_rules())
+
     # SVG filters only ever handle str, so they narrow the generic base.
     def apply(self, content: str) -> str:  # type: ignore[override]
         """Replace colors based on mapping.
@@ -171,21 +238,7 @@ class SVGColorReplaceFilter(Filter):
         Returns:
             Modified SVG content
         """
-        modified = content
-
-        for old_color, new_color in self.color_map.items():
-            # Replace in various formats
-            patterns = [
-                (f"fill:{old_color};", f"fill:{new_color};"),
-                (f'fill="{old_color}"', f'fill="{new_color}"'),
-                (f"stroke:{old_color};", f"stroke:{new_color};"),
-                (f'stroke="{old_color}"', f'stroke="{new_color}"'),
-            ]
-
-            for pattern, replacement in patterns:
-                modified = modified.replace(pattern, replacement)
-
-        return modified
+        return self._engine.sub(content)
 
 
 class SVGFillUnifyFilter(Filter):
@@ -220,6 +273,36 @@ class SVGFillUnifyFilter(Filter):
         """Set of supported file formats."""
         return {"svg"}
 
+    def rewrite_rules(self) -> list[RewriteRule] | None:
+        """Fill replacement for an explicit target color.
+
+        Returns:
+            Rewrite rules, or None when the target depends on the content
+        """
+        if not self.target_color:
+            return None
+        return [self._unify_rule(self.target_color)]
+
+    @staticmethod
+    def _unify_rule(target_color: str) -> RewriteRule:
+        """Build the rule replacing every visible fill with one color.
+
+        Args:
+            target_color: Color to use
+
+        Returns:
+            Rewrite rule
+        """
+
+        # Replace all fills except 'none'
+        def replace_fill(match: re.Match[str]) -> str:
+            current_fill = match.group(1)
+            if current_fill in ["none", "transparent"]:
+                return match.group(0)
+            return f"fill:{target_color};"
+
+        return RewriteRule(_FILL_PATTERN, replace_fill)
+
     # SVG filters only ever handle str, so they narrow the generic base.
     def apply(self, content: str) -> str:  # type: ignore[override]
         """Unify fill colors.
@@ -231,8 +314,7 @@ class SVGFillUnifyFilter(Filter):
             Modified SVG content
         """
         # Find all fill colors
-        fill_pattern = r"fill:([^;]+);"
-        fills = re.findall(fill_pattern, content)
+        fills = re.findall(_FILL_PATTERN, content)
 
         if not fills:
             return content
@@ -252,14 +334,8 @@ class SVGFillUnifyFilter(Filter):
         if not self.target_color:
             return content
 
-        # Replace all fills except 'none'
-        def replace_fill(match: re.Match[str]) -> str:
-            current_fill = match.group(1)
-            if current_fill in ["none", "transparent"]:
-                return match.group(0)
-            return f"fill:{self.target_color};"
-
-        modified = re.sub(fill_pattern, replace_fill, content)
+        rule = self._unify_rule(self.target_color)
+        modified = rule.regex.sub(rule.replacement, content)
 
         logger.debug(f"Unified fills to {self.target_color}")
         return modified
@@ -21,9 +21,43 @@ type PDFFilterFunction = Callable[[bytes], bytes]
 type AsyncFilterFunction = Callable[[bytes], Awaitable[bytes]]
 
 # Backend types
-type BackendName = Literal["poppler", "fitz", "cairo", "cairosvg", "pdfcairo"]
+type BackendName = Literal[
+    "poppler",
+    "fitz",
+    "cairo",
+    "cairosvg",
+    "pdfcairo",
+    "mutool",
+    "rsvg",
+    "qpdf",
+    "inkscape",
+]
 type BackendList = list[BackendName]
 
+# How far SVGs produced by the PDF_TO_SVG backend are trusted
+type SVGTrust = Literal["untrusted", "checked", "trusted"]
+
+# Where the pipeline runs its in-process Python work (filters, sanitizing)
+type ExecutionEngine = Literal["threads", "processes"]
+
+# Stages of a conversion that get their own executor and concurrency limit
+type PipelineStage = Literal[
+    "split",
+    "pdf_filter",
+    "pdf_to_svg",
+    "svg_filter",
+    "svg_to_pdf",
+    "merge",
+]
+PIPELINE_STAGES: tuple[PipelineStage, ...] = (
+    "split",
+    "pdf_filter",
+    "pdf_to_svg",
+    "svg_filter",
+    "svg_to_pdf",
+    "merge",
+)
+
 
 class ProcessingStatus(Enum):
     """Status of processing operations."""
@@ -42,9 +76,20 @@ class BackendCapability(Enum):
     PDF_MERGE = auto()
     PDF_TO_SVG = auto()
     SVG_TO_PDF = auto()
+    # Fused operations that replace several pipeline stages
+    # Render SVGs straight from the unsplit input
+    PDF_SPLIT_TO_SVG = auto()
+    # Render many SVGs straight into one multi-page PDF
+    SVG_TO_PDF_MERGE = auto()
+    # Split, convert and merge a whole document in one operation
+    DOCUMENT_ROUND_TRIP = auto()
     ASYNC_SUPPORT = auto()
+    # Pages become available while the rest of the document is still processed
     STREAMING = auto()
+    # Per-page operations run in long-lived processes, not one process per page
     BATCH_PROCESSING = auto()
+    # Pages are appended to the output one at a time as they finish
+    INCREMENTAL_MERGE = auto()
 
 
 @dataclass(frozen=True)
@@ -58,6 +103,20 @@ class ProcessingMetrics:
     memory_usage_mb: float
     input_file_size_mb: float
     output_file_size_mb: float
+    cache_hit: bool = False  # Output was served from the document cache
+    cache_stats: CacheStats | None = None
+    duplicate_pages: int = 0  # Pages reusing an identical page's result
+    optimized_bytes_saved: int = 0  # Removed by the post-merge optimizer
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Result cache counters."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
 
 
 @dataclass
@@ -71,6 +130,9 @@ class PageInfo:
     output_pdf_path: Path | None = None
     status: ProcessingStatus = ProcessingStatus.PENDING
     error: Exception | None = None
+    digest: str | None = None
+    source_path: Path | None = None  # Unsplit input the page came from
+    page_index: int = 0  # Zero-based position of the page in source_path
 
 
 class ConversionResult(TypedDict):
@@ -151,6 +213,8 @@ class BackendConfig:
     timeout_seconds: float = 300.0
     max_retries: int = 3
     parameters: dict[str, Any] | None = None
+    # Calls to this backend running at once in each stage it serves
+    max_concurrency: int | None = None
 
 
 # Progress callback types
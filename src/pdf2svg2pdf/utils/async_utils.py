@@ -5,15 +5,33 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Awaitable, Callable
+import threading
+import weakref
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Mapping,
+)
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from functools import partial
 from typing import Any, TypeVar
 
 from loguru import logger
 
-from ..types import ProgressCallback
+from ..types import PipelineStage, ProgressCallback
 
 T = TypeVar("T")
 
+# Executor run_async uses inside a StageExecutors.stage() block
+_stage_executor: ContextVar[Executor | None] = ContextVar(
+    "stage_executor", default=None
+)
+
 
 async def run_async[T](
     func: Callable[..., T],
@@ -22,6 +40,9 @@ async def run_async[T](
 ) -> T:
     """Run a sync function in an async context.
 
+    Runs in the current stage's executor inside ``StageExecutors.stage()``,
+    otherwise in the loop's default executor.
+
     Args:
         func: Function to run
         *args: Positional arguments
@@ -30,8 +51,10 @@ async def run_async[T](
     Returns:
         Function result
     """
-    loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, func, *args, **kwargs)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _stage_executor.get(), partial(func, *args, **kwargs)
+    )
 
 
 async def gather_with_progress[T](
@@ -210,3 +233,120 @@ class AsyncPool:
 
         await asyncio.gather(*self.tasks, return_exceptions=True)
         self.tasks.clear()
+
+
+class StageExecutors:
+    """A thread pool and a concurrency limit for each pipeline stage.
+
+    Blocking calls made through ``run_async`` inside ``stage()`` run on that
+    stage's own threads, so a stage that is slow or memory-hungry waits on
+    its own limit instead of starving the others.
+    """
+
+    def __init__(self, limits: Mapping[PipelineStage, int]) -> None:
+        """Initialize; threads start on first use.
+
+        Args:
+            limits: Calls allowed at once per stage
+        """
+        self.limits = dict(limits)
+        self._executors: dict[PipelineStage, ThreadPoolExecutor] = {}
+        # Semaphores belong to one event loop, and converters can be used
+        # from several loops at once, e.g. convert_sync in several threads
+        self._semaphores: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[PipelineStage, asyncio.Semaphore]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    def executor(self, stage: PipelineStage) -> ThreadPoolExecutor:
+        """Get a stage's thread pool.
+
+        Args:
+            stage: Pipeline stage
+
+        Returns:
+            Executor with one thread per allowed call
+        """
+        with self._lock:
+            if stage not in self._executors:
+                self._executors[stage] = ThreadPoolExecutor(
+                    max_workers=self.limits[stage],
+                    thread_name_prefix=f"pdf2svg2pdf-{stage}",
+                )
+            return self._executors[stage]
+
+    def _semaphore(self, stage: PipelineStage) -> asyncio.Semaphore:
+        """Get a stage's limit for the running event loop.
+
+        Args:
+            stage: Pipeline stage
+
+        Returns:
+            Semaphore sized by the stage's limit
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            semaphores = self._semaphores.setdefault(loop, {})
+            if stage not in semaphores:
+                semaphores[stage] = asyncio.Semaphore(self.limits[stage])
+            return semaphores[stage]
+
+    @contextmanager
+    def _routed(self, stage: PipelineStage) -> Iterator[None]:
+        """Route ``run_async`` in a block to a stage's threads.
+
+        Args:
+            stage: Pipeline stage
+        """
+        token = _stage_executor.set(self.executor(stage))
+        try:
+            yield
+        finally:
+            _stage_executor.reset(token)
+
+    @asynccontextmanager
+    async def stage(self, stage: PipelineStage) -> AsyncIterator[None]:
+        """Run a block as one call of a stage.
+
+        Waits for a free slot, then routes ``run_async`` in the block to the
+        stage's threads.
+
+        Args:
+            stage: Pipeline stage
+        """
+        async with self._semaphore(stage):
+            with self._routed(stage):
+                yield
+
+    async def stream(
+        self, stage: PipelineStage, items: AsyncIterator[T]
+    ) -> AsyncGenerator[T, None]:
+        """Iterate over items produced as one call of a stage.
+
+        The stage's slot is held until the items run out, but ``run_async``
+        is routed to the stage's threads only while the next item is being
+        produced. ``stage()`` around the loop of an async generator would
+        leave the routing on for whatever the consumer does between items.
+
+        Args:
+            stage: Pipeline stage
+            items: Items to produce, e.g. a backend's async generator
+
+        Yields:
+            The items
+        """
+        async with self._semaphore(stage):
+            while True:
+                with self._routed(stage):
+                    try:
+                        item = await anext(items)
+                    except StopAsyncIteration:
+                        return
+                yield item
+
+    def close(self) -> None:
+        """Stop every stage's threads once their work finishes."""
+        with self._lock:
+            executors, self._executors = self._executors, {}
+        for executor in executors.values():
+            executor.shutdown(wait=False)
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/utils/commands.py
+"""Run external tools on the event loop, without a thread per call."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import signal
+import subprocess
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+
+# Bytes read from a pipe at a time
+_CHUNK_SIZE = 65536
+
+
+def _kill_process_group(process: asyncio.subprocess.Process) -> None:
+    """Kill a command and every process it started.
+
+    Args:
+        process: Process started in its own session
+    """
+    with contextlib.suppress(ProcessLookupError, PermissionError):
+        if hasattr(os, "killpg"):
+            os.killpg(process.pid, signal.SIGKILL)
+        else:  # pragma: no cover - Windows has no process groups to kill
+            process.kill()
+
+
+async def run_command(
+    command: list[str],
+    timeout: float | None = None,
+    input: str | bytes | None = None,
+    check: bool = False,
+    progress: Callable[[bytes], None] | None = None,
+) -> subprocess.CompletedProcess[str]:
+    """Run a command, streaming its stderr to the debug log.
+
+    The command runs in its own process group. On timeout or cancellation
+    the whole group is killed, so helpers the tool started die with it.
+
+    Args:
+        command: Command and arguments
+        timeout: Seconds to wait for the command to exit
+        input: Data written to the command's stdin
+        check: Raise if the command exits with a non-zero code
+        progress: Called with each chunk of stderr as it arrives, for tools
+            that report progress there
+
+    Returns:
+        Completed process with decoded stdout and stderr
+
+    Raises:
+        TimeoutError: If the command runs longer than ``timeout``
+        subprocess.CalledProcessError: If ``check`` is set and the command
+            fails
+    """
+    pipe, devnull = asyncio.subprocess.PIPE, asyncio.subprocess.DEVNULL
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=pipe if input is not None else devnull,
+        stdout=pipe,
+        stderr=pipe,
+        start_new_session=True,
+    )
+    program = Path(command[0]).name
+    stderr_lines: list[str] = []
+
+    async def feed() -> None:
+        if input is None or process.stdin is None:
+            return
+        data = input.encode("utf-8") if isinstance(input, str) else input
+        try:
+            process.stdin.write(data)
+            await process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            # The command exited without reading everything; its exit code
+            # says why.
+            pass
+        finally:
+            process.stdin.close()
+
+    async def read_stdout() -> bytes:
+        assert process.stdout is not None
+        return await process.stdout.read()
+
+    async def stream_stderr() -> None:
+        assert process.stderr is not None
+        pending = b""
+        while chunk := await process.stderr.read(_CHUNK_SIZE):
+            if progress is not None:
+                progress(chunk)
+            *lines, pending = (pending + chunk).split(b"\n")
+            for line in lines:
+                _log_stderr(program, line, stderr_lines)
+        if pending:
+            _log_stderr(program, pending, stderr_lines)
+
+    try:
+        stdout, _, _, returncode = await asyncio.wait_for(
+            asyncio.gather(read_stdout(), stream_stderr(), feed(), process.wait()),
+            timeout,
+        )
+    except BaseException:
+        # Timed out, cancelled, or the pipes failed: nothing will wait for it
+        _kill_process_group(process)
+        with contextlib.suppress(BaseException):
+            await asyncio.shield(process.wait())
+        raise
+
+    result = subprocess.CompletedProcess(
+        command,
+        returncode,
+        stdout.decode("utf-8", errors="replace"),
+        "\n".join(stderr_lines),
+    )
+    if check:
+        result.check_returncode()
+    return result
+
+
+def _log_stderr(program: str, raw: bytes, lines: list[str]) -> None:
+    """Record one line of a command's stderr.
+
+    Args:
+        program: Command name for the log
+        raw: Line without its newline
+        lines: Collected stderr lines
+    """
+    line = raw.decode("utf-8", errors="replace").rstrip()
+    lines.append(line)
+    if line:
+        logger.debug(f"{program}: {line}")
@@ -4,6 +4,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import tempfile
 from collections.abc import Generator
@@ -31,6 +32,20 @@ def ensure_directory(path: PathLike, mode: int = 0o755) -> Path:
     return path
 
 
+@functools.cache
+def default_file_mode() -> int:
+    """Get the permissions a newly created file gets under the umask.
+
+    The umask can only be read by setting it, so it is read once.
+
+    Returns:
+        Permission bits, e.g. 0o644 under umask 022
+    """
+    umask = os.umask(0o022)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+
 @contextmanager
 def safe_temp_directory(
     prefix: str = "pdf2svg2pdf_",
@@ -101,6 +116,19 @@ def atomic_write(
         raise
 
 
+def default_cache_directory() -> Path:
+    """Return the per-user cache directory for pdf2svg2pdf.
+
+    Honours ``XDG_CACHE_HOME`` and falls back to ``~/.cache``.
+
+    Returns:
+        Path to the cache directory (not created)
+    """
+    base = os.getenv("XDG_CACHE_HOME")
+    root = Path(base) if base else Path.home() / ".cache"
+    return root / "pdf2svg2pdf"
+
+
 def get_file_size_mb(path: PathLike) -> float:
     """Get file size in megabytes.
 
@@ -114,6 +142,21 @@ def get_file_size_mb(path: PathLike) -> float:
     return path.stat().st_size / (1024 * 1024)
 
 
+def get_page_count(path: PathLike) -> int:
+    """Count the pages of a PDF.
+
+    Args:
+        path: PDF path
+
+    Returns:
+        Number of pages
+    """
+    import fitz
+
+    with fitz.open(str(path)) as doc:
+        return int(doc.page_count)
+
+
 def read_file_chunked(
     path: PathLike,
     chunk_size: int = 8192,
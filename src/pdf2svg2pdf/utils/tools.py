@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/utils/tools.py
+"""Discovery of the external command-line tools used by backends and filters."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import threading
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from loguru import logger
+
+from .io import atomic_write, default_cache_directory, ensure_directory
+
+# Tools probed together on first use, with the arguments that print their
+# version. Anything else is probed on demand with ``--version``.
+KNOWN_TOOLS: dict[str, list[str]] = {
+    "pdftocairo": ["-v"],
+    "pdfseparate": ["-v"],
+    "pdfunite": ["-v"],
+    "cairosvg": ["--version"],
+    "gs": ["--version"],
+    "svgo": ["--version"],
+    "qpdf": ["--version"],
+    "mutool": ["-v"],
+    "rsvg-convert": ["--version"],
+    "inkscape": ["--version"],
+}
+
+_PROBE_TIMEOUT = 5
+_STATE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class ToolInfo:
+    """What is known about one external tool."""
+
+    name: str
+    path: str | None = None  # Resolved executable, None when not on PATH
+    mtime: float | None = None  # Executable modification time when probed
+    version: str | None = None  # First line of the version banner
+    healthy: bool = False  # The version command ran successfully
+
+    @property
+    def available(self) -> bool:
+        """Whether the tool is installed and runs."""
+        return self.path is not None and self.healthy
+
+
+def _path_key() -> str:
+    """Fingerprint PATH and its directories.
+
+    Directory mtimes change when executables are added or removed, so tools
+    that were missing are probed again after an install.
+
+    Returns:
+        Key identifying the current executable search path
+    """
+    search_path = os.environ.get("PATH", "")
+    parts = [search_path]
+    for directory in search_path.split(os.pathsep):
+        try:
+            parts.append(f"{directory}:{os.stat(directory).st_mtime_ns}")
+        except OSError:
+            parts.append(f"{directory}:-")
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def probe_tool(name: str) -> ToolInfo:
+    """Locate a tool and run its version command.
+
+    Args:
+        name: Executable name
+
+    Returns:
+        Tool information
+    """
+    path = shutil.which(name)
+    if path is None:
+        return ToolInfo(name=name)
+
+    try:
+        mtime = os.stat(path).st_mtime
+        result = subprocess.run(
+            [path, *KNOWN_TOOLS.get(name, ["--version"])],
+            capture_output=True,
+            text=True,
+            timeout=_PROBE_TIMEOUT,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.debug(f"Probing {name} failed: {e}")
+        return ToolInfo(name=name, path=path)
+
+    if result.returncode != 0:
+        logger.debug(f"{name} exited with {result.returncode}: {result.stderr}")
+        return ToolInfo(name=name, path=path, mtime=mtime)
+
+    # Poppler prints its version banner on stderr.
+    output = (result.stdout or result.stderr).strip()
+    return ToolInfo(
+        name=name,
+        path=path,
+        mtime=mtime,
+        version=output.splitlines()[0] if output else None,
+        healthy=True,
+    )
+
+
+class ToolDiscovery:
+    """Probe external tools once and remember the results across processes.
+
+    Results are persisted as JSON keyed by PATH (and the mtimes of its
+    directories). An entry is reused while its executable's mtime is
+    unchanged, so a new process normally starts without spawning anything.
+    """
+
+    def __init__(self, state_path: Path | None = None) -> None:
+        """Initialize discovery.
+
+        Args:
+            state_path: JSON file for persisted results; defaults to
+                ``tools.json`` in the user cache directory
+        """
+        self.state_path = state_path or default_cache_directory() / "tools.json"
+        self._tools: dict[str, ToolInfo] | None = None
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> ToolInfo:
+        """Get information about a tool, probing it if needed.
+
+        Args:
+            name: Executable name
+
+        Returns:
+            Tool information
+        """
+        with self._lock:
+            tools = self._ensure_loaded()
+            if name not in tools:
+                tools[name] = probe_tool(name)
+                self._save(tools)
+            return tools[name]
+
+    def available(self, name: str) -> bool:
+        """Check whether a tool is installed and runs.
+
+        Args:
+            name: Executable name
+
+        Returns:
+            True if the tool is usable
+        """
+        return self.get(name).available
+
+    def version(self, name: str) -> str | None:
+        """Get a tool's version banner.
+
+        Args:
+            name: Executable name
+
+        Returns:
+            First line of the version output, or None if unknown
+        """
+        return self.get(name).version
+
+    def all(self) -> dict[str, ToolInfo]:
+        """Get information about every known and previously probed tool.
+
+        Returns:
+            Tool information by name
+        """
+        with self._lock:
+            return dict(sorted(self._ensure_loaded().items()))
+
+    def refresh(self, names: Iterable[str] | None = None) -> dict[str, ToolInfo]:
+        """Probe tools again, ignoring persisted results.
+
+        Args:
+            names: Tools to probe; defaults to every known tool
+
+        Returns:
+            Fresh tool information by name
+        """
+        with self._lock:
+            fresh = self._probe_all(list(names or KNOWN_TOOLS))
+            tools = self._ensure_loaded()
+            tools.update(fresh)
+            self._save(tools)
+            return fresh
+
+    def _ensure_loaded(self) -> dict[str, ToolInfo]:
+        """Load persisted results, probing whatever is missing or stale.
+
+        Returns:
+            Tool information by name
+        """
+        if self._tools is not None:
+            return self._tools
+
+        tools = self._load()
+        names = [*KNOWN_TOOLS, *(name for name in tools if name not in KNOWN_TOOLS)]
+        stale = [name for name in names if not self._is_current(tools.get(name))]
+        if stale:
+            tools.update(self._probe_all(stale))
+            self._save(tools)
+
+        self._tools = tools
+        return tools
+
+    @staticmethod
+    def _is_current(info: ToolInfo | None) -> bool:
+        """Check that a persisted entry still describes the installed tool.
+
+        Args:
+            info: Persisted tool information
+
+        Returns:
+            True if the entry can be reused
+        """
+        if info is None:
+            return False
+        if info.path is None:
+            # Still missing unless a PATH directory changed, which
+            # _load already checked.
+            return True
+        try:
+            return os.stat(info.path).st_mtime == info.mtime
+        except OSError:
+            return False
+
+    @staticmethod
+    def _probe_all(names: list[str]) -> dict[str, ToolInfo]:
+        """Probe several tools in parallel.
+
+        Args:
+            names: Executable names
+
+        Returns:
+            Tool information by name
+        """
+        if not names:
+            return {}
+
+        logger.debug(f"Probing tools: {', '.join(names)}")
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            return dict(zip(names, executor.map(probe_tool, names), strict=True))
+
+    def _load(self) -> dict[str, ToolInfo]:
+        """Read persisted results for the current PATH.
+
+        Returns:
+            Tool information by name, empty if nothing usable is stored
+        """
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+            if (
+                state.get("version") != _STATE_VERSION
+                or state.get("path_key") != _path_key()
+            ):
+                return {}
+            return {name: ToolInfo(**fields) for name, fields in state["tools"].items()}
+        except (OSError, ValueError, TypeError, KeyError):
+            return {}
+
+    def _save(self, tools: dict[str, ToolInfo]) -> None:
+        """Persist results; failures only cost a re-probe next time.
+
+        Args:
+            tools: Tool information by name
+        """
+        state = {
+            "version": _STATE_VERSION,
+            "path_key": _path_key(),
+            "tools": {name: asdict(info) for name, info in tools.items()},
+        }
+        try:
+            ensure_directory(self.state_path.parent)
+            with atomic_write(self.state_path) as f:
+                json.dump(state, f, indent=2)
+        except OSError as e:
+            logger.debug(f"Could not persist tool discovery results: {e}")
+
+
+# Global discovery instance
+tools = ToolDiscovery()
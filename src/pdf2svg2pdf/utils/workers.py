@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# this_file: src/pdf2svg2pdf/utils/workers.py
+"""Warm workers for in-process rendering libraries."""
+
+from __future__ import annotations
+
+import ast
+import asyncio
+import atexit
+import multiprocessing
+import sys
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from multiprocessing.pool import Pool
+from typing import Any
+
+from loguru import logger
+
+
+class WorkerRestartedError(RuntimeError):
+    """A task was lost because its worker pool was restarted."""
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    """Check whether a statement is ``if __name__ == "__main__":``.
+
+    Args:
+        node: Module-level statement
+
+    Returns:
+        True for the entry-point guard, with the operands in either order
+    """
+    if not (isinstance(node, ast.If) and isinstance(node.test, ast.Compare)):
+        return False
+    test = node.test
+    if len(test.ops) != 1 or not isinstance(test.ops[0], ast.Eq):
+        return False
+    operands = {ast.unparse(test.left), ast.unparse(test.comparators[0])}
+    return operands in ({"__name__", "'__main__'"}, {"__name__", '"__main__"'})
+
+
+def main_is_guarded() -> bool:
+    """Check that starting processes will not re-run the main script.
+
+    ``spawn`` and ``forkserver`` children import the main module again, so
+    a script that starts workers from module level, outside an
+    ``if __name__ == "__main__":`` block, would run once more in every
+    child. This looks at the statement the main thread is executing in the
+    main module, if any, and checks that it is inside the guard.
+
+    Returns:
+        False if the main script is starting workers outside its guard
+    """
+    main = sys.modules.get("__main__")
+    path = getattr(main, "__file__", None)
+    if main is None or not path:
+        return True
+
+    frame = sys._current_frames().get(threading.main_thread().ident or 0)
+
+    while frame is not None:
+        if frame.f_globals is vars(main) and frame.f_code.co_name == "<module>":
+            break
+        frame = frame.f_back
+    else:
+        # The main script is not executing, e.g. it is done or not a script
+        return True
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    except (OSError, SyntaxError, UnicodeDecodeError, ValueError):
+        return True
+    line = frame.f_lineno
+    return any(
+        _is_main_guard(node) and node.lineno <= line <= (node.end_lineno or line)
+        for node in tree.body
+    )
+
+
+class WorkerPool:
+    """Pool of long-lived workers with per-task timeouts.
+
+    By default workers are threads, each warmed up once by ``initializer``,
+    so each task only pays for the work itself; ``threadsafe=False`` runs
+    the tasks one at a time for libraries that must not be entered from two
+    threads at once. A thread cannot be interrupted, so a task that exceeds
+    its timeout is abandoned and finishes in the background.
+
+    ``processes=True`` uses worker processes instead, so CPU-bound work is
+    not serialized by the GIL. They are started with ``spawn`` (forking a
+    process that runs an event loop and threads is unsafe), which imports
+    the main module again in every worker, so the script must guard its
+    entry point with ``if __name__ == "__main__":``. A script that starts
+    the pool outside the guard is detected before any process starts and
+    gets threads instead. A task that exceeds its timeout is killed by
+    terminating and recreating the whole pool; other tasks in flight on it
+    are resubmitted.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        initializer: Callable[[], None] | None = None,
+        name: str = "workers",
+        processes: bool = False,
+        threadsafe: bool = True,
+    ) -> None:
+        """Initialize the pool; workers start on first use.
+
+        Args:
+            workers: Number of workers
+            initializer: Called once in every worker, e.g. to import libraries
+            name: Name used in log messages
+            processes: Use worker processes instead of threads
+            threadsafe: Whether tasks may run on several threads at once
+        """
+        self.workers = max(1, workers)
+        self.initializer = initializer
+        self.name = name
+        self.processes = processes
+        self.threadsafe = threadsafe
+        self._pool: Pool | None = None
+        # Used instead of processes when they are off or cannot be started
+        self._threads: ThreadPoolExecutor | None = None
+        self._pending: set[asyncio.Future[Any]] = set()
+        self._lock = threading.Lock()
+        atexit.register(self.close)
+
+    def _ensure_pool(self) -> Pool | None:
+        """Start the workers if needed.
+
+        Returns:
+            Running process pool, or None if tasks run in threads
+        """
+        with self._lock:
+            if self._pool is not None or self._threads is not None:
+                return self._pool
+
+            if self.processes and not main_is_guarded():
+                logger.warning(
+                    f"Not starting {self.name} processes from an unguarded script; "
+                    "running tasks in threads instead. Guard the script's entry "
+                    'point with `if __name__ == "__main__":` to use worker '
+                    "processes."
+                )
+            elif self.processes:
+                context = multiprocessing.get_context("spawn")
+                try:
+                    self._pool = context.Pool(self.workers, self.initializer)
+                except (RuntimeError, OSError) as e:
+                    # Typically a spawned process importing the main module
+                    reason = " ".join(str(e).split()).split(". ")[0]
+                    logger.warning(
+                        f"Cannot start {self.name} processes ({reason}); running "
+                        "tasks in threads instead."
+                    )
+                else:
+                    logger.debug(f"Started {self.workers} {self.name} processes")
+                    return self._pool
+
+            self._threads = ThreadPoolExecutor(
+                self.workers if self.threadsafe else 1,
+                f"pdf2svg2pdf-{self.name}",
+                self.initializer,
+            )
+            return None
+
+    def _restart(self, pool: Pool) -> None:
+        """Terminate a pool and fail every task still running on it.
+
+        Args:
+            pool: Pool to terminate, if it is still the current one
+        """
+        with self._lock:
+            if self._pool is not pool:
+                return
+            self._pool = None
+            pending, self._pending = self._pending, set()
+
+        pool.terminate()
+        logger.warning(f"Restarted {self.name} processes after a timeout")
+        for future in pending:
+            _settle(future, _reject, WorkerRestartedError(self.name))
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        timeout: float | None = None,
+    ) -> Any:
+        """Run a function in a worker.
+
+        Args:
+            func: Module-level function to call, picklable for processes
+            *args: Arguments, picklable for processes
+            timeout: Seconds to wait before the task is killed or abandoned
+
+        Returns:
+            Function result
+
+        Raises:
+            TimeoutError: If the task exceeds ``timeout``
+        """
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pool = self._ensure_pool()
+            if pool is None:
+                assert self._threads is not None
+                return await asyncio.wait_for(
+                    loop.run_in_executor(self._threads, partial(func, *args)),
+                    timeout,
+                )
+
+            future: asyncio.Future[Any] = loop.create_future()
+            with self._lock:
+                self._pending.add(future)
+
+            pool.apply_async(
+                func,
+                args,
+                callback=partial(_settle, future, _resolve),
+                error_callback=partial(_settle, future, _reject),
+            )
+
+            try:
+                return await asyncio.wait_for(future, timeout)
+            except WorkerRestartedError:
+                # Another task timed out and took this one's worker with it
+                continue
+            except TimeoutError:
+                self._restart(pool)
+                raise
+            finally:
+                with self._lock:
+                    self._pending.discard(future)
+
+    def close(self) -> None:
+        """Stop the workers."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+            threads, self._threads = self._threads, None
+        if pool is not None:
+            pool.terminate()
+        if threads is not None:
+            threads.shutdown(wait=False, cancel_futures=True)
+
+
+def _settle(
+    future: asyncio.Future[Any],
+    setter: Callable[[asyncio.Future[Any], Any], None],
+    value: Any,
+) -> None:
+    """Complete a future from any thread.
+
+    Args:
+        future: Future to complete
+        setter: ``_resolve`` or ``_reject``
+        value: Result or exception
+    """
+    try:
+        future.get_loop().call_soon_threadsafe(setter, future, value)
+    except RuntimeError:
+        # The loop that was waiting has been closed; nobody needs the result.
+        pass
+
+
+def _resolve(future: asyncio.Future[Any], result: Any) -> None:
+    """Set a result unless the future was cancelled or already failed."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _reject(future: asyncio.Future[Any], error: BaseException) -> None:
+    """Set an exception unless the future was cancelled or already resolved."""
+    if not future.done():
+        future.set_exception(error)
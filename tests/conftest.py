@@ -1,10 +1,30 @@
-"""
-Dummy conftest.py for pdf2svg2pdf.
+#!/usr/bin/env python3
+# this_file: tests/conftest.py
+"""Shared fixtures for the pdf2svg2pdf test suite."""
 
-If you don't know what this is for, just leave it empty.
-Read more about conftest.py under:
-- https://docs.pytest.org/en/stable/fixture.html
-- https://docs.pytest.org/en/stable/writing_plugins.html
-"""
+from __future__ import annotations
 
-# import pytest
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from pdf2svg2pdf.utils.tools import tools
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    """Keep the result cache and tool discovery state out of the real home.
+
+    Every test starts with an empty per-user cache directory under
+    ``tmp_path``, so results never depend on what ran before.
+
+    Yields:
+        The test's cache directory
+    """
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    monkeypatch.delenv("PDF2SVG2PDF_CACHE_DIR", raising=False)
+    monkeypatch.setattr(tools, "state_path", cache_home / "pdf2svg2pdf" / "tools.json")
+    monkeypatch.setattr(tools, "_tools", None)
+    yield cache_home / "pdf2svg2pdf"
@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+# this_file: tests/test_cache.py
+"""Tests for the content-addressed result cache."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+
+import fitz
+import pytest
+
+from pdf2svg2pdf.config import CacheConfig, Configuration
+from pdf2svg2pdf.core.cache import (
+    ResultCache,
+    cache_key,
+    document_page_digests,
+    page_digest,
+)
+from pdf2svg2pdf.utils.io import default_file_mode
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - no advisory locks on Windows
+    fcntl = None  # type: ignore[assignment]
+
+
+@pytest.fixture
+def workdir() -> Path:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+def _cache(workdir: Path, **overrides) -> ResultCache:
+    overrides.setdefault("enabled", True)
+    return ResultCache(CacheConfig(directory=workdir / "cache", **overrides))
+
+
+class TestKeys:
+    def test_cache_key_is_order_sensitive(self):
+        assert cache_key("a", "b") != cache_key("b", "a")
+        assert cache_key("a", "b") == cache_key("a", "b")
+
+    def test_page_digest_ignores_ids_and_timestamps(self, workdir: Path):
+        first = workdir / "a.pdf"
+        second = workdir / "b.pdf"
+        first.write_bytes(
+            b"%PDF-1.4 stream /CreationDate (D:20240101) trailer /ID [<AA><BB>]"
+        )
+        second.write_bytes(
+            b"%PDF-1.4 stream /CreationDate (D:20250202) trailer /ID [<CC><DD>]"
+        )
+        assert page_digest(first) == page_digest(second)
+
+    def test_page_digest_sees_content_changes(self, workdir: Path):
+        first = workdir / "a.pdf"
+        second = workdir / "b.pdf"
+        first.write_bytes(b"%PDF-1.4 stream one")
+        second.write_bytes(b"%PDF-1.4 stream two")
+        assert page_digest(first) != page_digest(second)
+
+    def test_document_page_digests_follow_page_content(self, workdir: Path):
+        def document(path: Path, *texts: str) -> Path:
+            doc = fitz.open()
+            for text in texts:
+                doc.new_page(width=200, height=200).insert_text((20, 100), text)
+            doc.save(str(path))
+            doc.close()
+            return path
+
+        first = document_page_digests(document(workdir / "a.pdf", "a", "b", "a"))
+        second = document_page_digests(document(workdir / "b.pdf", "b", "c"))
+
+        assert first[0] == first[2]
+        assert first[0] != first[1]
+        # Same page, other document, other object numbers
+        assert first[1] == second[0]
+        assert second[0] != second[1]
+
+
+class TestResultCache:
+    def test_roundtrip(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        assert not cache.fetch("pages", key, workdir / "out.pdf")
+        cache.put("pages", key, source)
+        assert cache.fetch("pages", key, workdir / "out.pdf")
+        assert (workdir / "out.pdf").read_bytes() == b"%PDF-1.4 page"
+
+    def test_namespaces_are_separate(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        cache.put("pages", key, source)
+        assert cache.get("svg", key) is None
+
+    def test_fetch_can_hardlink(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "doc.pdf"
+        source.write_bytes(b"%PDF-1.4 doc")
+        key = cache_key("doc")
+
+        cache.put("documents", key, source)
+        assert cache.fetch("documents", key, workdir / "out.pdf", link=True)
+        assert (workdir / "out.pdf").read_bytes() == b"%PDF-1.4 doc"
+        assert (workdir / "out.pdf").stat().st_nlink == 2
+
+    def test_fetch_copies_with_umask_mode(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "doc.pdf"
+        source.write_bytes(b"%PDF-1.4 doc")
+        key = cache_key("doc")
+        output = workdir / "out.pdf"
+
+        cache.put("documents", key, source)
+        assert cache.fetch("documents", key, output, link=True)
+        # A later copy must not write through the link into the entry
+        assert cache.fetch("documents", key, output)
+        output.write_bytes(b"changed")
+
+        entry = cache.get("documents", key)
+        assert entry is not None
+        assert entry.read_bytes() == b"%PDF-1.4 doc"
+        assert output.stat().st_nlink == 1
+        if os.name == "posix":
+            assert entry.stat().st_mode & 0o777 == default_file_mode()
+            assert output.stat().st_mode & 0o777 == default_file_mode()
+
+    def test_total_size_follows_the_entries(self, workdir: Path):
+        cache = _cache(workdir)
+        index = cache.index
+        now = time.time()
+
+        index.add("pages", "a", 10, False, now)
+        index.add("pages", "b", 5, False, now)
+        index.add("pages", "a", 7, False, now)
+        assert index.total_size() == 12
+
+        index.remove("pages", "b")
+        assert index.total_size() == 7
+        index.clear()
+        assert index.total_size() == 0
+
+    def test_total_size_is_filled_in_for_an_older_index(self, workdir: Path):
+        cache = _cache(workdir)
+        cache.index.add("pages", "a", 10, False, time.time())
+        cache.index.close()
+        with sqlite3.connect(cache.index.path) as connection:
+            connection.executescript(
+                "DROP TABLE totals; DROP TRIGGER entries_added;"
+                " DROP TRIGGER entries_removed; DROP TRIGGER entries_resized;"
+            )
+        connection.close()
+
+        assert _cache(workdir).index.total_size() == 10
+
+    def test_cache_is_off_by_default(self):
+        assert not Configuration().cache.enabled
+        assert not ResultCache(CacheConfig()).enabled
+
+    def test_disabled_cache_stores_nothing(self, workdir: Path):
+        cache = _cache(workdir, enabled=False)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        cache.put("pages", key, source)
+        assert cache.get("pages", key) is None
+        assert not (workdir / "cache").exists()
+
+
+class TestMaintenance:
+    def test_lru_eviction_respects_max_size(self, workdir: Path):
+        cache = _cache(workdir, max_size_mb=1)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"x" * 400 * 1024)
+
+        keys = [cache_key(str(i)) for i in range(3)]
+        cache.put("pages", keys[0], source)
+        cache.put("pages", keys[1], source)
+        # Touch the first entry so the second is the least recently used.
+        assert cache.get("pages", keys[0]) is not None
+        cache.put("pages", keys[2], source)
+
+        assert cache.get("pages", keys[0]) is not None
+        assert cache.get("pages", keys[1]) is None
+        assert cache.get("pages", keys[2]) is not None
+        assert cache.stats().evictions == 1
+
+    def test_memory_hits_count_for_lru_eviction(self, workdir: Path):
+        cache = _cache(workdir, max_size_mb=1)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"x" * 400 * 1024)
+
+        keys = [cache_key(str(i)) for i in range(3)]
+        cache.put("pages", keys[0], source)
+        cache.put("pages", keys[1], source)
+        # Served from the memory tier, without reading the disk store
+        assert cache.fetch("pages", keys[0], workdir / "out.pdf")
+        cache.put("pages", keys[2], source)
+
+        other = _cache(workdir, max_size_mb=1)
+        assert other.get("pages", keys[0]) is not None
+        assert other.get("pages", keys[1]) is None
+
+    def test_expired_entries_are_misses(self, workdir: Path):
+        cache = _cache(workdir, ttl_seconds=60)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        cache.put("pages", key, source)
+        cache.index.add("pages", key, 13, False, time.time() - 120)
+
+        # A second process sharing the directory has an empty memory tier.
+        other = _cache(workdir, ttl_seconds=60)
+        assert not other.fetch("pages", key, workdir / "out.pdf")
+        assert other.stats().expirations == 1
+
+    def test_svg_entries_are_compressed(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.svg"
+        source.write_text("<svg>" + "<path/>" * 1000 + "</svg>")
+        key = cache_key("svg")
+
+        cache.put("svg", key, source)
+        stored = cache.get("svg", key)
+        assert stored is not None
+        assert gzip.decompress(stored.read_bytes()) == source.read_bytes()
+
+        assert cache.fetch("svg", key, workdir / "out.svg")
+        assert (workdir / "out.svg").read_text() == source.read_text()
+
+    def test_prune_removes_orphans(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        cache.put("pages", cache_key("page"), source)
+
+        orphan = workdir / "cache" / "pages" / "ab" / "abandoned"
+        orphan.parent.mkdir(parents=True, exist_ok=True)
+        orphan.write_bytes(b"stale")
+        hour_ago = time.time() - 7200
+        os.utime(orphan, (hour_ago, hour_ago))
+        # Another process's write in progress
+        in_flight = orphan.parent / ".abcdef.x1y2.tmp"
+        in_flight.write_bytes(b"partial")
+
+        assert cache.prune()["orphaned"] == 1
+        assert not orphan.exists()
+        assert in_flight.exists()
+
+    @pytest.mark.skipif(fcntl is None, reason="needs advisory file locks")
+    async def test_lock_unlinked_while_waiting_is_retaken(self, workdir: Path):
+        cache = _cache(workdir)
+        path = workdir / "cache" / "locks" / "pages-key.lock"
+        path.parent.mkdir(parents=True)
+
+        # Stands in for prune() holding the lock file while it unlinks it
+        with open(path, "ab") as pruner:
+            fcntl.flock(pruner.fileno(), fcntl.LOCK_EX)
+            waiter = asyncio.create_task(cache._acquire_file_lock("pages", "key"))
+            await asyncio.sleep(0.05)
+            path.unlink()
+        handle = await asyncio.wait_for(waiter, 5)
+
+        assert handle is not None
+        try:
+            assert os.path.samestat(os.fstat(handle.fileno()), os.stat(path))
+        finally:
+            handle.close()
+
+    def test_counters(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        cache.fetch("pages", key, workdir / "out.pdf")
+        cache.put("pages", key, source)
+        cache.fetch("pages", key, workdir / "out.pdf")
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_clear(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        cache.put("pages", key, source)
+        cache.clear()
+        assert cache.get("pages", key) is None
+        assert cache.usage() == {}
+
+
+class TestSharing:
+    def test_memory_tier_serves_repeat_hits(self, workdir: Path):
+        cache = _cache(workdir)
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        cache.put("pages", key, source)
+        entry = cache.get("pages", key)
+        assert entry is not None
+        entry.unlink()
+
+        assert cache.fetch("pages", key, workdir / "out.pdf")
+        assert (workdir / "out.pdf").read_bytes() == b"%PDF-1.4 page"
+
+    def test_processes_share_the_disk_store(self, workdir: Path):
+        source = workdir / "page.pdf"
+        source.write_bytes(b"%PDF-1.4 page")
+        key = cache_key("page")
+
+        _cache(workdir).put("pages", key, source)
+        assert _cache(workdir).fetch("pages", key, workdir / "out.pdf")
+
+    async def test_single_flight_runs_one_producer_at_a_time(self, workdir: Path):
+        cache = _cache(workdir)
+        active = 0
+        peak = 0
+
+        async def produce() -> None:
+            nonlocal active, peak
+            async with cache.single_flight("pages", "k"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(produce(), produce(), produce())
+        assert peak == 1
+        assert not cache._flights
+
+
+class TestConfigurationFingerprint:
+    def test_ignores_runtime_settings(self):
+        config = Configuration()
+        tuned = Configuration()
+        tuned.processing.parallel_pages = 16
+        tuned.cache.ttl_seconds = 1
+        assert config.fingerprint() == tuned.fingerprint()
+
+    def test_tracks_filters(self):
+        from pdf2svg2pdf.types import FilterConfig
+
+        config = Configuration()
+        filtered = Configuration(svg_filters=[FilterConfig(name="transparent_white")])
+        assert config.fingerprint() != filtered.fingerprint()
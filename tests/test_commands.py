@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+# this_file: tests/test_commands.py
+"""Tests for the asyncio subprocess runner."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pdf2svg2pdf.utils.commands import run_command
+
+# Starts a grandchild that outlives its parent unless the group is killed
+_SPAWN_AND_HANG = """
+import subprocess, sys, time
+child = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+open(sys.argv[1], "w").write(str(child.pid))
+time.sleep(60)
+"""
+
+
+def _alive(pid: int) -> bool:
+    # Killed processes waiting to be reaped count as gone
+    try:
+        os.kill(pid, 0)
+        with open(f"/proc/{pid}/stat") as f:
+            return f.read().split()[2] != "Z"
+    except (ProcessLookupError, FileNotFoundError):
+        return False
+
+
+class TestRunCommand:
+    async def test_feeds_stdin_and_captures_output(self):
+        script = (
+            "import sys; print(sys.stdin.read().upper()); "
+            "print('warn', file=sys.stderr)"
+        )
+        result = await run_command([sys.executable, "-c", script], input="page")
+
+        assert result.returncode == 0
+        assert result.stdout.strip() == "PAGE"
+        assert result.stderr == "warn"
+
+    async def test_check_raises_on_failure(self):
+        with pytest.raises(subprocess.CalledProcessError):
+            await run_command([sys.executable, "-c", "raise SystemExit(3)"], check=True)
+
+    @pytest.mark.skipif(not Path("/proc").exists(), reason="needs /proc")
+    async def test_timeout_kills_the_process_group(self, tmp_path: Path):
+        pid_file = tmp_path / "pid"
+        command = [sys.executable, "-c", _SPAWN_AND_HANG, str(pid_file)]
+
+        task = asyncio.create_task(run_command(command, timeout=30))
+        while not pid_file.exists() or not pid_file.read_text():
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        grandchild = int(pid_file.read_text())
+        deadline = time.monotonic() + 5
+        while _alive(grandchild) and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        assert not _alive(grandchild)
+
+    async def test_timeout_raises(self):
+        with pytest.raises(TimeoutError):
+            await run_command(
+                [sys.executable, "-c", "import time; time.sleep(30)"], timeout=0.5
+            )
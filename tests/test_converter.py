@@ -0,0 +1,879 @@
+#!/usr/bin/env python3
+# this_file: tests/test_converter.py
+"""Tests for the converter's page handling and the backends it drives."""
+
+from __future__ import annotations
+
+import asyncio
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import AsyncGenerator
+from dataclasses import replace
+from pathlib import Path
+from unittest.mock import patch
+
+import fitz
+import pytest
+
+from pdf2svg2pdf.backends.base import registry as backend_registry
+from pdf2svg2pdf.backends.fitz import FitzBackend
+from pdf2svg2pdf.backends.inkscape import _SessionPool
+from pdf2svg2pdf.backends.mutool import MutoolBackend, _DocumentRender
+from pdf2svg2pdf.backends.qpdf import QpdfBackend
+from pdf2svg2pdf.backends.rsvg import RsvgBackend
+from pdf2svg2pdf.config import CacheConfig, Configuration
+from pdf2svg2pdf.core.converter import Converter
+from pdf2svg2pdf.core.exceptions import DependencyError
+from pdf2svg2pdf.core.optimize import optimize_pdf
+from pdf2svg2pdf.core.pipeline import ProcessingPipeline
+from pdf2svg2pdf.core.planner import PlanStep, plan_conversion
+from pdf2svg2pdf.types import BackendCapability, BackendConfig, FilterConfig, PageInfo
+from pdf2svg2pdf.utils.async_utils import StageExecutors, run_async
+
+
+@pytest.fixture
+def workdir() -> Path:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+def _page_pdf(path: Path, text: str) -> Path:
+    doc = fitz.open()
+    page = doc.new_page(width=200, height=200)
+    page.insert_text((20, 100), text)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+class TestDuplicatePages:
+    async def test_groups_identical_pages(self, workdir: Path):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for text in ("cover", "body", "cover"):
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(source))
+        doc.close()
+
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000)],
+            cache=CacheConfig(enabled=False),
+        )
+        converter = Converter(config)
+        # Split into files, as poppler or qpdf would, so pages are compared
+        backend = converter.plan.backend_for("split")
+        steps = tuple(
+            PlanStep(capability, backend, 1)
+            for capability in (
+                BackendCapability.PDF_SPLIT,
+                BackendCapability.PDF_TO_SVG,
+                BackendCapability.SVG_TO_PDF,
+                BackendCapability.PDF_MERGE,
+            )
+        )
+        converter.plan = replace(converter.plan, steps=steps)
+        converter.pipeline._plan = converter.plan
+
+        try:
+            result = await converter.convert(source, workdir / "out.pdf")
+        finally:
+            converter.pipeline.close()
+            backend._worker_pool().close()
+
+        assert result["success"], result["error"]
+        assert result["metrics"].duplicate_pages == 1
+        with fitz.open(str(workdir / "out.pdf")) as out:
+            assert out.page_count == 3
+
+    async def test_fitz_merge_shares_repeated_pages(self, workdir: Path):
+        cover = _page_pdf(workdir / "cover.pdf", "cover")
+        body = _page_pdf(workdir / "body.pdf", "body")
+        output = workdir / "merged.pdf"
+
+        await FitzBackend().merge_pdfs([cover, body, cover], output)
+
+        with fitz.open(str(output)) as doc:
+            assert doc.page_count == 3
+            assert doc[0].xref == doc[2].xref
+            assert doc[0].xref != doc[1].xref
+
+
+class TestOptimize:
+    def test_shares_streams_repeated_across_pages(self, workdir: Path):
+        # Two page PDFs that each embed the same image, merged naively.
+        pixmap = fitz.Pixmap(fitz.csRGB, fitz.IRect(0, 0, 64, 64), False)
+        pixmap.clear_with(200)
+        image = pixmap.tobytes("png")
+        merged = fitz.open()
+        for _ in range(2):
+            single = fitz.open()
+            single.new_page().insert_image(fitz.Rect(0, 0, 64, 64), stream=image)
+            merged.insert_pdf(single)
+            single.close()
+        output = workdir / "merged.pdf"
+        merged.save(str(output))
+        merged.close()
+
+        original_size = output.stat().st_size
+        saved = optimize_pdf(output)
+
+        assert saved > 0
+        assert output.stat().st_size == original_size - saved
+        with fitz.open(str(output)) as doc:
+            assert doc.page_count == 2
+            assert len({img[0] for page in doc for img in page.get_images()}) == 1
+
+    def test_keeps_files_it_cannot_shrink(self, workdir: Path):
+        output = _page_pdf(workdir / "page.pdf", "text")
+        optimize_pdf(output)
+        before = output.read_bytes()
+
+        assert optimize_pdf(output) == 0
+        assert output.read_bytes() == before
+
+
+class TestFitzPdfToSvg:
+    async def test_renders_page_from_source_document(self, workdir: Path):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for text in ("first", "second"):
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(source))
+        doc.close()
+
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", parameters={"text_as_path": False})]
+        )
+        backend = FitzBackend(config)
+        try:
+            svg = await backend.pdf_to_svg(source, workdir / "page.svg", page_index=1)
+        finally:
+            backend._worker_pool().close()
+
+        content = svg.read_text()
+        assert content.startswith("<svg")
+        assert "second" in content and "first" not in content
+
+
+class TestFitzInMemory:
+    async def test_converts_without_intermediate_files(self, workdir: Path):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for text in ("cover", "body", "cover"):
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(source))
+        doc.close()
+
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000)],
+            cache=CacheConfig(enabled=False),
+        )
+        converter = Converter(config)
+        plan = converter.plan
+        assert plan.uses(BackendCapability.DOCUMENT_ROUND_TRIP)
+        backend = plan.backend_for("split")
+        assert isinstance(backend, FitzBackend)
+
+        try:
+            result = await converter.convert(source, workdir / "out.pdf")
+        finally:
+            backend._worker_pool().close()
+
+        assert result["success"], result["error"]
+        assert result["metrics"].duplicate_pages == 1
+        with fitz.open(str(workdir / "out.pdf")) as out:
+            assert out.page_count == 3
+            assert out[0].xref == out[2].xref
+        assert sorted(p.name for p in workdir.iterdir()) == ["doc.pdf", "out.pdf"]
+
+
+class TestSplitFree:
+    def _document(self, path: Path, *texts: str) -> Path:
+        doc = fitz.open()
+        for text in texts:
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(path))
+        doc.close()
+        return path
+
+    async def test_pages_address_the_input(self, workdir: Path):
+        source = self._document(workdir / "doc.pdf", "first", "second")
+        config = Configuration(cache=CacheConfig(enabled=False))
+        config.processing.split_pages = False
+        converter = Converter(config)
+
+        pages = [
+            page
+            async for page in converter._stream_pages(
+                source, workdir / "pages", None, 2
+            )
+        ]
+
+        assert [(p.input_path, p.page_index) for p in pages] == [
+            (source, 0),
+            (source, 1),
+        ]
+
+    async def test_single_page_input_is_not_split(self, workdir: Path):
+        source = self._document(workdir / "doc.pdf", "only")
+        converter = Converter(Configuration(cache=CacheConfig(enabled=False)))
+
+        pages = [
+            page
+            async for page in converter._stream_pages(
+                source, workdir / "pages", FitzBackend(), 1
+            )
+        ]
+
+        assert [p.input_path for p in pages] == [source]
+        assert not (workdir / "pages").exists()
+
+    async def test_converts_without_splitting(self, workdir: Path):
+        source = self._document(workdir / "doc.pdf", "first", "second")
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000)],
+            cache=CacheConfig(enabled=False),
+        )
+        config.processing.split_pages = False
+        # Keeps the file-based pipeline instead of the in-memory round trip
+        config.processing.preserve_temp_files = True
+        converter = Converter(config)
+
+        result = await converter.convert(source, workdir / "out.pdf")
+
+        assert result["success"], result["error"]
+        with fitz.open(str(workdir / "out.pdf")) as out:
+            assert out.page_count == 2
+            # Text is drawn as outlines, so compare the rendered pages
+            assert out[0].get_pixmap().samples != out[1].get_pixmap().samples
+
+    async def test_repeated_pages_are_converted_once(self, workdir: Path):
+        source = self._document(workdir / "doc.pdf", "cover", "body", "cover")
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000)],
+            cache=CacheConfig(enabled=False),
+        )
+        config.processing.split_pages = False
+        config.processing.preserve_temp_files = True
+        converter = Converter(config)
+
+        result = await converter.convert(source, workdir / "out.pdf")
+
+        assert result["success"], result["error"]
+        assert result["metrics"].duplicate_pages == 1
+        with fitz.open(str(workdir / "out.pdf")) as out:
+            assert out.page_count == 3
+
+    async def test_filtered_single_page_leaves_the_input_dir_alone(self, workdir: Path):
+        input_dir = workdir / "input"
+        input_dir.mkdir()
+        source = self._document(input_dir / "doc.pdf", "only")
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000)],
+            cache=CacheConfig(enabled=False),
+            pdf_filters=[FilterConfig(name="grayscale")],
+        )
+        converter = Converter(config)
+
+        result = await converter.convert(source, workdir / "out.pdf")
+
+        assert result["success"], result["error"]
+        assert [p.name for p in input_dir.iterdir()] == ["doc.pdf"]
+
+
+class TestStreamingSplit:
+    async def test_fitz_writes_pages_on_demand(self, workdir: Path):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for text in ("first", "second", "third"):
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(source))
+        doc.close()
+        pages_dir = workdir / "pages"
+        pages_dir.mkdir()
+
+        pages = FitzBackend().split_pages(source, pages_dir)
+        first = await anext(pages)
+
+        assert list(pages_dir.iterdir()) == [first]
+        assert [first, *[path async for path in pages]] == sorted(pages_dir.iterdir())
+
+    async def test_yields_pages_while_the_split_runs(self, workdir: Path):
+        paths = [workdir / f"page_{i}.pdf" for i in range(3)]
+        release = asyncio.Event()
+
+        async def split() -> None:
+            paths[0].write_bytes(b"0")
+            paths[1].write_bytes(b"1")
+            await release.wait()
+            paths[2].write_bytes(b"2")
+
+        pages = FitzBackend()._follow_split(split(), paths)
+
+        assert await asyncio.wait_for(anext(pages), 5) == paths[0]
+        assert not release.is_set()
+        release.set()
+        assert [path async for path in pages] == paths[1:]
+
+    async def test_closing_early_stops_the_split(self, workdir: Path):
+        paths = [workdir / f"page_{i}.pdf" for i in range(3)]
+        stopped = asyncio.Event()
+
+        async def split() -> None:
+            paths[0].write_bytes(b"0")
+            paths[1].write_bytes(b"1")
+            try:
+                await asyncio.sleep(30)
+            finally:
+                stopped.set()
+
+        pages = FitzBackend()._follow_split(split(), paths)
+        await anext(pages)
+        await pages.aclose()
+
+        assert stopped.is_set()
+
+
+class TestPlanner:
+    def _config(self, **processing: bool) -> Configuration:
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000)],
+            cache=CacheConfig(enabled=False),
+        )
+        for key, value in processing.items():
+            setattr(config.processing, key, value)
+        Converter(config)  # registers the backends
+        return config
+
+    def test_fitz_covers_the_pipeline_in_one_step(self):
+        plan = plan_conversion(self._config())
+
+        assert [step.capability for step in plan.steps] == [
+            BackendCapability.DOCUMENT_ROUND_TRIP
+        ]
+        assert plan.cost == 1
+
+    def test_preserved_temp_files_keep_stages_apart(self):
+        plan = plan_conversion(self._config(preserve_temp_files=True))
+
+        assert not plan.uses(BackendCapability.DOCUMENT_ROUND_TRIP)
+        assert [s for step in plan.steps for s in step.stages] == [
+            "split",
+            "to_svg",
+            "to_pdf",
+            "merge",
+        ]
+
+    def test_split_free_plan_fuses_split_and_render(self):
+        plan = plan_conversion(
+            self._config(preserve_temp_files=True, split_pages=False)
+        )
+
+        assert plan.step_for("split").capability == (BackendCapability.PDF_SPLIT_TO_SVG)
+
+    def test_converter_shares_one_plan_with_filters(self):
+        config = self._config()
+        config.svg_filters = [FilterConfig(name="optimize")]
+        converter = Converter(config)
+
+        assert converter.pipeline.plan is converter.plan
+        assert [f.name for f in converter.plan.svg_filter_chain.filters] == ["optimize"]
+
+    def test_backend_limits_cap_its_stages(self):
+        config = self._config(preserve_temp_files=True)
+        config.backends[0].max_concurrency = 2
+        config.processing.parallel_pages = 8
+        config.processing.stage_concurrency = {"svg_filter": 3}
+
+        limits = plan_conversion(config).stage_limits
+
+        assert limits["pdf_to_svg"] == limits["svg_to_pdf"] == 2
+        assert limits["svg_filter"] == 3
+        assert limits["pdf_filter"] == 8
+
+    def test_disabled_backends_are_left_out(self):
+        self._config()
+        config = Configuration(
+            backends=[BackendConfig(name="fitz", priority=1000, enabled=False)],
+            cache=CacheConfig(enabled=False),
+        )
+
+        assert not backend_registry.get_available(
+            BackendCapability.DOCUMENT_ROUND_TRIP, config
+        )
+        with pytest.raises(DependencyError):
+            plan_conversion(config)
+
+    @pytest.mark.parametrize(("priority", "to_pdf"), [(85, "fitz"), (500, "rsvg")])
+    def test_priority_beats_cost(
+        self, monkeypatch: pytest.MonkeyPatch, priority: int, to_pdf: str
+    ):
+        self._config()
+        config = Configuration(
+            backends=[
+                BackendConfig(name="fitz", priority=90),
+                BackendConfig(name="rsvg", priority=priority),
+            ],
+            cache=CacheConfig(enabled=False),
+        )
+        monkeypatch.setattr(backend_registry.get("rsvg", config), "_available", True)
+
+        assert plan_conversion(config).backend_for("to_pdf").name == to_pdf
+
+    @pytest.mark.parametrize(
+        "backends",
+        [
+            [],
+            [
+                BackendConfig(name="poppler", priority=100),
+                BackendConfig(name="cairo", priority=80),
+            ],
+        ],
+    )
+    def test_default_priorities_keep_the_baseline_chain(
+        self, monkeypatch: pytest.MonkeyPatch, backends: list[BackendConfig]
+    ):
+        self._config()
+        config = Configuration(backends=backends, cache=CacheConfig(enabled=False))
+        for name in ("poppler", "cairo"):
+            monkeypatch.setattr(backend_registry.get(name, config), "_available", True)
+
+        plan = plan_conversion(config)
+
+        assert [(step.capability, step.backend.name) for step in plan.steps] == [
+            (BackendCapability.PDF_SPLIT, "poppler"),
+            (BackendCapability.PDF_TO_SVG, "poppler"),
+            (BackendCapability.SVG_TO_PDF, "cairo"),
+            (BackendCapability.PDF_MERGE, "poppler"),
+        ]
+
+        config.processing.plan_by_cost = True
+        assert plan_conversion(config).uses(BackendCapability.DOCUMENT_ROUND_TRIP)
+
+    def test_backend_instances_follow_their_configuration(self):
+        self._config()
+        fast = Configuration(cache=CacheConfig(enabled=False))
+        slow = Configuration(cache=CacheConfig(enabled=False))
+        slow.processing.timeout_seconds = 900
+        tuned = Configuration(
+            backends=[BackendConfig(name="fitz", parameters={"workers": 2})],
+            cache=CacheConfig(enabled=False),
+        )
+
+        assert backend_registry.get("fitz", fast).timeout_seconds == 300
+        assert backend_registry.get("fitz", slow).timeout_seconds == 900
+        assert backend_registry.get("fitz", tuned).worker_count == 2
+        assert backend_registry.get("fitz", tuned).identity != (
+            backend_registry.get("fitz", fast).identity
+        )
+        same = Configuration(cache=CacheConfig(enabled=False))
+        assert backend_registry.get("fitz", same) is backend_registry.get("fitz", fast)
+
+
+class TestStageExecutors:
+    async def test_stage_calls_run_on_its_own_bounded_threads(self):
+        stages = StageExecutors({"pdf_to_svg": 2, "svg_filter": 1})
+        running = peak = 0
+        lock = threading.Lock()
+
+        def work() -> str:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+            return threading.current_thread().name
+
+        async def call() -> str:
+            async with stages.stage("pdf_to_svg"):
+                return await run_async(work)
+
+        try:
+            names = await asyncio.gather(*(call() for _ in range(6)))
+        finally:
+            stages.close()
+
+        assert peak == 2
+        assert all(name.startswith("pdf2svg2pdf-pdf_to_svg") for name in names)
+
+    def test_loops_in_different_threads_get_their_own_limits(self):
+        stages = StageExecutors({"split": 1})
+        peaks: list[int] = []
+
+        async def calls() -> None:
+            running = peak = 0
+
+            async def call(delay: float) -> None:
+                nonlocal running, peak
+                # Arrive while the other loop is also taking slots
+                await asyncio.sleep(delay)
+                async with stages.stage("split"):
+                    running += 1
+                    peak = max(peak, running)
+                    await asyncio.sleep(0.02)
+                    running -= 1
+
+            await asyncio.gather(*(call(i * 0.005) for i in range(10)))
+            peaks.append(peak)
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(calls(),)) for _ in range(2)
+        ]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(10)
+        finally:
+            stages.close()
+
+        assert peaks == [1, 1]
+
+    async def test_stream_routes_only_while_producing(self):
+        stages = StageExecutors({"split": 1})
+
+        async def produce() -> AsyncGenerator[str, None]:
+            for _ in range(2):
+                yield await run_async(lambda: threading.current_thread().name)
+
+        try:
+            consumed = []
+            async for produced in stages.stream("split", produce()):
+                consumer = await run_async(lambda: threading.current_thread().name)
+                consumed.append((produced, consumer))
+        finally:
+            stages.close()
+
+        assert len(consumed) == 2
+        for produced, consumer in consumed:
+            assert produced.startswith("pdf2svg2pdf-split")
+            assert not consumer.startswith("pdf2svg2pdf-split")
+
+
+class TestMutoolDocumentRender:
+    async def test_page_is_ready_once_the_next_one_starts(self, workdir: Path):
+        source = workdir / "doc 1.pdf"
+        started = asyncio.Event()
+        release = asyncio.Event()
+        render = _DocumentRender(workdir, source)
+
+        async def draw() -> None:
+            render.read_progress(f"page {source} 1".encode())
+            started.set()
+            await release.wait()
+            # A header split across two reads
+            render.read_progress(f"\npage {source} ".encode())
+            render.read_progress(b"2")
+
+        render.start(draw())
+        await started.wait()
+
+        waiter = asyncio.create_task(render.wait_for_page(0))
+        await asyncio.sleep(0.1)
+        assert not waiter.done()
+
+        release.set()
+        assert await waiter == workdir / "page1.svg"
+        assert await render.wait_for_page(1) == workdir / "page2.svg"
+
+    async def test_render_errors_reach_waiting_pages(self, workdir: Path):
+        async def draw() -> None:
+            raise RuntimeError("mutool failed")
+
+        render = _DocumentRender(workdir, workdir / "doc.pdf")
+        render.start(draw())
+        with pytest.raises(RuntimeError):
+            await render.wait_for_page(0)
+
+    async def test_release_stops_the_render(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        source = _page_pdf(workdir / "doc.pdf", "text")
+        backend = MutoolBackend()
+        stopped = asyncio.Event()
+
+        async def draw(command: list[str], timeout=None, progress=None) -> None:
+            try:
+                await asyncio.Event().wait()
+            finally:
+                stopped.set()
+
+        monkeypatch.setattr(backend, "_run_command", draw)
+        svg_dir = workdir / "conversion" / "svg"
+        svg_dir.mkdir(parents=True)
+
+        page = asyncio.create_task(backend.pdf_to_svg(source, svg_dir / "0.svg", 0))
+        await asyncio.sleep(0.05)
+        page.cancel()
+        await backend.release(workdir / "conversion")
+
+        assert stopped.is_set()
+        assert not backend._renders
+
+    async def test_renders_only_on_a_cache_miss(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for text in ("first", "second"):
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(source))
+        doc.close()
+
+        mutool = MutoolBackend()
+        draws = 0
+
+        async def draw(command: list[str], timeout=None, progress=None) -> None:
+            nonlocal draws
+            draws += 1
+            pattern = command[command.index("-o") + 1]
+            for number in (1, 2):
+                Path(pattern % number).write_text(
+                    '<svg xmlns="http://www.w3.org/2000/svg" width="200" '
+                    f'height="200"><rect width="{number}0" height="10"/></svg>'
+                )
+                progress(f"page {command[-1]} {number}\n".encode())
+
+        monkeypatch.setattr(mutool, "_run_command", draw)
+
+        async def convert(compress: bool) -> None:
+            config = Configuration(
+                backends=[BackendConfig(name="fitz", priority=1000)],
+                cache=CacheConfig(enabled=True, directory=workdir / "cache"),
+            )
+            # Changes the document key but not the page keys
+            config.compress_output = compress
+            converter = Converter(config)
+            fitz_backend = converter.plan.backend_for("split")
+            steps = (
+                PlanStep(BackendCapability.PDF_SPLIT, fitz_backend, 1),
+                PlanStep(BackendCapability.PDF_TO_SVG, mutool, 1),
+                PlanStep(BackendCapability.SVG_TO_PDF, fitz_backend, 1),
+                PlanStep(BackendCapability.PDF_MERGE, fitz_backend, 1),
+            )
+            converter.plan = replace(converter.plan, steps=steps)
+            converter.pipeline._plan = converter.plan
+            try:
+                result = await converter.convert(source, workdir / "out.pdf")
+            finally:
+                converter.pipeline.close()
+            assert result["success"], result["error"]
+
+        await convert(compress=False)
+        await convert(compress=True)
+
+        assert draws == 1
+        assert not mutool._renders
+
+    async def test_repeated_page_is_served_raw(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        source = _page_pdf(workdir / "doc.pdf", "text")
+        backend = MutoolBackend()
+
+        async def draw(command: list[str], timeout=None, progress=None) -> None:
+            Path(command[command.index("-o") + 1] % 1).write_text("<svg>raw</svg>")
+
+        monkeypatch.setattr(backend, "_run_command", draw)
+        svg_dir = workdir / "svg"
+        svg_dir.mkdir()
+
+        first = await backend.pdf_to_svg(source, svg_dir / "first.svg", 0)
+        first.write_text("<svg>filtered</svg>")
+        again = await backend.pdf_to_svg(source, svg_dir / "again.svg", 0)
+
+        assert again.read_text() == "<svg>raw</svg>"
+
+    @pytest.mark.skipif(not shutil.which("mutool"), reason="mutool not installed")
+    async def test_renders_every_page_in_one_run(self, workdir: Path):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for text in ("first", "second"):
+            doc.new_page(width=200, height=200).insert_text((20, 100), text)
+        doc.save(str(source))
+        doc.close()
+
+        backend = MutoolBackend()
+        svg_dir = workdir / "svg"
+        svg_dir.mkdir()
+        pages = await asyncio.gather(
+            *(backend.pdf_to_svg(source, svg_dir / f"{i}.svg", i) for i in range(2))
+        )
+
+        assert all(page.read_text().lstrip().startswith("<") for page in pages)
+        assert len(backend._renders) == 1
+
+
+class TestFusedSvgToPdf:
+    async def test_pipeline_can_stop_after_svg(self, workdir: Path):
+        page_pdf = _page_pdf(workdir / "page.pdf", "text")
+        page = PageInfo(page_number=0, input_path=page_pdf, temp_pdf_path=page_pdf)
+        pipeline = ProcessingPipeline(Configuration(cache=CacheConfig(enabled=False)))
+
+        await pipeline.process_pages(
+            [page], workdir / "svg", workdir / "pdf", svg_only=True
+        )
+
+        assert page.svg_path is not None and page.svg_path.exists()
+        assert page.output_pdf_path is None
+        assert not list((workdir / "pdf").iterdir())
+
+    @pytest.mark.skipif(
+        not shutil.which("rsvg-convert"), reason="rsvg-convert not installed"
+    )
+    async def test_rsvg_renders_one_page_per_svg(self, workdir: Path):
+        svgs = []
+        for i in range(3):
+            svg = workdir / f"{i}.svg"
+            svg.write_text(
+                '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100">'
+                f'<text x="10" y="50">{i}</text></svg>'
+            )
+            svgs.append(svg)
+
+        output = await RsvgBackend().svgs_to_pdf(svgs, workdir / "out.pdf")
+
+        with fitz.open(str(output)) as doc:
+            assert doc.page_count == 3
+
+    async def test_rsvg_splits_long_argument_lists(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        svgs = [workdir / f"{i:03}.svg" for i in range(40)]
+        runs: list[list[str]] = []
+
+        async def draw(command: list[str], timeout=None, progress=None) -> None:
+            output, paths = command[4], command[5:]
+            runs.append(paths)
+            with fitz.open() as doc:
+                for path in paths:
+                    doc.new_page().insert_text((20, 100), Path(path).stem)
+                doc.save(output)
+
+        backend = RsvgBackend()
+        monkeypatch.setattr(backend, "_run_command", draw)
+        monkeypatch.setattr("pdf2svg2pdf.backends.rsvg._MAX_ARGUMENT_BYTES", 200)
+
+        output = await backend.svgs_to_pdf(svgs, workdir / "out.pdf")
+
+        assert len(runs) > 1
+        assert all(sum(len(p) + 1 for p in run) <= 200 for run in runs)
+        with fitz.open(str(output)) as doc:
+            texts = [page.get_text().strip() for page in doc]
+        assert texts == [svg.stem for svg in svgs]
+        assert sorted(p.name for p in workdir.iterdir()) == ["out.pdf"]
+
+
+@pytest.mark.skipif(not shutil.which("qpdf"), reason="qpdf not installed")
+class TestQpdf:
+    async def test_split_then_merge_keeps_page_order(self, workdir: Path):
+        source = workdir / "doc.pdf"
+        doc = fitz.open()
+        for i in range(12):
+            doc.new_page(width=200, height=200).insert_text((20, 100), str(i))
+        doc.save(str(source))
+        doc.close()
+
+        backend = QpdfBackend()
+        pages_dir = workdir / "pages"
+        pages_dir.mkdir()
+        pages = await backend.split_pdf(source, pages_dir)
+        merged = await backend.merge_pdfs(pages, workdir / "merged.pdf")
+
+        assert len(pages) == 12
+        with fitz.open(str(merged)) as out:
+            assert [page.get_text().strip() for page in out] == [
+                str(i) for i in range(12)
+            ]
+        assert not list(workdir.glob("*.args"))
+
+
+class _FakeShell:
+    started = 0
+
+    def __init__(self, timeout: float) -> None:
+        type(self).started += 1
+        self.pages = 0
+        self.closed = False
+        self.killed = threading.Event()
+
+    def run(self, actions: str, timeout: float) -> str:
+        self.pages += 1
+        if actions == "fail":
+            raise RuntimeError("wedged")
+        if actions == "hang" and self.killed.wait(timeout):
+            raise RuntimeError("killed")
+        return ""
+
+    def interrupt(self) -> None:
+        self.killed.set()
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class TestInkscapeSessions:
+    @patch("pdf2svg2pdf.backends.inkscape._ShellSession", _FakeShell)
+    def test_shells_are_reused_then_replaced(self):
+        _FakeShell.started = 0
+        pool = _SessionPool(size=1, pages_per_process=3)
+
+        for _ in range(3):
+            pool.run("page", 1)
+        assert _FakeShell.started == 1
+
+        pool.run("page", 1)
+        assert _FakeShell.started == 2
+
+    @patch("pdf2svg2pdf.backends.inkscape._ShellSession", _FakeShell)
+    def test_failed_shells_are_replaced(self):
+        _FakeShell.started = 0
+        pool = _SessionPool(size=1, pages_per_process=100)
+
+        pool.run("page", 1)
+        with pytest.raises(RuntimeError):
+            pool.run("fail", 1)
+        pool.run("page", 1)
+
+        assert _FakeShell.started == 2
+
+    @patch("pdf2svg2pdf.backends.inkscape._ShellSession", _FakeShell)
+    def test_waiting_for_a_busy_shell_times_out(self):
+        pool = _SessionPool(size=1, pages_per_process=100)
+        busy = threading.Thread(target=pool.run, args=("hang", 1))
+        busy.start()
+        time.sleep(0.05)
+
+        try:
+            with pytest.raises(TimeoutError):
+                pool.run("page", 0.1)
+        finally:
+            busy.join()
+
+    @patch("pdf2svg2pdf.backends.inkscape._ShellSession", _FakeShell)
+    def test_cancelled_calls_retire_their_shell(self):
+        _FakeShell.started = 0
+        pool = _SessionPool(size=1, pages_per_process=100)
+        cancelled = threading.Event()
+        errors: list[Exception] = []
+
+        def call() -> None:
+            try:
+                pool.run("hang", 30, cancelled)
+            except RuntimeError as e:
+                errors.append(e)
+
+        caller = threading.Thread(target=call)
+        caller.start()
+        time.sleep(0.05)
+        pool.cancel(cancelled)
+        caller.join(5)
+
+        assert not caller.is_alive()
+        assert [str(e) for e in errors] == ["killed"]
+        pool.run("page", 1)
+        assert _FakeShell.started == 2
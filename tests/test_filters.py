@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# this_file: tests/test_filters.py
+"""Tests for the SVG filters and the fused rewrite engine."""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Callable
+
+from pdf2svg2pdf.filters import (
+    RewriteEngine,
+    RewriteRule,
+    SVGColorReplaceFilter,
+    SVGFillUnifyFilter,
+    SVGTransparentWhiteFilter,
+)
+from pdf2svg2pdf.filters.base import ChainFilter
+from pdf2svg2pdf.filters.rewrite import _LiteralPass
+from pdf2svg2pdf.types import FilterConfig
+
+SVG = (
+    '<svg><path style="fill:rgb(100%,100%,100%);stroke:#000000;"/>'
+    '<rect fill="white"/><path style="fill:none;"/>'
+    '<path style="fill:#ff0000;"/></svg>'
+)
+
+
+def _color_replace(color_map: dict[str, str]) -> SVGColorReplaceFilter:
+    return SVGColorReplaceFilter(
+        FilterConfig(name="color_replace", parameters={"color_map": color_map})
+    )
+
+
+def _large_svg(paths: int) -> str:
+    colors = ["rgb(100%,100%,100%)", "rgb(0%,0%,0%)", "#ff0000", "#ffffff"]
+    return (
+        "<svg>"
+        + "".join(
+            f'<path style="fill:{colors[i % 4]};stroke:{colors[i % 3]};" '
+            f'd="M {i} 0 L {i + 1} 10 Z"/>\n'
+            for i in range(paths)
+        )
+        + "</svg>"
+    )
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+class TestRewriteEngine:
+    def test_matches_sequential_substitution(self):
+        rules = [
+            RewriteRule(r"fill:rgb\(100%,100%,100%\);", "fill:none;"),
+            RewriteRule.literal("fill:none;", "fill:#00ff00;"),
+            RewriteRule.literal("stroke:#000000;", "stroke:#111111;"),
+        ]
+        expected = SVG
+        for rule in rules:
+            expected = re.sub(rule.pattern, rule.replacement, expected)  # type: ignore[arg-type]
+
+        assert RewriteEngine(rules).sub(SVG) == expected
+
+    def test_callable_replacement_sees_its_own_groups(self):
+        engine = RewriteEngine(
+            [
+                RewriteRule.literal("<svg>", "<svg >"),
+                RewriteRule(r"fill:([^;]+);", lambda m: f"fill:[{m.group(1)}];"),
+            ]
+        )
+        assert "fill:[#ff0000];" in engine.sub(SVG)
+
+    def test_counts_matches(self):
+        _, count = RewriteEngine(SVGTransparentWhiteFilter().rewrite_rules()).subn(SVG)
+        assert count == 2
+
+    def test_long_literal_runs_fuse_into_one_scan(self):
+        color_map = {f"#{i:06x}": "#abcdef" for i in range(40)}
+        color_map["#ff0000"] = "#00ff00"
+        rules = _color_replace(color_map).rewrite_rules()
+        svg = _large_svg(100) + '<rect fill="#000001" stroke="#000027"/>'
+
+        expected = svg
+        for rule in rules:
+            expected = expected.replace(rule.text, rule.replacement_text)  # type: ignore[arg-type]
+
+        engine = RewriteEngine(rules)
+        assert engine.sub(svg) == expected
+        assert [type(step) for step in engine._passes] == [_LiteralPass]
+
+    def test_interacting_literals_are_not_fused(self):
+        # Sequentially, the first rule's output is rewritten again by a later one
+        color_map = {f"#{i:06x}": f"#{i + 1:06x}" for i in range(30)}
+        rules = _color_replace(color_map).rewrite_rules()
+        svg = '<rect fill="#000000"/><p style="fill:#000005;"/>'
+
+        expected = svg
+        for rule in rules:
+            expected = expected.replace(rule.text, rule.replacement_text)  # type: ignore[arg-type]
+
+        assert (
+            RewriteEngine(rules).sub(svg)
+            == expected
+            == ('<rect fill="#00001e"/><p style="fill:#00001e;"/>')
+        )
+
+
+class TestChainFilter:
+    def test_fused_chain_equals_filter_by_filter(self):
+        filters = [
+            SVGTransparentWhiteFilter(),
+            _color_replace({"none": "#00ff00", "#000000": "#111111"}),
+        ]
+        chain = ChainFilter(filters)
+
+        expected = SVG
+        for f in filters:
+            expected = f(expected)
+
+        assert chain(SVG) == expected
+        assert chain._engine is not None
+
+    def test_content_dependent_filter_disables_fusion(self):
+        chain = ChainFilter([SVGTransparentWhiteFilter(), SVGFillUnifyFilter()])
+        chain(SVG)
+        assert chain._engine is None
+
+
+class TestFillUnify:
+    def test_most_common_fill_is_chosen_once_per_document(self):
+        unify = SVGFillUnifyFilter()
+        first = unify("<svg><p style='fill:red;'/><p style='fill:red;'/></svg>")
+        second = unify("<svg><p style='fill:blue;'/><p style='fill:blue;'/></svg>")
+
+        assert "fill:red;" in first
+        assert "fill:red;" in second
+
+
+class TestRewriteSpeed:
+    """The engine against the passes it replaced, on a ~2 MB page."""
+
+    def test_transparent_white_beats_regex_passes(self):
+        svg = _large_svg(20_000)
+        white = SVGTransparentWhiteFilter()
+        patterns = [rule.pattern for rule in white.rewrite_rules()]
+        replacements = [rule.replacement_text for rule in white.rewrite_rules()]
+
+        def sequential() -> str:
+            result = svg
+            for pattern, replacement in zip(patterns, replacements, strict=True):
+                result = re.sub(pattern, replacement, result)
+            return result
+
+        assert white(svg) == sequential()
+        assert _best_time(lambda: white(svg)) < _best_time(sequential)
+
+    def test_large_color_map_beats_one_replace_per_color(self):
+        svg = _large_svg(20_000)
+        color_map = {f"#{i:06x}": "#abcdef" for i in range(64)}
+        color_map["#ff0000"] = "#00ff00"
+        replace = _color_replace(color_map)
+
+        def sequential() -> str:
+            result = svg
+            for old, new in color_map.items():
+                for template in ("fill:{};", 'fill="{}"', "stroke:{};", 'stroke="{}"'):
+                    result = result.replace(template.format(old), template.format(new))
+            return result
+
+        assert replace(svg) == sequential()
+        assert _best_time(lambda: replace(svg)) < _best_time(sequential) / 2
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+# this_file: tests/test_merge.py
+"""Tests for merging pages in page order as they finish."""
+
+from __future__ import annotations
+
+import tempfile
+from collections.abc import Iterator
+from pathlib import Path
+
+import fitz
+import pytest
+
+from pdf2svg2pdf.backends.fitz import FitzBackend
+from pdf2svg2pdf.core.exceptions import ProcessingError
+from pdf2svg2pdf.core.merge import OrderedMerge
+from pdf2svg2pdf.utils.async_utils import StageExecutors
+
+
+@pytest.fixture
+def workdir() -> Iterator[Path]:
+    with tempfile.TemporaryDirectory() as tmp:
+        yield Path(tmp)
+
+
+@pytest.fixture
+def stages() -> Iterator[StageExecutors]:
+    executors = StageExecutors({"merge": 1})
+    yield executors
+    executors.close()
+
+
+def _page_pdf(path: Path, text: str) -> Path:
+    doc = fitz.open()
+    doc.new_page(width=200, height=200).insert_text((20, 100), text)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def _texts(path: Path) -> list[str]:
+    with fitz.open(str(path)) as doc:
+        return [page.get_text().strip() for page in doc]
+
+
+class TestOrderedMerge:
+    async def test_buffers_pages_until_earlier_ones_are_in(
+        self, workdir: Path, stages: StageExecutors
+    ):
+        pages = [_page_pdf(workdir / f"{i}.pdf", str(i)) for i in range(3)]
+        output = workdir / "out.pdf"
+        merge = OrderedMerge(FitzBackend().open_merge(output), stages)
+
+        try:
+            await merge.add(2, pages[2])
+            await merge.add(1, pages[1])
+            assert merge.appended == 0
+            assert all(page.exists() for page in pages)
+
+            await merge.add(0, pages[0])
+            assert merge.appended == 3
+            assert not any(page.exists() for page in pages)
+
+            await merge.finish()
+        finally:
+            merge.close()
+
+        assert _texts(output) == ["0", "1", "2"]
+
+    async def test_shares_repeats_and_skips_failed_pages(
+        self, workdir: Path, stages: StageExecutors
+    ):
+        cover = _page_pdf(workdir / "cover.pdf", "cover").read_bytes()
+        body = _page_pdf(workdir / "body.pdf", "body").read_bytes()
+        output = workdir / "out.pdf"
+        merge = OrderedMerge(FitzBackend().open_merge(output), stages)
+
+        try:
+            await merge.add(0, cover, "cover")
+            await merge.add(1, None)
+            await merge.add(2, body, "body")
+            await merge.add(3, cover, "cover")
+            await merge.finish()
+        finally:
+            merge.close()
+
+        assert _texts(output) == ["cover", "body", "cover"]
+        with fitz.open(str(output)) as doc:
+            assert doc[0].xref == doc[2].xref
+
+    async def test_flushes_early_pages_for_readers(
+        self, workdir: Path, stages: StageExecutors
+    ):
+        output = workdir / "out.pdf"
+        merge = OrderedMerge(FitzBackend().open_merge(output), stages, flush_pages=2)
+
+        try:
+            for i in range(3):
+                await merge.add(i, _page_pdf(workdir / f"{i}.pdf", str(i)))
+                if i == 1:
+                    assert _texts(output) == ["0", "1"]
+            await merge.finish()
+        finally:
+            merge.close()
+
+        assert _texts(output) == ["0", "1", "2"]
+
+    async def test_missing_page_fails_the_merge(
+        self, workdir: Path, stages: StageExecutors
+    ):
+        merge = OrderedMerge(FitzBackend().open_merge(workdir / "out.pdf"), stages)
+
+        try:
+            await merge.add(1, _page_pdf(workdir / "1.pdf", "1"))
+            with pytest.raises(ProcessingError):
+                await merge.finish()
+        finally:
+            merge.close()
+
+        assert not (workdir / "out.pdf").exists()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# this_file: tests/test_security.py
+"""Tests for the SVG sanitizer."""
+
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from pdf2svg2pdf.core.exceptions import ValidationError
+from pdf2svg2pdf.utils.security import sanitize_svg_content
+
+INERT = '<svg><path style="fill:none;" d="M0 0L1 1"/><text>font on top</text></svg>'
+
+
+class TestSanitizeSVG:
+    def test_inert_svg_is_unchanged(self):
+        assert sanitize_svg_content(INERT) is INERT
+
+    def test_removes_active_content(self):
+        svg = (
+            "<svg><SCRIPT type='x'>alert(1)</script>"
+            '<rect onclick="steal()" width="1"/>'
+            "<object data='x'><p>fallback</p></OBJECT>"
+            '<embed src="x"><a href="JavaScript:go()">link</a></svg>'
+        )
+        assert sanitize_svg_content(svg) == (
+            '<svg><rect  width="1"/><a href="go()">link</a></svg>'
+        )
+
+    def test_unterminated_script_runs_to_the_end(self):
+        assert sanitize_svg_content("<svg><script>alert(1)<p/>") == "<svg>"
+
+    def test_self_closing_container_keeps_following_content(self):
+        assert sanitize_svg_content("<iframe src='x'/><p/>") == "<p/>"
+
+    def test_handlers_only_match_at_word_starts(self):
+        svg = '<svg version="1.1" xonclick="x"><rect onLoad=\'x\'/></svg>'
+        assert sanitize_svg_content(svg) == (
+            '<svg version="1.1" xonclick="x"><rect /></svg>'
+        )
+
+    def test_non_ascii_text_keeps_positions(self):
+        svg = "<svg><text>\u0130stanbul \u017fcript</text><SCR\u0130PT>x</script></svg>"
+        assert sanitize_svg_content(svg) == (
+            "<svg><text>\u0130stanbul \u017fcript</text></svg>"
+        )
+
+    @pytest.mark.parametrize(
+        "svg",
+        [
+            "<object" * 50_000,
+            '<p onload="' * 50_000,
+            "<script>" + "</scrip" * 50_000,
+        ],
+    )
+    def test_pathological_input_runs_in_linear_time(self, svg: str):
+        started = time.perf_counter()
+        sanitize_svg_content(svg)
+        assert time.perf_counter() - started < 1.0
+
+    def test_trusted_skips_sanitizing(self):
+        svg = "<svg><script>alert(1)</script></svg>"
+        assert sanitize_svg_content(svg, "trusted") == svg
+
+    def test_checked_rejects_active_content(self):
+        assert sanitize_svg_content(INERT, "checked") is INERT
+        with pytest.raises(ValidationError):
+            sanitize_svg_content("<svg><script>alert(1)</script></svg>", "checked")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# this_file: tests/test_tools.py
+"""Tests for external tool discovery."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from pdf2svg2pdf.utils import tools as tools_module
+from pdf2svg2pdf.utils.tools import ToolDiscovery, ToolInfo, probe_tool
+
+
+@pytest.fixture
+def workdir(monkeypatch: pytest.MonkeyPatch) -> Path:
+    with tempfile.TemporaryDirectory() as tmp:
+        bin_dir = Path(tmp) / "bin"
+        bin_dir.mkdir()
+        fake = bin_dir / "svgo"
+        fake.write_text("#!/bin/sh\necho 3.0.2\n")
+        fake.chmod(0o755)
+        monkeypatch.setenv("PATH", str(bin_dir))
+        yield Path(tmp)
+
+
+def _count_probes(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    probed: list[str] = []
+
+    def counting_probe(name: str) -> ToolInfo:
+        probed.append(name)
+        return probe_tool(name)
+
+    monkeypatch.setattr(tools_module, "probe_tool", counting_probe)
+    return probed
+
+
+class TestToolDiscovery:
+    def test_probe_records_version(self, workdir: Path):
+        info = probe_tool("svgo")
+        assert info.available
+        assert info.version == "3.0.2"
+        assert not probe_tool("gs").available
+
+    def test_results_persist_across_instances(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        state = workdir / "tools.json"
+        assert ToolDiscovery(state).available("svgo")
+
+        probed = _count_probes(monkeypatch)
+        later = ToolDiscovery(state)
+        assert later.version("svgo") == "3.0.2"
+        assert not later.available("pdftocairo")
+        assert probed == []
+
+    def test_changed_executable_is_probed_again(
+        self, workdir: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        state = workdir / "tools.json"
+        ToolDiscovery(state).all()
+
+        fake = workdir / "bin" / "svgo"
+        fake.write_text("#!/bin/sh\necho 4.0.0\n")
+        stat = fake.stat()
+        os.utime(fake, (stat.st_atime, stat.st_mtime + 10))
+
+        probed = _count_probes(monkeypatch)
+        assert ToolDiscovery(state).version("svgo") == "4.0.0"
+        assert probed == ["svgo"]
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# this_file: tests/test_workers.py
+"""Tests for the warm worker process pool and the process engine."""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import multiprocessing
+import os
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pdf2svg2pdf.config import Configuration
+from pdf2svg2pdf.core.engine import ProcessEngine, filter_svg_content
+from pdf2svg2pdf.filters import register_builtin_filters
+from pdf2svg2pdf.filters.base import svg_filter_registry
+from pdf2svg2pdf.types import FilterConfig
+from pdf2svg2pdf.utils.workers import WorkerPool
+
+
+@pytest.fixture
+def pool() -> WorkerPool:
+    workers = WorkerPool(2, name="test", processes=True)
+    yield workers
+    workers.close()
+
+
+class TestWorkerPool:
+    async def test_runs_in_worker(self, pool: WorkerPool):
+        assert await pool.run(math.sqrt, 9.0) == 3.0
+
+    async def test_propagates_errors(self, pool: WorkerPool):
+        with pytest.raises(ValueError):
+            await pool.run(int, "not a number")
+
+    async def test_timeout_restarts_the_pool(self, pool: WorkerPool):
+        with pytest.raises(TimeoutError):
+            await pool.run(time.sleep, 30, timeout=0.5)
+
+        assert await pool.run(math.sqrt, 4.0, timeout=30) == 2.0
+
+    async def test_tasks_lost_in_a_restart_are_resubmitted(self, pool: WorkerPool):
+        # Still sleeping when the other task's timeout kills the pool
+        slow = asyncio.create_task(pool.run(time.sleep, 1.0))
+        await asyncio.sleep(0)
+
+        with pytest.raises(TimeoutError):
+            await pool.run(time.sleep, 30, timeout=0.5)
+
+        assert await asyncio.wait_for(slow, 30) is None
+
+    async def test_runs_in_a_thread_when_processes_cannot_start(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        class Bootstrapping:
+            def Pool(self, *args):
+                raise RuntimeError("An attempt has been made to start a new process")
+
+        monkeypatch.setattr(
+            multiprocessing, "get_context", lambda method: Bootstrapping()
+        )
+        warmed: list[str] = []
+        workers = WorkerPool(
+            1,
+            lambda: warmed.append(threading.current_thread().name),
+            name="test",
+            processes=True,
+        )
+        try:
+            assert await workers.run(os.getpid) == os.getpid()
+            assert await workers.run(math.sqrt, 9.0) == 3.0
+            with pytest.raises(ValueError):
+                await workers.run(int, "not a number")
+        finally:
+            workers.close()
+
+        assert len(warmed) == 1
+
+
+class TestThreadWorkers:
+    async def test_threads_are_the_default(self):
+        workers = WorkerPool(2, name="test")
+        try:
+            assert await workers.run(os.getpid) == os.getpid()
+            name = await workers.run(lambda: threading.current_thread().name)
+        finally:
+            workers.close()
+
+        assert name.startswith("pdf2svg2pdf-test")
+
+    async def test_unsafe_tasks_run_one_at_a_time(self):
+        workers = WorkerPool(4, name="test", threadsafe=False)
+        running = peak = 0
+        lock = threading.Lock()
+
+        def work() -> None:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+
+        try:
+            await asyncio.gather(*(workers.run(work) for _ in range(4)))
+        finally:
+            workers.close()
+
+        assert peak == 1
+
+
+_SCRIPT = """
+import asyncio
+import os
+
+from pdf2svg2pdf.utils.workers import WorkerPool
+
+
+def main():
+    pool = WorkerPool(1, name="script", processes=True)
+    in_child = asyncio.run(pool.run(os.getpid)) != os.getpid()
+    pool.close()
+    print("child" if in_child else "thread")
+
+"""
+
+
+class TestMainGuard:
+    @pytest.mark.parametrize(
+        ("entry", "expected"),
+        [
+            ("main()", "thread"),
+            ('if __name__ == "__main__":\n    main()', "child"),
+        ],
+    )
+    def test_processes_start_only_from_a_guarded_script(
+        self, tmp_path: Path, entry: str, expected: str
+    ):
+        script = tmp_path / "script.py"
+        script.write_text(textwrap.dedent(_SCRIPT) + entry + "\n")
+
+        result = subprocess.run(
+            [sys.executable, str(script)],
+            capture_output=True,
+            text=True,
+            timeout=60,
+        )
+
+        assert result.returncode == 0, result.stderr
+        # An unguarded script must not be run again by a child
+        lines = result.stdout.splitlines()
+        assert [line for line in lines if line in ("child", "thread")] == [expected]
+
+
+class TestProcessEngine:
+    async def test_filters_chunks_of_pages_in_workers(self):
+        config = Configuration(svg_filters=[FilterConfig(name="transparent_white")])
+        config.processing.engine = "processes"
+        config.processing.worker_processes = 2
+        config.processing.chunk_size = 2
+        engine = ProcessEngine(config)
+
+        svgs = [
+            '<svg xmlns="http://www.w3.org/2000/svg">'
+            f'<rect width="{i}" height="10" fill="#ffffff"/></svg>'
+            for i in range(1, 6)
+        ]
+        try:
+            filtered = await asyncio.gather(*(engine.filter_svg(s) for s in svgs))
+        finally:
+            engine.close()
+
+        register_builtin_filters()
+        chain = svg_filter_registry.create_chain(config.svg_filters)
+        assert filtered == [
+            filter_svg_content(svg, chain, True, "untrusted") for svg in svgs
+        ]
+        assert filtered != svgs